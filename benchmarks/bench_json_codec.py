@@ -0,0 +1,90 @@
+"""Compare the stdlib and orjson backends of ``workflow.json_codec`` on realistic documents.
+
+Run with ``uv run python benchmarks/bench_json_codec.py`` (install the ``fast`` extra to
+include orjson). Documents mirror what the node handles: a large UI-format workflow, a
+/run payload carrying base64 images, and a job output with several generated images.
+"""
+
+import base64
+import functools
+import os
+import random
+import time
+from collections.abc import Callable
+from typing import Any
+
+from comfy_gpu_offload.workflow import json_codec
+
+REPEATS = 5
+
+
+def make_workflow(node_count: int = 400) -> dict[str, Any]:
+    # Deterministic fixture data, not security-sensitive.
+    rng = random.Random(0)  # nosec B311
+    nodes = []
+    links = []
+    for index in range(node_count):
+        nodes.append(
+            {
+                "id": index,
+                "type": rng.choice(["KSampler", "CLIPTextEncode", "VAEDecode", "LoraLoader"]),
+                "pos": [rng.uniform(0, 4000), rng.uniform(0, 4000)],
+                "size": [315, 262],
+                "flags": {},
+                "order": index,
+                "mode": 0,
+                "inputs": [{"name": "model", "type": "MODEL", "link": index}],
+                "outputs": [{"name": "LATENT", "type": "LATENT", "links": [index + 1]}],
+                "properties": {"Node name for S&R": "KSampler"},
+                "widgets_values": [rng.randrange(2**32), "fixed", 20, 7.5, "euler", "normal", 1],
+            }
+        )
+        links.append([index + 1, index, 0, index + 1, 0, "LATENT"])
+    return {"last_node_id": node_count, "nodes": nodes, "links": links, "version": 0.4}
+
+
+def make_images(count: int, raw_bytes: int) -> list[dict[str, str]]:
+    return [
+        {"name": f"image_{index}.png", "image": base64.b64encode(os.urandom(raw_bytes)).decode()}
+        for index in range(count)
+    ]
+
+
+def best_of(func: Callable[[], object]) -> float:
+    timings = []
+    for _ in range(REPEATS):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def run_backend(label: str, documents: dict[str, Any]) -> None:
+    for name, document in documents.items():
+        encoded = json_codec.dumps(document)
+        dump_time = best_of(functools.partial(json_codec.dumps, document))
+        load_time = best_of(functools.partial(json_codec.loads, encoded))
+        print(
+            f"{label:<8} {name:<18} {len(encoded) / 1e6:7.2f} MB  "
+            f"dumps {dump_time * 1e3:8.2f} ms  loads {load_time * 1e3:8.2f} ms"
+        )
+
+
+def main() -> None:
+    workflow = make_workflow()
+    documents = {
+        "workflow": workflow,
+        "run_payload": {"workflow": workflow, "images": make_images(3, 2_000_000)},
+        "job_output": {"images": make_images(4, 1_500_000), "status": "COMPLETED"},
+    }
+    backends = [json_codec.backend_name()]
+    if backends[0] != "json":
+        backends.append("json")
+    for backend in backends:
+        if backend == "json":
+            json_codec._orjson = None  # force the stdlib fallback for comparison
+        run_backend(backend, documents)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,19 +1,44 @@
 """HTTP clients and API integrations (e.g., RunPod)."""
 
+from .async_runpod_client import AsyncRunpodClient
+from .coalescing import SubmissionCoalescer, get_shared_coalescer
+from .poll_schedule import AdaptivePollSchedule, FixedPollSchedule, PollSchedule
+from .poller import JobPoller, get_shared_poller
+from .registry import ClientRegistry, get_shared_client, get_shared_registry
+from .retry import CircuitBreaker, RetryPolicy
 from .runpod_client import (
+    JobStatus,
     RunpodApiError,
     RunpodCancelledError,
+    RunpodCircuitOpenError,
     RunpodClient,
     RunpodJobError,
     RunpodStatus,
     RunpodTimeoutError,
 )
+from .sweep import build_sweep_payloads
 
 __all__ = [
+    "AdaptivePollSchedule",
+    "AsyncRunpodClient",
+    "CircuitBreaker",
+    "ClientRegistry",
+    "FixedPollSchedule",
+    "JobPoller",
+    "JobStatus",
+    "PollSchedule",
+    "RetryPolicy",
     "RunpodApiError",
     "RunpodCancelledError",
+    "RunpodCircuitOpenError",
     "RunpodClient",
     "RunpodJobError",
     "RunpodStatus",
     "RunpodTimeoutError",
+    "SubmissionCoalescer",
+    "get_shared_coalescer",
+    "get_shared_client",
+    "get_shared_poller",
+    "get_shared_registry",
+    "build_sweep_payloads",
 ]
@@ -0,0 +1,258 @@
+"""Asyncio RunPod API client sharing one connection pool across in-flight jobs."""
+
+import asyncio
+import time
+from collections.abc import Callable, Mapping
+from types import TracebackType
+from typing import Any, Self
+
+import aiohttp
+
+from comfy_gpu_offload.api.poll_schedule import PollSchedule
+from comfy_gpu_offload.api.retry import (
+    RETRYABLE_IDEMPOTENT_STATUSES,
+    RETRYABLE_SUBMIT_STATUSES,
+    CircuitBreakerRegistry,
+    RetryPolicy,
+    endpoint_name,
+    parse_retry_after,
+)
+from comfy_gpu_offload.api.runpod_client import (
+    JobStatus,
+    RunpodApiError,
+    RunpodCancelledError,
+    RunpodCircuitOpenError,
+    RunpodTimeoutError,
+    _parse_cancel_status,
+    _parse_job_id,
+    _parse_job_status,
+    _request_body,
+    _runsync_wait_millis,
+    resolve_poll_schedule,
+)
+from comfy_gpu_offload.config import RunpodConfig
+from comfy_gpu_offload.workflow import json_codec
+from comfy_gpu_offload.workflow.loader import EncodedPayload
+
+DEFAULT_MAX_CONNECTIONS = 100
+
+
+class AsyncRunpodClient:
+    """Async counterpart of ``RunpodClient``; many jobs can be polled from one event loop.
+
+    The underlying ``aiohttp.ClientSession`` is created lazily inside the running loop and
+    reuses keep-alive connections for every request. Use ``async with`` or ``close()`` to
+    release the pool; sessions passed in by the caller are left open.
+    """
+
+    def __init__(
+        self,
+        config: RunpodConfig,
+        session: aiohttp.ClientSession | None = None,
+        *,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        retry_policy: RetryPolicy | None = None,
+        breakers: CircuitBreakerRegistry | None = None,
+    ) -> None:
+        self._config = config
+        self._retry = retry_policy or RetryPolicy.from_config(config)
+        self._breakers = breakers or CircuitBreakerRegistry.from_config(config)
+        self._session = session
+        self._owns_session = session is None
+        self._max_connections = max_connections
+        base = config.base_url.rstrip("/")
+        self._endpoint_base = f"{base}/v2/{config.endpoint_id}"
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the connection pool if this client created it."""
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def submit_job(self, input_payload: Mapping[str, Any] | EncodedPayload) -> str:
+        """Submit an async job; returns job ID."""
+        data = await self._request_json("POST", "/run", **_request_body(input_payload))
+        return _parse_job_id(data)
+
+    async def submit_job_sync(
+        self,
+        input_payload: Mapping[str, Any] | EncodedPayload,
+        *,
+        wait_seconds: float | None = None,
+    ) -> JobStatus:
+        """Submit via ``/runsync``; the returned status may still be non-terminal."""
+        wait = wait_seconds or self._config.runsync_wait_seconds
+        data = await self._request_json(
+            "POST",
+            "/runsync",
+            **_request_body(input_payload),
+            params={"wait": _runsync_wait_millis(wait)},
+            timeout=wait + self._config.request_timeout_seconds,
+        )
+        return _parse_job_status(data, _parse_job_id(data))
+
+    async def run_sync(
+        self,
+        input_payload: Mapping[str, Any] | EncodedPayload,
+        *,
+        wait_seconds: float | None = None,
+        timeout_seconds: float | None = None,
+        on_progress: Callable[[JobStatus], None] | None = None,
+        should_continue: Callable[[], bool] | None = None,
+        schedule: PollSchedule | None = None,
+    ) -> JobStatus:
+        """Run a job through ``/runsync``; fall back to ``poll_job`` if the wait budget runs out."""
+        timeout = timeout_seconds or self._config.max_poll_duration_seconds
+        started = time.monotonic()
+        status = await self.submit_job_sync(input_payload, wait_seconds=wait_seconds)
+        if on_progress:
+            on_progress(status)
+        if status.is_terminal:
+            return status.ensure_completed()
+        remaining = timeout - (time.monotonic() - started)
+        if remaining <= 0:
+            raise RunpodTimeoutError(f"Polling timeout exceeded for job {status.job_id}")
+        return await self.poll_job(
+            status.job_id,
+            timeout_seconds=remaining,
+            on_progress=on_progress,
+            should_continue=should_continue,
+            schedule=schedule,
+        )
+
+    async def get_job_status(self, job_id: str) -> JobStatus:
+        """Fetch job status once."""
+        data = await self._request_json("GET", f"/status/{job_id}", idempotent=True)
+        return _parse_job_status(data, job_id)
+
+    async def cancel_job(self, job_id: str) -> JobStatus:
+        data = await self._request_json("POST", f"/cancel/{job_id}", idempotent=True)
+        return _parse_cancel_status(data, job_id)
+
+    async def poll_job(
+        self,
+        job_id: str,
+        *,
+        poll_interval_seconds: float | None = None,
+        timeout_seconds: float | None = None,
+        on_progress: Callable[[JobStatus], None] | None = None,
+        should_continue: Callable[[], bool] | None = None,
+        schedule: PollSchedule | None = None,
+    ) -> JobStatus:
+        """Poll until a job reaches a terminal status or times out, without blocking the loop."""
+        schedule = schedule or resolve_poll_schedule(self._config, poll_interval_seconds)
+        timeout = timeout_seconds or self._config.max_poll_duration_seconds
+        started = time.monotonic()
+        deadline = started + timeout
+        attempt = 0
+
+        while True:
+            status = await self.get_job_status(job_id)
+            attempt += 1
+            if on_progress:
+                on_progress(status)
+
+            if status.is_terminal:
+                return status.ensure_completed()
+
+            now = time.monotonic()
+            if now >= deadline:
+                raise RunpodTimeoutError(f"Polling timeout exceeded for job {job_id}")
+
+            if should_continue is not None and not should_continue():
+                raise RunpodCancelledError(f"Polling cancelled by caller for job {job_id}")
+
+            remaining = deadline - now
+            interval = schedule.next_interval(
+                status.status, attempt=attempt, elapsed_seconds=now - started
+            )
+            await asyncio.sleep(min(interval, max(0.0, remaining)))
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None:
+            connector = aiohttp.TCPConnector(limit=self._max_connections)
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    async def _request_json(
+        self, method: str, path: str, *, idempotent: bool = False, **kwargs: Any
+    ) -> dict[str, Any]:
+        """Send one API call with the same retry/circuit rules as ``RunpodClient``."""
+        url = self._endpoint_base + path
+        headers = kwargs.pop("headers", {})
+        # Avoid logging secrets; do not expose api_key.
+        headers.setdefault("Authorization", f"Bearer {self._config.api_key}")
+        headers.setdefault("Content-Type", "application/json")
+        timeout = kwargs.pop("timeout", self._config.request_timeout_seconds)
+        endpoint = endpoint_name(path)
+        breaker = self._breakers.for_endpoint(endpoint)
+        retryable = RETRYABLE_IDEMPOTENT_STATUSES if idempotent else RETRYABLE_SUBMIT_STATUSES
+        retries = 0
+
+        while True:
+            if not breaker.allow():
+                raise RunpodCircuitOpenError(
+                    f"RunPod '{endpoint}' endpoint is failing repeatedly; not sending request"
+                )
+            try:
+                async with self._get_session().request(
+                    method,
+                    url,
+                    headers=headers,
+                    timeout=aiohttp.ClientTimeout(total=timeout),
+                    ssl=self._config.verify_tls,
+                    **kwargs,
+                ) as response:
+                    status_code = response.status
+                    retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                    body = await response.read()
+            except (aiohttp.ClientError, TimeoutError) as exc:
+                breaker.record_failure()
+                if idempotent and retries < self._retry.max_retries:
+                    retries += 1
+                    await asyncio.sleep(self._retry.delay(retries))
+                    continue
+                raise RunpodApiError(f"RunPod request failed: {exc!s}") from exc
+            except BaseException:
+                # Cancelled (or interrupted) without an outcome; do not leave a half-open probe
+                # claimed, or the endpoint would fail fast forever.
+                breaker.release_probe()
+                raise
+
+            if status_code == 429 or status_code >= 500:
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+            if status_code in retryable and retries < self._retry.max_retries:
+                retries += 1
+                await asyncio.sleep(self._retry.delay(retries, retry_after))
+                continue
+
+            if status_code >= 400:
+                raise RunpodApiError(
+                    f"RunPod API returned {status_code} for {method} {url}: "
+                    f"{body[:500].decode('utf-8', errors='replace')}",
+                    status_code=status_code,
+                )
+            return self._parse_json(body, url)
+
+    @staticmethod
+    def _parse_json(body: bytes, url: str) -> dict[str, Any]:
+        try:
+            data = json_codec.loads(body)
+        except ValueError as exc:
+            raise RunpodApiError(f"Invalid JSON in response from {url}") from exc
+        if not isinstance(data, dict):
+            raise RunpodApiError(f"Unexpected JSON type from {url}: expected object")
+        return data
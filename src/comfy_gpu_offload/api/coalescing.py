@@ -0,0 +1,80 @@
+"""Single-flight coalescing so identical in-flight payloads share one RunPod job."""
+
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future
+
+from comfy_gpu_offload.api.runpod_client import JobStatus
+
+
+class SubmissionCoalescer:
+    """Attach duplicate submissions to the job already running for the same payload key.
+
+    The first caller for a key (the leader) submits; concurrent callers with the same key
+    reuse its job ID and only wait. Waiting goes through the caller's ``wait`` callable so
+    each waiter keeps its own timeout and cancellation; pair it with ``JobPoller.wait`` and
+    the status checks are shared too. The key is released once the leader's job settles,
+    so later identical submissions start a fresh job (or hit the result cache).
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._flights: dict[str, Future[JobStatus]] = {}
+
+    def run(
+        self,
+        key: str,
+        submit: Callable[[], JobStatus],
+        wait: Callable[[str], JobStatus],
+    ) -> JobStatus:
+        """Submit (or join) the job for ``key`` and return its completed status.
+
+        ``submit`` returns the status right after submission: ``IN_QUEUE`` for ``/run`` or
+        whatever ``/runsync`` reported. ``wait`` polls a job ID to a completed status.
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if flight is None:
+                flight = Future()
+                self._flights[key] = flight
+
+        if not leader:
+            return self._settle(flight.result(), wait)
+
+        try:
+            try:
+                submitted = submit()
+            except BaseException as exc:
+                flight.set_exception(exc)
+                raise
+            flight.set_result(submitted)
+            return self._settle(submitted, wait)
+        finally:
+            with self._lock:
+                if self._flights.get(key) is flight:
+                    del self._flights[key]
+
+    @property
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._flights)
+
+    @staticmethod
+    def _settle(status: JobStatus, wait: Callable[[str], JobStatus]) -> JobStatus:
+        if status.is_terminal:
+            return status.ensure_completed()
+        return wait(status.job_id)
+
+
+_shared_coalescer: SubmissionCoalescer | None = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_coalescer() -> SubmissionCoalescer:
+    """Return the process-wide coalescer used by the nodes."""
+    global _shared_coalescer
+    with _shared_lock:
+        if _shared_coalescer is None:
+            _shared_coalescer = SubmissionCoalescer()
+        return _shared_coalescer
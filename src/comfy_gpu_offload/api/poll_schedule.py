@@ -0,0 +1,85 @@
+"""Poll-interval strategies for waiting on RunPod jobs."""
+
+import random
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Protocol
+
+from comfy_gpu_offload.config import RunpodConfig
+
+DEFAULT_INITIAL_INTERVAL_SECONDS = 0.5
+DEFAULT_MAX_QUEUE_INTERVAL_SECONDS = 15.0
+DEFAULT_BACKOFF_MULTIPLIER = 2.0
+DEFAULT_JITTER_RATIO = 0.2
+
+# Mirrors RunpodStatus.IN_QUEUE; runpod_client imports this module, so no import back.
+_IN_QUEUE = "IN_QUEUE"
+
+
+class PollSchedule(Protocol):
+    def next_interval(self, status: str, *, attempt: int, elapsed_seconds: float) -> float:
+        """Seconds to wait after the ``attempt``-th status check (1-based) returned ``status``."""
+        ...
+
+
+@dataclass(frozen=True, slots=True)
+class FixedPollSchedule:
+    """Poll at a constant interval regardless of job state."""
+
+    interval_seconds: float
+
+    def next_interval(self, status: str, *, attempt: int, elapsed_seconds: float) -> float:
+        return self.interval_seconds
+
+
+@dataclass(frozen=True, slots=True)
+class AdaptivePollSchedule:
+    """Poll quickly after submit, back off while queued, tighten near expected completion.
+
+    - ``IN_QUEUE``: exponential backoff from ``initial_interval_seconds`` up to
+      ``max_queue_interval_seconds`` so cold starts do not burn status calls.
+    - ``IN_PROGRESS`` without an estimate: the same ramp, capped at ``max_interval_seconds``.
+    - ``IN_PROGRESS`` with ``expected_duration_seconds``: sleep toward the expected finish
+      (capped at ``max_interval_seconds``) and drop back to the initial interval once it is due.
+
+    Jitter spreads checks from concurrent jobs so they do not hit the API in lockstep.
+    """
+
+    initial_interval_seconds: float = DEFAULT_INITIAL_INTERVAL_SECONDS
+    max_interval_seconds: float = 3.0
+    max_queue_interval_seconds: float = DEFAULT_MAX_QUEUE_INTERVAL_SECONDS
+    backoff_multiplier: float = DEFAULT_BACKOFF_MULTIPLIER
+    jitter_ratio: float = DEFAULT_JITTER_RATIO
+    expected_duration_seconds: float | None = None
+    # Jitter is not security-sensitive; a seeded source keeps tests deterministic.
+    random_source: Callable[[], float] = field(default=random.random, compare=False)  # nosec B311
+
+    @classmethod
+    def from_config(
+        cls, config: RunpodConfig, *, expected_duration_seconds: float | None = None
+    ) -> "AdaptivePollSchedule":
+        """Use the configured poll interval as the steady-state ceiling."""
+        steady = config.poll_interval_seconds
+        return cls(
+            initial_interval_seconds=min(DEFAULT_INITIAL_INTERVAL_SECONDS, steady),
+            max_interval_seconds=steady,
+            max_queue_interval_seconds=max(DEFAULT_MAX_QUEUE_INTERVAL_SECONDS, steady),
+            expected_duration_seconds=expected_duration_seconds,
+        )
+
+    def next_interval(self, status: str, *, attempt: int, elapsed_seconds: float) -> float:
+        ramp = self.initial_interval_seconds * self.backoff_multiplier ** max(0, attempt - 1)
+        if status == _IN_QUEUE:
+            return self._jitter(min(ramp, self.max_queue_interval_seconds))
+
+        if self.expected_duration_seconds is None:
+            return self._jitter(min(ramp, self.max_interval_seconds))
+
+        remaining = self.expected_duration_seconds - elapsed_seconds
+        if remaining <= self.initial_interval_seconds:
+            return self._jitter(self.initial_interval_seconds)
+        return self._jitter(min(remaining, self.max_interval_seconds))
+
+    def _jitter(self, interval: float) -> float:
+        spread = interval * self.jitter_ratio
+        return max(0.0, interval - spread + 2 * spread * self.random_source())
@@ -0,0 +1,259 @@
+"""Shared background poller that multiplexes status checks for many RunPod jobs."""
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, InvalidStateError, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, field
+from typing import Protocol
+
+from comfy_gpu_offload.api.poll_schedule import FixedPollSchedule, PollSchedule
+from comfy_gpu_offload.api.runpod_client import (
+    JobStatus,
+    RunpodCancelledError,
+    RunpodTimeoutError,
+)
+
+DEFAULT_MAX_CONCURRENT_CHECKS = 8
+logger = logging.getLogger(__name__)
+_WAIT_SLICE_SECONDS = 0.25
+
+
+class JobStatusSource(Protocol):
+    def get_job_status(self, job_id: str) -> JobStatus: ...
+
+
+@dataclass(slots=True)
+class _Waiter:
+    future: Future[JobStatus]
+    deadline: float
+    on_progress: Callable[[JobStatus], None] | None
+
+
+@dataclass(slots=True)
+class _TrackedJob:
+    source: JobStatusSource
+    job_id: str
+    schedule: PollSchedule
+    started: float
+    next_due: float
+    attempt: int = 0
+    waiters: list[_Waiter] = field(default_factory=list)
+    in_flight: bool = False
+
+
+class JobPoller:
+    """Track many job IDs from a single scheduling thread.
+
+    Waiters on the same ``(source, job_id)`` share one status check per interval, spaced by
+    the first waiter's ``PollSchedule``. Each waiter keeps its own deadline and resolves its
+    own future. Status requests are dispatched to a
+    small worker pool so one slow response does not delay every other job.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_concurrent_checks: int = DEFAULT_MAX_CONCURRENT_CHECKS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._clock = clock
+        self._cond = threading.Condition()
+        self._jobs: dict[tuple[int, str], _TrackedJob] = {}
+        self._thread: threading.Thread | None = None
+        # Worker threads are only spawned on first submit.
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrent_checks, thread_name_prefix="runpod-status"
+        )
+        self._closed = False
+
+    @property
+    def pending_jobs(self) -> int:
+        with self._cond:
+            return len(self._jobs)
+
+    def track(
+        self,
+        source: JobStatusSource,
+        job_id: str,
+        *,
+        timeout_seconds: float,
+        schedule: PollSchedule | None = None,
+        poll_interval_seconds: float | None = None,
+        on_progress: Callable[[JobStatus], None] | None = None,
+    ) -> Future[JobStatus]:
+        """Start tracking a job; the future resolves with its COMPLETED status or an error.
+
+        Pass either a ``schedule`` or a fixed ``poll_interval_seconds``.
+        """
+        if schedule is None:
+            if poll_interval_seconds is None:
+                raise ValueError("track() requires a schedule or poll_interval_seconds")
+            schedule = FixedPollSchedule(poll_interval_seconds)
+        future: Future[JobStatus] = Future()
+        with self._cond:
+            if self._closed:
+                raise RunpodCancelledError("Job poller has been closed")
+            now = self._clock()
+            key = (id(source), job_id)
+            job = self._jobs.get(key)
+            if job is None:
+                job = _TrackedJob(
+                    source=source, job_id=job_id, schedule=schedule, started=now, next_due=now
+                )
+                self._jobs[key] = job
+            job.waiters.append(_Waiter(future, now + timeout_seconds, on_progress))
+            self._ensure_started()
+            self._cond.notify_all()
+        return future
+
+    def wait(
+        self,
+        source: JobStatusSource,
+        job_id: str,
+        *,
+        timeout_seconds: float,
+        schedule: PollSchedule | None = None,
+        poll_interval_seconds: float | None = None,
+        on_progress: Callable[[JobStatus], None] | None = None,
+        should_continue: Callable[[], bool] | None = None,
+    ) -> JobStatus:
+        """Block until the tracked job finishes; drop-in replacement for ``poll_job``."""
+        future = self.track(
+            source,
+            job_id,
+            timeout_seconds=timeout_seconds,
+            schedule=schedule,
+            poll_interval_seconds=poll_interval_seconds,
+            on_progress=on_progress,
+        )
+        while True:
+            try:
+                return future.result(timeout=_WAIT_SLICE_SECONDS)
+            except FutureTimeoutError:
+                if should_continue is not None and not should_continue():
+                    future.cancel()
+                    raise RunpodCancelledError(
+                        f"Polling cancelled by caller for job {job_id}"
+                    ) from None
+
+    def close(self) -> None:
+        """Stop the scheduling loop and cancel every outstanding waiter."""
+        with self._cond:
+            self._closed = True
+            jobs = list(self._jobs.values())
+            self._jobs.clear()
+            self._cond.notify_all()
+        for job in jobs:
+            _fail_waiters(job.waiters, RunpodCancelledError("Job poller has been closed"))
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="runpod-poller", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        with self._cond:
+            while not self._closed:
+                now = self._clock()
+                wake_at: float | None = None
+                for key, job in list(self._jobs.items()):
+                    expired = _expire_waiters(job, now)
+                    if expired:
+                        _fail_waiters(
+                            expired,
+                            RunpodTimeoutError(f"Polling timeout exceeded for job {job.job_id}"),
+                        )
+                    if not job.waiters:
+                        del self._jobs[key]
+                        continue
+                    if not job.in_flight and job.next_due <= now:
+                        job.in_flight = True
+                        self._executor.submit(self._check, key, job)
+                    candidates = [waiter.deadline for waiter in job.waiters]
+                    if not job.in_flight:
+                        candidates.append(job.next_due)
+                    earliest = min(candidates)
+                    wake_at = earliest if wake_at is None else min(wake_at, earliest)
+                timeout = None if wake_at is None else max(0.0, wake_at - now)
+                self._cond.wait(timeout=timeout)
+
+    def _check(self, key: tuple[int, str], job: _TrackedJob) -> None:
+        try:
+            status = job.source.get_job_status(job.job_id)
+        except Exception as exc:
+            with self._cond:
+                waiters = self._finish(key, job)
+            _fail_waiters(waiters, exc)
+            return
+
+        with self._cond:
+            listeners = [waiter.on_progress for waiter in job.waiters if waiter.on_progress]
+        for listener in listeners:
+            try:
+                listener(status)
+            except Exception:
+                # A faulty progress callback must not stall polling for every waiter.
+                logger.exception("Progress listener failed for job %s", job.job_id)
+
+        if not status.is_terminal:
+            with self._cond:
+                job.in_flight = False
+                job.attempt += 1
+                now = self._clock()
+                job.next_due = now + job.schedule.next_interval(
+                    status.status, attempt=job.attempt, elapsed_seconds=now - job.started
+                )
+                self._cond.notify_all()
+            return
+
+        with self._cond:
+            waiters = self._finish(key, job)
+        try:
+            result = status.ensure_completed()
+        except Exception as exc:
+            _fail_waiters(waiters, exc)
+            return
+        for waiter in waiters:
+            try:
+                waiter.future.set_result(result)
+            except InvalidStateError:
+                continue  # Waiter cancelled or timed out concurrently.
+
+    def _finish(self, key: tuple[int, str], job: _TrackedJob) -> list[_Waiter]:
+        if self._jobs.get(key) is job:
+            del self._jobs[key]
+        self._cond.notify_all()
+        return job.waiters
+
+
+def _expire_waiters(job: _TrackedJob, now: float) -> list[_Waiter]:
+    expired = [w for w in job.waiters if w.future.done() or w.deadline <= now]
+    if expired:
+        job.waiters = [w for w in job.waiters if w not in expired]
+    return [w for w in expired if not w.future.done()]
+
+
+def _fail_waiters(waiters: list[_Waiter], exc: BaseException) -> None:
+    for waiter in waiters:
+        try:
+            waiter.future.set_exception(exc)
+        except InvalidStateError:
+            continue
+
+
+_shared_poller: JobPoller | None = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_poller() -> JobPoller:
+    """Return the process-wide poller; its thread starts on the first tracked job."""
+    global _shared_poller
+    with _shared_lock:
+        if _shared_poller is None:
+            _shared_poller = JobPoller()
+        return _shared_poller
@@ -0,0 +1,75 @@
+"""Process-wide registry of RunPod clients so node executions reuse warm connections."""
+
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from comfy_gpu_offload.api.runpod_client import RunpodClient
+from comfy_gpu_offload.config import RunpodConfig
+
+
+def build_pooled_session(pool_size: int) -> requests.Session:
+    """Session whose keep-alive pool can hold ``pool_size`` connections per host.
+
+    ``requests`` defaults to 10 pooled connections and silently discards extras, which
+    forces fresh TLS handshakes when the poller and several submits overlap. Retries are
+    handled by ``RunpodClient`` so the adapter does not retry on its own.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size, max_retries=0)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+class ClientRegistry:
+    """Hands out one ``RunpodClient`` per distinct ``RunpodConfig``.
+
+    Clients for the same config share their ``requests.Session`` (and so its connection
+    pool) as well as their circuit breakers, across threads and node executions.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._clients: dict[RunpodConfig, RunpodClient] = {}
+        self._sessions: list[requests.Session] = []
+
+    def get(self, config: RunpodConfig) -> RunpodClient:
+        with self._lock:
+            client = self._clients.get(config)
+            if client is None:
+                session = build_pooled_session(config.http_pool_size)
+                client = RunpodClient(config, session=session)
+                self._clients[config] = client
+                self._sessions.append(session)
+            return client
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._clients)
+
+    def close(self) -> None:
+        """Close every pooled session; later ``get`` calls build fresh clients."""
+        with self._lock:
+            sessions, self._sessions = self._sessions, []
+            self._clients.clear()
+        for session in sessions:
+            session.close()
+
+
+_shared_registry: ClientRegistry | None = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_registry() -> ClientRegistry:
+    global _shared_registry
+    with _shared_lock:
+        if _shared_registry is None:
+            _shared_registry = ClientRegistry()
+        return _shared_registry
+
+
+def get_shared_client(config: RunpodConfig) -> RunpodClient:
+    """Return the process-wide client for ``config``."""
+    return get_shared_registry().get(config)
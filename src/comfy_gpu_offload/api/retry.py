@@ -0,0 +1,164 @@
+"""Retry/backoff policy and per-endpoint circuit breaker for RunPod HTTP calls."""
+
+import random
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+
+from comfy_gpu_offload.config import RunpodConfig
+
+# Safe to retry for any call: the server refused or failed before doing work.
+RETRYABLE_SUBMIT_STATUSES = frozenset({429, 503})
+# Status reads and cancels are idempotent, so any transient server failure is retryable.
+RETRYABLE_IDEMPOTENT_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+@dataclass(frozen=True, slots=True)
+class RetryPolicy:
+    """Exponential backoff with jitter; ``Retry-After`` from the server takes precedence."""
+
+    max_retries: int = 3
+    backoff_seconds: float = 0.5
+    max_backoff_seconds: float = 30.0
+    multiplier: float = 2.0
+    jitter_ratio: float = 0.2
+    # Jitter is not security-sensitive.
+    random_source: Callable[[], float] = field(default=random.random, compare=False)  # nosec B311
+
+    @classmethod
+    def from_config(cls, config: RunpodConfig) -> "RetryPolicy":
+        return cls(max_retries=config.max_retries, backoff_seconds=config.retry_backoff_seconds)
+
+    def delay(self, retry_number: int, retry_after: float | None = None) -> float:
+        """Seconds to wait before the ``retry_number``-th retry (1-based)."""
+        if retry_after is not None:
+            return min(max(0.0, retry_after), self.max_backoff_seconds)
+        base = self.backoff_seconds * self.multiplier ** max(0, retry_number - 1)
+        spread = base * self.jitter_ratio
+        jittered = base - spread + 2 * spread * self.random_source()
+        return min(max(0.0, jittered), self.max_backoff_seconds)
+
+
+def parse_retry_after(value: str | None, *, now: Callable[[], float] = time.time) -> float | None:
+    """Parse a ``Retry-After`` header given as delta-seconds or an HTTP date."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - now())
+
+
+class CircuitBreaker:
+    """Classic closed/open/half-open breaker guarding one endpoint.
+
+    After ``failure_threshold`` consecutive failures the breaker opens and callers fail fast.
+    Once ``reset_timeout_seconds`` pass, one probe request is allowed through; its outcome
+    closes the breaker again or re-opens it for another timeout. A probe that ends without
+    an outcome (cancelled, interrupted) is released with ``release_probe``; one never
+    released is treated as lost after another ``reset_timeout_seconds``.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: int = 5,
+        reset_timeout_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._probe_started: float | None = None
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._opened_at is None:
+                return self.CLOSED
+            now = self._clock()
+            if self._probe_active(now) or now - self._opened_at >= self._reset_timeout:
+                return self.HALF_OPEN
+            return self.OPEN
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            now = self._clock()
+            if self._probe_active(now):
+                return False
+            if now - self._opened_at >= self._reset_timeout:
+                self._probe_started = now
+                return True
+            return False
+
+    def release_probe(self) -> None:
+        """Give up a probe that ended without a result, so the next call may probe again."""
+        with self._lock:
+            self._probe_started = None
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._probe_started = None
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._probe_started is not None or self._failures >= self._failure_threshold:
+                self._opened_at = self._clock()
+            self._probe_started = None
+
+    def _probe_active(self, now: float) -> bool:
+        # Caller holds the lock.
+        return self._probe_started is not None and now - self._probe_started < self._reset_timeout
+
+
+class CircuitBreakerRegistry:
+    """Lazily creates one breaker per endpoint name (``run``, ``status``, ...)."""
+
+    def __init__(self, *, failure_threshold: int, reset_timeout_seconds: float) -> None:
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout_seconds
+        self._lock = threading.Lock()
+        self._breakers: dict[str, CircuitBreaker] = {}
+
+    @classmethod
+    def from_config(cls, config: RunpodConfig) -> "CircuitBreakerRegistry":
+        return cls(
+            failure_threshold=config.circuit_failure_threshold,
+            reset_timeout_seconds=config.circuit_reset_seconds,
+        )
+
+    def for_endpoint(self, endpoint: str) -> CircuitBreaker:
+        with self._lock:
+            breaker = self._breakers.get(endpoint)
+            if breaker is None:
+                breaker = CircuitBreaker(
+                    failure_threshold=self._failure_threshold,
+                    reset_timeout_seconds=self._reset_timeout,
+                )
+                self._breakers[endpoint] = breaker
+            return breaker
+
+
+def endpoint_name(path: str) -> str:
+    """Map ``/status/<job_id>`` style paths to a stable breaker key."""
+    return path.strip("/").split("/", 1)[0]
@@ -9,12 +9,35 @@ import requests
 from requests import Response
 from requests.exceptions import RequestException
 
+from comfy_gpu_offload.api.poll_schedule import (
+    AdaptivePollSchedule,
+    FixedPollSchedule,
+    PollSchedule,
+)
+from comfy_gpu_offload.api.retry import (
+    RETRYABLE_IDEMPOTENT_STATUSES,
+    RETRYABLE_SUBMIT_STATUSES,
+    CircuitBreakerRegistry,
+    RetryPolicy,
+    endpoint_name,
+    parse_retry_after,
+)
 from comfy_gpu_offload.config import RunpodConfig
+from comfy_gpu_offload.workflow import json_codec
+from comfy_gpu_offload.workflow.loader import EncodedPayload
 
 
 class RunpodApiError(RuntimeError):
     """Raised when the RunPod API returns an error or an unexpected response."""
 
+    def __init__(self, message: str, *, status_code: int | None = None) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class RunpodCircuitOpenError(RunpodApiError):
+    """Raised without sending a request while an endpoint's circuit breaker is open."""
+
 
 class RunpodCancelledError(RunpodApiError):
     """Raised when polling is cancelled by the caller."""
@@ -25,7 +48,16 @@ class RunpodTimeoutError(RunpodApiError):
 
 
 class RunpodJobError(RunpodApiError):
-    """Raised when a job finishes unsuccessfully (status FAILED or CANCELLED)."""
+    """Raised when a job finishes unsuccessfully (status FAILED or CANCELLED).
+
+    ``error_code`` is the machine-readable code the worker attached to its error, if any.
+    """
+
+    def __init__(
+        self, message: str, *, status_code: int | None = None, error_code: str | None = None
+    ) -> None:
+        super().__init__(message, status_code=status_code)
+        self.error_code = error_code
 
 
 class RunpodStatus:
@@ -44,51 +76,178 @@ class JobStatus:
     status: str
     output: Any | None = None
     error: str | None = None
+    error_code: str | None = None
 
     @property
     def is_terminal(self) -> bool:
         return self.status in RunpodStatus.TERMINAL
 
+    def ensure_completed(self) -> "JobStatus":
+        """Return self if the job completed; raise ``RunpodJobError`` for FAILED/CANCELLED."""
+        if self.status == RunpodStatus.COMPLETED:
+            return self
+        raise RunpodJobError(
+            f"Job {self.job_id} finished with status {self.status}: {self.error}",
+            error_code=self.error_code,
+        )
+
+
+def _parse_job_id(data: Mapping[str, Any]) -> str:
+    job_id = data.get("id")
+    if not isinstance(job_id, str) or not job_id:
+        raise RunpodApiError("RunPod response missing job id")
+    return job_id
+
+
+def _parse_job_error(error: Any) -> tuple[str | None, str | None]:
+    """Split a job ``error`` into its message and the worker's ``error_code``, if any.
+
+    Workers report structured errors as ``{"error_code": ..., "message": ...}``; RunPod
+    passes that object through as is or JSON-encoded in the error string.
+    """
+    if error is None:
+        return None, None
+    parsed = error
+    if isinstance(error, str):
+        if not error.startswith("{"):
+            return error, None
+        try:
+            parsed = json_codec.loads(error)
+        except json_codec.JSONDecodeError:
+            return error, None
+    if not isinstance(parsed, Mapping):
+        return str(error), None
+    code = parsed.get("error_code")
+    message = parsed.get("message")
+    if message is not None:
+        text = str(message)
+    else:
+        text = error if isinstance(error, str) else json_codec.dumps_str(parsed)
+    return text, code if isinstance(code, str) else None
+
+
+def _parse_job_status(data: Mapping[str, Any], job_id: str) -> JobStatus:
+    status = data.get("status")
+    if not isinstance(status, str):
+        raise RunpodApiError("RunPod status response missing status field")
+    error, error_code = _parse_job_error(data.get("error"))
+    return JobStatus(
+        job_id=str(data.get("id", job_id)),
+        status=status,
+        output=data.get("output"),
+        error=error,
+        error_code=error_code,
+    )
+
+
+def _parse_cancel_status(data: Mapping[str, Any], job_id: str) -> JobStatus:
+    return JobStatus(
+        job_id=job_id,
+        status=data.get("status") or RunpodStatus.CANCELLED,
+        output=data.get("output"),
+    )
+
+
+def resolve_poll_schedule(
+    config: RunpodConfig, poll_interval_seconds: float | None = None
+) -> PollSchedule:
+    """Fixed schedule for an explicit interval; adaptive schedule from config otherwise."""
+    if poll_interval_seconds:
+        return FixedPollSchedule(poll_interval_seconds)
+    return AdaptivePollSchedule.from_config(config)
+
+
+def _request_body(input_payload: Mapping[str, Any] | EncodedPayload) -> dict[str, Any]:
+    """Request kwargs for a submit body; pre-encoded payloads are sent byte-for-byte."""
+    if isinstance(input_payload, EncodedPayload):
+        return {"data": input_payload.body}
+    return {"json": {"input": input_payload}}
+
+
+def _runsync_wait_millis(wait_seconds: float) -> int:
+    # RunPod accepts 1s..300s for the /runsync wait parameter.
+    return int(min(max(wait_seconds, 1.0), 300.0) * 1000)
+
 
 class RunpodClient:
-    def __init__(self, config: RunpodConfig, session: requests.Session | None = None) -> None:
+    def __init__(
+        self,
+        config: RunpodConfig,
+        session: requests.Session | None = None,
+        *,
+        retry_policy: RetryPolicy | None = None,
+        breakers: CircuitBreakerRegistry | None = None,
+    ) -> None:
         self._config = config
         self._session = session or requests.Session()
+        self._retry = retry_policy or RetryPolicy.from_config(config)
+        self._breakers = breakers or CircuitBreakerRegistry.from_config(config)
         base = config.base_url.rstrip("/")
         self._endpoint_base = f"{base}/v2/{config.endpoint_id}"
 
-    def submit_job(self, input_payload: Mapping[str, Any]) -> str:
+    def submit_job(self, input_payload: Mapping[str, Any] | EncodedPayload) -> str:
         """Submit an async job; returns job ID."""
-        body = {"input": dict(input_payload)}
-        data = self._request_json("POST", "/run", json=body)
-        job_id = data.get("id")
-        if not isinstance(job_id, str) or not job_id:
-            raise RunpodApiError("RunPod response missing job id")
-        return job_id
+        data = self._request_json("POST", "/run", **_request_body(input_payload))
+        return _parse_job_id(data)
+
+    def submit_job_sync(
+        self,
+        input_payload: Mapping[str, Any] | EncodedPayload,
+        *,
+        wait_seconds: float | None = None,
+    ) -> JobStatus:
+        """Submit via ``/runsync`` and return whatever status RunPod reports when it answers.
+
+        RunPod holds the request open for up to ``wait_seconds`` (default from config); jobs
+        still queued or running at that point come back non-terminal and must be polled.
+        """
+        wait = wait_seconds or self._config.runsync_wait_seconds
+        data = self._request_json(
+            "POST",
+            "/runsync",
+            **_request_body(input_payload),
+            params={"wait": _runsync_wait_millis(wait)},
+            timeout=wait + self._config.request_timeout_seconds,
+        )
+        return _parse_job_status(data, _parse_job_id(data))
+
+    def run_sync(
+        self,
+        input_payload: Mapping[str, Any] | EncodedPayload,
+        *,
+        wait_seconds: float | None = None,
+        timeout_seconds: float | None = None,
+        on_progress: Callable[[JobStatus], None] | None = None,
+        should_continue: Callable[[], bool] | None = None,
+        schedule: PollSchedule | None = None,
+    ) -> JobStatus:
+        """Run a job through ``/runsync``; fall back to ``poll_job`` if the wait budget runs out."""
+        timeout = timeout_seconds or self._config.max_poll_duration_seconds
+        started = time.monotonic()
+        status = self.submit_job_sync(input_payload, wait_seconds=wait_seconds)
+        if on_progress:
+            on_progress(status)
+        if status.is_terminal:
+            return status.ensure_completed()
+        remaining = timeout - (time.monotonic() - started)
+        if remaining <= 0:
+            raise RunpodTimeoutError(f"Polling timeout exceeded for job {status.job_id}")
+        return self.poll_job(
+            status.job_id,
+            timeout_seconds=remaining,
+            on_progress=on_progress,
+            should_continue=should_continue,
+            schedule=schedule,
+        )
 
     def get_job_status(self, job_id: str) -> JobStatus:
         """Fetch job status once."""
-        data = self._request_json("GET", f"/status/{job_id}")
-        status = data.get("status")
-        if not isinstance(status, str):
-            raise RunpodApiError("RunPod status response missing status field")
-        output = data.get("output")
-        error = data.get("error")
-        return JobStatus(
-            job_id=str(data.get("id", job_id)),
-            status=status,
-            output=output,
-            error=error,
-        )
+        data = self._request_json("GET", f"/status/{job_id}", idempotent=True)
+        return _parse_job_status(data, job_id)
 
     def cancel_job(self, job_id: str) -> JobStatus:
-        data = self._request_json("POST", f"/cancel/{job_id}")
-        status = data.get("status")
-        return JobStatus(
-            job_id=job_id,
-            status=status or RunpodStatus.CANCELLED,
-            output=data.get("output"),
-        )
+        data = self._request_json("POST", f"/cancel/{job_id}", idempotent=True)
+        return _parse_cancel_status(data, job_id)
 
     def poll_job(
         self,
@@ -98,23 +257,27 @@ class RunpodClient:
         timeout_seconds: float | None = None,
         on_progress: Callable[[JobStatus], None] | None = None,
         should_continue: Callable[[], bool] | None = None,
+        schedule: PollSchedule | None = None,
     ) -> JobStatus:
-        """Poll until a job reaches a terminal status or times out."""
-        poll_interval = poll_interval_seconds or self._config.poll_interval_seconds
+        """Poll until a job reaches a terminal status or times out.
+
+        The wait between checks comes from ``schedule``; an explicit ``poll_interval_seconds``
+        selects a fixed interval, otherwise an adaptive schedule derived from config is used.
+        """
+        schedule = schedule or resolve_poll_schedule(self._config, poll_interval_seconds)
         timeout = timeout_seconds or self._config.max_poll_duration_seconds
-        deadline = time.monotonic() + timeout
+        started = time.monotonic()
+        deadline = started + timeout
+        attempt = 0
 
         while True:
             status = self.get_job_status(job_id)
+            attempt += 1
             if on_progress:
                 on_progress(status)
 
             if status.is_terminal:
-                if status.status == RunpodStatus.COMPLETED:
-                    return status
-                raise RunpodJobError(
-                    f"Job {job_id} finished with status {status.status}: {status.error}"
-                )
+                return status.ensure_completed()
 
             now = time.monotonic()
             if now >= deadline:
@@ -124,43 +287,83 @@ class RunpodClient:
                 raise RunpodCancelledError(f"Polling cancelled by caller for job {job_id}")
 
             remaining = deadline - now
-            sleep_for = min(poll_interval, max(0.0, remaining))
-            time.sleep(sleep_for)
+            interval = schedule.next_interval(
+                status.status, attempt=attempt, elapsed_seconds=now - started
+            )
+            time.sleep(min(interval, max(0.0, remaining)))
 
-    def _request_json(self, method: str, path: str, **kwargs: Any) -> dict[str, Any]:
+    def _request_json(
+        self, method: str, path: str, *, idempotent: bool = False, **kwargs: Any
+    ) -> dict[str, Any]:
+        """Send one API call with retry and circuit breaking.
+
+        Idempotent calls retry on connection errors and transient 5xx/429. Submissions only
+        retry 429/503, where RunPod rejected the job before accepting it.
+        """
         url = self._endpoint_base + path
         headers = kwargs.pop("headers", {})
         # Avoid logging secrets; do not expose api_key.
         headers.setdefault("Authorization", f"Bearer {self._config.api_key}")
         headers.setdefault("Content-Type", "application/json")
+        timeout = kwargs.pop("timeout", self._config.request_timeout_seconds)
+        endpoint = endpoint_name(path)
+        breaker = self._breakers.for_endpoint(endpoint)
+        retryable = RETRYABLE_IDEMPOTENT_STATUSES if idempotent else RETRYABLE_SUBMIT_STATUSES
+        retries = 0
 
-        try:
-            response = self._session.request(
-                method=method,
-                url=url,
-                headers=headers,
-                timeout=self._config.request_timeout_seconds,
-                verify=self._config.verify_tls,
-                **kwargs,
-            )
-        except RequestException as exc:
-            raise RunpodApiError(f"RunPod request failed: {exc!s}") from exc
-
-        self._raise_for_status(response, method, url)
-        return self._parse_json(response, url)
+        while True:
+            if not breaker.allow():
+                raise RunpodCircuitOpenError(
+                    f"RunPod '{endpoint}' endpoint is failing repeatedly; not sending request"
+                )
+            try:
+                response = self._session.request(
+                    method=method,
+                    url=url,
+                    headers=headers,
+                    timeout=timeout,
+                    verify=self._config.verify_tls,
+                    **kwargs,
+                )
+            except RequestException as exc:
+                breaker.record_failure()
+                if idempotent and retries < self._retry.max_retries:
+                    retries += 1
+                    time.sleep(self._retry.delay(retries))
+                    continue
+                raise RunpodApiError(f"RunPod request failed: {exc!s}") from exc
+            except BaseException:
+                # Interrupted without an outcome; do not leave a half-open probe claimed.
+                breaker.release_probe()
+                raise
+
+            status_code = response.status_code
+            if status_code == 429 or status_code >= 500:
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+            if status_code in retryable and retries < self._retry.max_retries:
+                retries += 1
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                time.sleep(self._retry.delay(retries, retry_after))
+                continue
+
+            self._raise_for_status(response, method, url)
+            return self._parse_json(response, url)
 
     @staticmethod
     def _raise_for_status(response: Response, method: str, url: str) -> None:
         if response.status_code >= 400:
             snippet = response.text[:500] if response.text else ""
             raise RunpodApiError(
-                f"RunPod API returned {response.status_code} for {method} {url}: {snippet}"
+                f"RunPod API returned {response.status_code} for {method} {url}: {snippet}",
+                status_code=response.status_code,
             )
 
     @staticmethod
     def _parse_json(response: Response, url: str) -> dict[str, Any]:
         try:
-            data = response.json()
+            data = json_codec.loads(response.content)
         except ValueError as exc:
             raise RunpodApiError(f"Invalid JSON in response from {url}") from exc
         if not isinstance(data, dict):
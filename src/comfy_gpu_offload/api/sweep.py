@@ -0,0 +1,40 @@
+"""Fan one workflow out over many parameter sets.
+
+The ``RunPodSweep`` node submits the payloads built here through the same cached,
+coalesced path as single runs.
+"""
+
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+from comfy_gpu_offload.workflow import (
+    ImagePayload,
+    RunpodInputPayload,
+    TensorPayload,
+    build_run_payload,
+)
+
+DEFAULT_MAX_PARALLEL = 4
+
+
+def build_sweep_payloads(
+    workflow: Mapping[str, Any],
+    param_sets: Sequence[Mapping[str, Any]],
+    *,
+    images: Sequence[ImagePayload] | None = None,
+    base_params: Mapping[str, Any] | None = None,
+    tensors: Sequence[TensorPayload] | None = None,
+) -> list[RunpodInputPayload]:
+    """One payload per entry in ``param_sets``, each layered over ``base_params``.
+
+    ``images`` and ``tensors`` (e.g. an init latent) are shared by every payload.
+    """
+    return [
+        build_run_payload(
+            workflow=workflow,
+            images=images,
+            params={**(base_params or {}), **overrides},
+            tensors=tensors,
+        )
+        for overrides in param_sets
+    ]
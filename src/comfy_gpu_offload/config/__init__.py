@@ -4,6 +4,7 @@ from .runpod import (
     ConfigError,
     RunpodConfig,
     load_runpod_config,
+    load_runpod_config_cached,
 )
 
-__all__ = ["ConfigError", "RunpodConfig", "load_runpod_config"]
+__all__ = ["ConfigError", "RunpodConfig", "load_runpod_config", "load_runpod_config_cached"]
@@ -1,6 +1,7 @@
 """RunPod configuration models and loaders."""
 
 import os
+import threading
 from collections.abc import Mapping
 from dataclasses import dataclass
 
@@ -32,6 +33,18 @@ def _parse_float(value: str | None, *, default: float, name: str) -> float:
     return parsed
 
 
+def _parse_int(value: str | None, *, default: int, name: str, minimum: int = 0) -> int:
+    if value is None:
+        return default
+    try:
+        parsed = int(value)
+    except ValueError as err:
+        raise ConfigError(f"Invalid integer for {name}: {value!r}") from err
+    if parsed < minimum:
+        raise ConfigError(f"{name} must be at least {minimum}")
+    return parsed
+
+
 def _require(value: str | None, *, name: str) -> str:
     if value is None or value.strip() == "":
         raise ConfigError(f"Missing required configuration: {name}")
@@ -44,11 +57,33 @@ def _validate_base_url(url: str) -> str:
     return url.rstrip("/")
 
 
+def _validate_https_url(url: str | None, *, name: str) -> str | None:
+    url = (url or "").strip()
+    if not url:
+        return None
+    if not url.startswith("https://"):
+        raise ConfigError(f"{name} must use https")
+    return url.rstrip("/")
+
+
 DEFAULT_BASE_URL = "https://api.runpod.ai"
 DEFAULT_REQUEST_TIMEOUT_SECONDS = 30.0
 DEFAULT_VERIFY_TLS = True
 DEFAULT_POLL_INTERVAL_SECONDS = 3.0
 DEFAULT_MAX_POLL_DURATION_SECONDS = 900.0  # 15 minutes
+DEFAULT_RUNSYNC_WAIT_SECONDS = 30.0
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_RETRY_BACKOFF_SECONDS = 0.5
+DEFAULT_CIRCUIT_FAILURE_THRESHOLD = 5
+DEFAULT_CIRCUIT_RESET_SECONDS = 30.0
+DEFAULT_HTTP_POOL_SIZE = 32
+DEFAULT_RESULT_CACHE_MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_RESULT_CACHE_TTL_SECONDS = 7 * 24 * 3600.0
+DEFAULT_ASSET_PREFIX = "comfy-gpu-offload/"
+DEFAULT_ASSET_URL_TTL_SECONDS = 3600.0
+DEFAULT_ASSET_UPLOAD_WORKERS = 8
+DEFAULT_SPOOL_MAX_BYTES = 2 * 1024 * 1024 * 1024
+DEFAULT_SPOOL_TTL_SECONDS = 24 * 3600.0
 
 
 @dataclass(frozen=True, slots=True)
@@ -60,6 +95,24 @@ class RunpodConfig:
     verify_tls: bool = DEFAULT_VERIFY_TLS
     poll_interval_seconds: float = DEFAULT_POLL_INTERVAL_SECONDS
     max_poll_duration_seconds: float = DEFAULT_MAX_POLL_DURATION_SECONDS
+    runsync_wait_seconds: float = DEFAULT_RUNSYNC_WAIT_SECONDS
+    max_retries: int = DEFAULT_MAX_RETRIES
+    retry_backoff_seconds: float = DEFAULT_RETRY_BACKOFF_SECONDS
+    circuit_failure_threshold: int = DEFAULT_CIRCUIT_FAILURE_THRESHOLD
+    circuit_reset_seconds: float = DEFAULT_CIRCUIT_RESET_SECONDS
+    http_pool_size: int = DEFAULT_HTTP_POOL_SIZE
+    result_cache_dir: str | None = None
+    result_cache_max_bytes: int = DEFAULT_RESULT_CACHE_MAX_BYTES
+    result_cache_ttl_seconds: float = DEFAULT_RESULT_CACHE_TTL_SECONDS
+    asset_bucket: str | None = None
+    asset_prefix: str = DEFAULT_ASSET_PREFIX
+    asset_endpoint_url: str | None = None
+    asset_region: str | None = None
+    asset_url_ttl_seconds: float = DEFAULT_ASSET_URL_TTL_SECONDS
+    asset_upload_workers: int = DEFAULT_ASSET_UPLOAD_WORKERS
+    spool_dir: str | None = None
+    spool_max_bytes: int = DEFAULT_SPOOL_MAX_BYTES
+    spool_ttl_seconds: float = DEFAULT_SPOOL_TTL_SECONDS
 
     @staticmethod
     def env_keys() -> dict[str, str]:
@@ -71,6 +124,24 @@ class RunpodConfig:
             "verify_tls": "RUNPOD_VERIFY_TLS",
             "poll_interval_seconds": "RUNPOD_POLL_INTERVAL",
             "max_poll_duration_seconds": "RUNPOD_MAX_POLL_DURATION",
+            "runsync_wait_seconds": "RUNPOD_RUNSYNC_WAIT",
+            "max_retries": "RUNPOD_MAX_RETRIES",
+            "retry_backoff_seconds": "RUNPOD_RETRY_BACKOFF",
+            "circuit_failure_threshold": "RUNPOD_CIRCUIT_FAILURE_THRESHOLD",
+            "circuit_reset_seconds": "RUNPOD_CIRCUIT_RESET",
+            "http_pool_size": "RUNPOD_HTTP_POOL_SIZE",
+            "result_cache_dir": "RUNPOD_RESULT_CACHE_DIR",
+            "result_cache_max_bytes": "RUNPOD_RESULT_CACHE_MAX_BYTES",
+            "result_cache_ttl_seconds": "RUNPOD_RESULT_CACHE_TTL",
+            "asset_bucket": "RUNPOD_ASSET_BUCKET",
+            "asset_prefix": "RUNPOD_ASSET_PREFIX",
+            "asset_endpoint_url": "RUNPOD_ASSET_ENDPOINT_URL",
+            "asset_region": "RUNPOD_ASSET_REGION",
+            "asset_url_ttl_seconds": "RUNPOD_ASSET_URL_TTL",
+            "asset_upload_workers": "RUNPOD_ASSET_UPLOAD_WORKERS",
+            "spool_dir": "RUNPOD_SPOOL_DIR",
+            "spool_max_bytes": "RUNPOD_SPOOL_MAX_BYTES",
+            "spool_ttl_seconds": "RUNPOD_SPOOL_TTL",
         }
 
 
@@ -106,6 +177,79 @@ def load_runpod_config(env: Mapping[str, str] | None = None) -> RunpodConfig:
         default=DEFAULT_MAX_POLL_DURATION_SECONDS,
         name=keys["max_poll_duration_seconds"],
     )
+    runsync_wait_seconds = _parse_float(
+        source_env.get(keys["runsync_wait_seconds"]),
+        default=DEFAULT_RUNSYNC_WAIT_SECONDS,
+        name=keys["runsync_wait_seconds"],
+    )
+    max_retries = _parse_int(
+        source_env.get(keys["max_retries"]),
+        default=DEFAULT_MAX_RETRIES,
+        name=keys["max_retries"],
+    )
+    retry_backoff_seconds = _parse_float(
+        source_env.get(keys["retry_backoff_seconds"]),
+        default=DEFAULT_RETRY_BACKOFF_SECONDS,
+        name=keys["retry_backoff_seconds"],
+    )
+    circuit_failure_threshold = _parse_int(
+        source_env.get(keys["circuit_failure_threshold"]),
+        default=DEFAULT_CIRCUIT_FAILURE_THRESHOLD,
+        name=keys["circuit_failure_threshold"],
+        minimum=1,
+    )
+    circuit_reset_seconds = _parse_float(
+        source_env.get(keys["circuit_reset_seconds"]),
+        default=DEFAULT_CIRCUIT_RESET_SECONDS,
+        name=keys["circuit_reset_seconds"],
+    )
+    http_pool_size = _parse_int(
+        source_env.get(keys["http_pool_size"]),
+        default=DEFAULT_HTTP_POOL_SIZE,
+        name=keys["http_pool_size"],
+        minimum=1,
+    )
+    result_cache_dir = (source_env.get(keys["result_cache_dir"]) or "").strip() or None
+    result_cache_max_bytes = _parse_int(
+        source_env.get(keys["result_cache_max_bytes"]),
+        default=DEFAULT_RESULT_CACHE_MAX_BYTES,
+        name=keys["result_cache_max_bytes"],
+    )
+    result_cache_ttl_seconds = _parse_float(
+        source_env.get(keys["result_cache_ttl_seconds"]),
+        default=DEFAULT_RESULT_CACHE_TTL_SECONDS,
+        name=keys["result_cache_ttl_seconds"],
+    )
+    # Storage credentials come from the standard AWS_* variables via the S3 client, never here.
+    asset_bucket = (source_env.get(keys["asset_bucket"]) or "").strip() or None
+    asset_prefix = source_env.get(keys["asset_prefix"], DEFAULT_ASSET_PREFIX).strip().lstrip("/")
+    asset_endpoint_url = _validate_https_url(
+        source_env.get(keys["asset_endpoint_url"]), name=keys["asset_endpoint_url"]
+    )
+    asset_region = (source_env.get(keys["asset_region"]) or "").strip() or None
+    asset_url_ttl_seconds = _parse_float(
+        source_env.get(keys["asset_url_ttl_seconds"]),
+        default=DEFAULT_ASSET_URL_TTL_SECONDS,
+        name=keys["asset_url_ttl_seconds"],
+    )
+    asset_upload_workers = _parse_int(
+        source_env.get(keys["asset_upload_workers"]),
+        default=DEFAULT_ASSET_UPLOAD_WORKERS,
+        name=keys["asset_upload_workers"],
+        minimum=1,
+    )
+    spool_dir = (source_env.get(keys["spool_dir"]) or "").strip() or None
+    spool_max_bytes = _parse_int(
+        source_env.get(keys["spool_max_bytes"]),
+        default=DEFAULT_SPOOL_MAX_BYTES,
+        name=keys["spool_max_bytes"],
+        minimum=1,
+    )
+    spool_ttl_seconds = _parse_float(
+        source_env.get(keys["spool_ttl_seconds"]),
+        default=DEFAULT_SPOOL_TTL_SECONDS,
+        name=keys["spool_ttl_seconds"],
+    )
 
     return RunpodConfig(
         api_key=api_key,
@@ -115,4 +259,40 @@ def load_runpod_config(env: Mapping[str, str] | None = None) -> RunpodConfig:
         verify_tls=verify_tls,
         poll_interval_seconds=poll_interval_seconds,
         max_poll_duration_seconds=max_poll_duration_seconds,
+        runsync_wait_seconds=runsync_wait_seconds,
+        max_retries=max_retries,
+        retry_backoff_seconds=retry_backoff_seconds,
+        circuit_failure_threshold=circuit_failure_threshold,
+        circuit_reset_seconds=circuit_reset_seconds,
+        http_pool_size=http_pool_size,
+        result_cache_dir=result_cache_dir,
+        result_cache_max_bytes=result_cache_max_bytes,
+        result_cache_ttl_seconds=result_cache_ttl_seconds,
+        asset_bucket=asset_bucket,
+        asset_prefix=asset_prefix,
+        asset_endpoint_url=asset_endpoint_url,
+        asset_region=asset_region,
+        asset_url_ttl_seconds=asset_url_ttl_seconds,
+        asset_upload_workers=asset_upload_workers,
+        spool_dir=spool_dir,
+        spool_max_bytes=spool_max_bytes,
+        spool_ttl_seconds=spool_ttl_seconds,
     )
+
+
+_cached_config: tuple[tuple[str | None, ...], RunpodConfig] | None = None
+_cached_config_lock = threading.Lock()
+
+
+def load_runpod_config_cached(env: Mapping[str, str] | None = None) -> RunpodConfig:
+    """Like ``load_runpod_config`` but reuses the parsed config while the RUNPOD_* vars match."""
+    global _cached_config
+    source_env: Mapping[str, str] = env or os.environ
+    snapshot = tuple(source_env.get(key) for key in RunpodConfig.env_keys().values())
+    with _cached_config_lock:
+        if _cached_config is not None and _cached_config[0] == snapshot:
+            return _cached_config[1]
+    config = load_runpod_config(source_env)
+    with _cached_config_lock:
+        _cached_config = (snapshot, config)
+    return config
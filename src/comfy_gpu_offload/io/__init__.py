@@ -1,13 +1,131 @@
 """File and media I/O helpers for artifacts and temporary storage."""
 
-from .images import base64_to_image, image_to_base64
-from .temp_files import ensure_directory, new_temp_dir, remove_path_safely, write_bytes_secure
+from .asset_transfer import (
+    AssetRef,
+    AssetTransferError,
+    AssetUpload,
+    AssetUploader,
+    S3Client,
+    create_s3_client,
+    get_shared_asset_uploader,
+    upload_image_payloads,
+)
+from .image_registry import (
+    BlobStore,
+    DedupedImages,
+    ImageBlobMissingError,
+    ImageRegistry,
+    InMemoryBlobStore,
+    dedupe_image_payloads,
+    get_shared_image_registry,
+    image_digest,
+    resolve_image_refs,
+)
+from .images import (
+    CODECS,
+    FAST_PNG,
+    LOSSLESS_WEBP,
+    ImageCodec,
+    array_to_image,
+    base64_to_image,
+    decode_images_to_array,
+    encode_image_payloads,
+    encode_images_base64,
+    image_to_base64,
+    iter_image_files_float,
+)
+from .outputs import (
+    OUTPUT_IMAGES_KEY,
+    OutputImage,
+    SpooledImage,
+    decode_output_images,
+    extract_output_images,
+    memmap_output_images,
+    spool_output_images,
+    to_comfy_image,
+)
+from .result_cache import (
+    CachedResult,
+    ResultCache,
+    get_shared_result_cache,
+    result_cache_key,
+)
+from .temp_files import (
+    ArtifactSpool,
+    SpoolEntry,
+    ensure_directory,
+    get_shared_artifact_spool,
+    new_temp_dir,
+    remove_path_safely,
+    write_bytes_secure,
+)
+from .tensors import (
+    MAX_TENSOR_BYTES,
+    OUTPUT_TENSORS_KEY,
+    TensorPayloadError,
+    decode_latent,
+    decode_tensor,
+    encode_latent,
+    encode_tensor,
+    extract_output_tensors,
+    to_torch,
+)
 
 __all__ = [
+    "AssetRef",
+    "AssetTransferError",
+    "AssetUpload",
+    "AssetUploader",
+    "S3Client",
+    "create_s3_client",
+    "get_shared_asset_uploader",
+    "upload_image_payloads",
+    "BlobStore",
+    "DedupedImages",
+    "ImageBlobMissingError",
+    "ImageRegistry",
+    "InMemoryBlobStore",
+    "dedupe_image_payloads",
+    "get_shared_image_registry",
+    "image_digest",
+    "resolve_image_refs",
+    "CachedResult",
+    "ResultCache",
+    "get_shared_result_cache",
+    "result_cache_key",
+    "ArtifactSpool",
+    "SpoolEntry",
+    "get_shared_artifact_spool",
     "ensure_directory",
     "new_temp_dir",
     "remove_path_safely",
     "write_bytes_secure",
     "base64_to_image",
     "image_to_base64",
+    "CODECS",
+    "FAST_PNG",
+    "LOSSLESS_WEBP",
+    "ImageCodec",
+    "array_to_image",
+    "encode_image_payloads",
+    "encode_images_base64",
+    "decode_images_to_array",
+    "OUTPUT_IMAGES_KEY",
+    "OutputImage",
+    "decode_output_images",
+    "extract_output_images",
+    "to_comfy_image",
+    "SpooledImage",
+    "memmap_output_images",
+    "spool_output_images",
+    "iter_image_files_float",
+    "MAX_TENSOR_BYTES",
+    "OUTPUT_TENSORS_KEY",
+    "TensorPayloadError",
+    "decode_latent",
+    "decode_tensor",
+    "encode_latent",
+    "encode_tensor",
+    "extract_output_tensors",
+    "to_torch",
 ]
@@ -0,0 +1,394 @@
+"""Upload input assets to S3-compatible storage and pass them to jobs by presigned URL.
+
+Inline base64 adds a third to every image and counts against the RunPod request limit; a
+presigned reference is a few hundred bytes regardless of the asset size. Objects are keyed by
+content hash, so re-sending the same input reuses the same key.
+"""
+
+import base64
+import binascii
+import hashlib
+import mimetypes
+import threading
+import time
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Protocol, cast
+
+from comfy_gpu_offload.config import ConfigError, RunpodConfig
+from comfy_gpu_offload.io.image_registry import ImageRegistry, get_shared_image_registry
+from comfy_gpu_offload.workflow import ImagePayload
+
+DEFAULT_MULTIPART_THRESHOLD = 16 * 1024 * 1024
+DEFAULT_PART_SIZE = 8 * 1024 * 1024
+MIN_PART_SIZE = 5 * 1024 * 1024  # S3 rejects smaller non-final parts.
+_HASH_CHUNK_BYTES = 1024 * 1024
+
+
+class AssetTransferError(RuntimeError):
+    """Raised when an asset cannot be uploaded or referenced."""
+
+
+class S3Client(Protocol):
+    """The subset of the boto3 S3 client used here; any S3-compatible stand-in works."""
+
+    def put_object(self, **kwargs: Any) -> Mapping[str, Any]: ...
+
+    def head_object(self, **kwargs: Any) -> Mapping[str, Any]: ...
+
+    def create_multipart_upload(self, **kwargs: Any) -> Mapping[str, Any]: ...
+
+    def upload_part(self, **kwargs: Any) -> Mapping[str, Any]: ...
+
+    def complete_multipart_upload(self, **kwargs: Any) -> Mapping[str, Any]: ...
+
+    def abort_multipart_upload(self, **kwargs: Any) -> Mapping[str, Any]: ...
+
+    def generate_presigned_url(
+        self,
+        client_method: str,
+        Params: Mapping[str, Any],
+        ExpiresIn: int,
+    ) -> str: ...
+
+
+@dataclass(frozen=True, slots=True)
+class AssetUpload:
+    """An asset to upload, from memory (``data``) or from disk (``path``)."""
+
+    name: str
+    data: bytes | None = None
+    path: Path | None = None
+    content_type: str | None = None
+
+    def __post_init__(self) -> None:
+        if (self.data is None) == (self.path is None):
+            raise AssetTransferError(f"asset {self.name!r} needs exactly one of data or path")
+
+    @property
+    def size(self) -> int:
+        return len(self.data) if self.data is not None else Path(str(self.path)).stat().st_size
+
+    def read(self, offset: int = 0, length: int | None = None) -> bytes:
+        if self.data is not None:
+            return self.data[offset : None if length is None else offset + length]
+        with open(str(self.path), "rb") as file:
+            file.seek(offset)
+            return file.read(-1 if length is None else length)
+
+    def sha256(self) -> str:
+        if self.data is not None:
+            return hashlib.sha256(self.data).hexdigest()
+        digest = hashlib.sha256()
+        with open(str(self.path), "rb") as file:
+            for chunk in iter(lambda: file.read(_HASH_CHUNK_BYTES), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+
+@dataclass(frozen=True, slots=True)
+class AssetRef:
+    """An uploaded asset and the presigned URL the worker downloads it from."""
+
+    name: str
+    key: str
+    url: str
+    size: int
+    sha256: str
+    content_type: str | None = None
+
+    def to_image_payload(self) -> ImagePayload:
+        entry: ImagePayload = {"name": self.name, "url": self.url, "sha256": self.sha256}
+        if self.content_type:
+            entry["type"] = self.content_type
+        return entry
+
+
+@dataclass(slots=True)
+class _PlannedUpload:
+    upload: AssetUpload
+    key: str
+    sha256: str
+    size: int
+    content_type: str | None
+    upload_id: str | None = None
+    parts: list[Future[Mapping[str, Any]]] = field(default_factory=list)
+
+
+def create_s3_client(config: RunpodConfig) -> S3Client:
+    """Build a boto3 S3 client for the configured store (requires the ``s3`` extra)."""
+    try:
+        import boto3
+        from botocore.config import Config as BotoConfig
+    except ImportError as exc:
+        raise AssetTransferError(
+            "boto3 is required for asset uploads; install comfy-gpu-offload[s3]"
+        ) from exc
+    client: S3Client = boto3.client(
+        "s3",
+        endpoint_url=config.asset_endpoint_url,
+        region_name=config.asset_region,
+        verify=config.verify_tls,
+        config=BotoConfig(
+            connect_timeout=config.request_timeout_seconds,
+            read_timeout=config.request_timeout_seconds,
+            retries={"max_attempts": config.max_retries + 1, "mode": "standard"},
+            max_pool_connections=config.asset_upload_workers,
+        ),
+    )
+    return client
+
+
+class AssetUploader:
+    """Uploads batches of assets in parallel; large ones go up as concurrent multipart parts."""
+
+    def __init__(
+        self,
+        client: S3Client,
+        bucket: str,
+        *,
+        prefix: str = "",
+        url_ttl_seconds: float = 3600.0,
+        max_workers: int = 8,
+        multipart_threshold: int = DEFAULT_MULTIPART_THRESHOLD,
+        part_size: int = DEFAULT_PART_SIZE,
+        clock: Callable[[], float] = time.monotonic,
+        registry: ImageRegistry | None = None,
+    ) -> None:
+        if not bucket:
+            raise ValueError("bucket must not be empty")
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if part_size < MIN_PART_SIZE:
+            raise ValueError(f"part_size must be at least {MIN_PART_SIZE} bytes")
+        self._client = client
+        self._bucket = bucket
+        self._prefix = prefix
+        self._url_ttl_seconds = int(url_ttl_seconds)
+        self._max_workers = max_workers
+        self._multipart_threshold = max(multipart_threshold, part_size)
+        self._part_size = part_size
+        self._clock = clock
+        # Keys already in the bucket are not uploaded again; old entries are re-checked.
+        self._registry = registry
+        self._scope = f"s3://{bucket}"
+        self._urls: dict[str, tuple[str, float]] = {}
+        self._urls_lock = threading.Lock()
+
+    @classmethod
+    def from_config(
+        cls,
+        config: RunpodConfig,
+        *,
+        client_factory: Callable[[RunpodConfig], S3Client] = create_s3_client,
+    ) -> "AssetUploader":
+        if not config.asset_bucket:
+            raise ConfigError("RUNPOD_ASSET_BUCKET must be set to upload assets")
+        return cls(
+            client_factory(config),
+            config.asset_bucket,
+            prefix=config.asset_prefix,
+            url_ttl_seconds=config.asset_url_ttl_seconds,
+            max_workers=config.asset_upload_workers,
+            registry=get_shared_image_registry(),
+        )
+
+    def upload(self, asset: AssetUpload) -> AssetRef:
+        return self.upload_many([asset])[0]
+
+    def upload_many(self, assets: Sequence[AssetUpload]) -> list[AssetRef]:
+        """Upload ``assets`` and return one presigned reference per asset, in order."""
+        plans = [self._plan(asset) for asset in assets]
+        unique: dict[str, _PlannedUpload] = {}
+        for plan in plans:
+            if plan.key in unique:
+                continue
+            if self._registry is not None and self._registry.is_known(
+                self._scope, plan.key, verify=self._exists
+            ):
+                continue
+            unique[plan.key] = plan
+
+        with ThreadPoolExecutor(
+            max_workers=self._max_workers, thread_name_prefix="asset-upload"
+        ) as pool:
+            try:
+                for plan in unique.values():
+                    self._start(pool, plan)
+                pending = [part for plan in unique.values() for part in plan.parts]
+                wait(pending)
+                for plan in unique.values():
+                    self._finish(plan)
+            except Exception as exc:
+                wait([part for plan in unique.values() for part in plan.parts])
+                for plan in unique.values():
+                    if plan.upload_id is not None:
+                        self._abort(plan)
+                if isinstance(exc, AssetTransferError):
+                    raise
+                raise AssetTransferError(f"asset upload failed: {exc}") from exc
+        if self._registry is not None:
+            self._registry.add(self._scope, unique)
+
+        return [
+            AssetRef(
+                name=plan.upload.name,
+                key=plan.key,
+                url=self._presign(plan.key),
+                size=plan.size,
+                sha256=plan.sha256,
+                content_type=plan.content_type,
+            )
+            for plan in plans
+        ]
+
+    def _plan(self, asset: AssetUpload) -> _PlannedUpload:
+        try:
+            digest = asset.sha256()
+            size = asset.size
+        except OSError as exc:
+            raise AssetTransferError(f"cannot read asset {asset.name!r}: {exc}") from exc
+        content_type = asset.content_type or mimetypes.guess_type(asset.name)[0]
+        suffix = Path(asset.name).suffix.lower()
+        return _PlannedUpload(
+            upload=asset,
+            key=f"{self._prefix}{digest}{suffix}",
+            sha256=digest,
+            size=size,
+            content_type=content_type,
+        )
+
+    def _start(self, pool: ThreadPoolExecutor, plan: _PlannedUpload) -> None:
+        extra = {"ContentType": plan.content_type} if plan.content_type else {}
+        if plan.size < self._multipart_threshold:
+            plan.parts.append(pool.submit(self._put_object, plan, extra))
+            return
+        created = self._client.create_multipart_upload(Bucket=self._bucket, Key=plan.key, **extra)
+        plan.upload_id = str(created["UploadId"])
+        for number, offset in enumerate(range(0, plan.size, self._part_size), start=1):
+            plan.parts.append(pool.submit(self._upload_part, plan, number, offset))
+
+    def _put_object(self, plan: _PlannedUpload, extra: Mapping[str, str]) -> Mapping[str, Any]:
+        return self._client.put_object(
+            Bucket=self._bucket, Key=plan.key, Body=plan.upload.read(), **extra
+        )
+
+    def _upload_part(self, plan: _PlannedUpload, number: int, offset: int) -> Mapping[str, Any]:
+        # Parts are read inside the worker so at most max_workers parts sit in memory.
+        response = self._client.upload_part(
+            Bucket=self._bucket,
+            Key=plan.key,
+            UploadId=plan.upload_id,
+            PartNumber=number,
+            Body=plan.upload.read(offset, self._part_size),
+        )
+        return {"PartNumber": number, "ETag": response["ETag"]}
+
+    def _finish(self, plan: _PlannedUpload) -> None:
+        results = [part.result() for part in plan.parts]
+        if plan.upload_id is None:
+            return
+        self._client.complete_multipart_upload(
+            Bucket=self._bucket,
+            Key=plan.key,
+            UploadId=plan.upload_id,
+            MultipartUpload={"Parts": results},
+        )
+        plan.upload_id = None
+
+    def _abort(self, plan: _PlannedUpload) -> None:
+        try:
+            self._client.abort_multipart_upload(
+                Bucket=self._bucket, Key=plan.key, UploadId=plan.upload_id
+            )
+        except Exception:
+            # Best effort; a bucket lifecycle rule for incomplete uploads reaps leftovers.
+            return
+        finally:
+            plan.upload_id = None
+
+    def _exists(self, key: str) -> bool:
+        try:
+            self._client.head_object(Bucket=self._bucket, Key=key)
+        except Exception:
+            return False  # Missing (404) or unreachable: upload again to be safe.
+        return True
+
+    def _presign(self, key: str) -> str:
+        # A presigned URL embeds its signing time; reusing it for half its lifetime keeps
+        # payloads byte-identical, so result caching and coalescing still match repeat runs.
+        now = self._clock()
+        with self._urls_lock:
+            cached = self._urls.get(key)
+            if cached is not None and cached[1] > now:
+                return cached[0]
+        url = self._client.generate_presigned_url(
+            "get_object",
+            Params={"Bucket": self._bucket, "Key": key},
+            ExpiresIn=self._url_ttl_seconds,
+        )
+        with self._urls_lock:
+            self._urls = {k: v for k, v in self._urls.items() if v[1] > now}
+            self._urls[key] = (url, now + self._url_ttl_seconds / 2)
+        return url
+
+
+def upload_image_payloads(
+    uploader: AssetUploader, images: Sequence[Mapping[str, Any]]
+) -> list[ImagePayload]:
+    """Replace inline (``image``) entries with presigned references.
+
+    Entries that already carry a ``url`` pass through unchanged. Local paths are not
+    accepted: entries come from node inputs, and reading arbitrary files from them would
+    let a shared workflow upload any file the ComfyUI process can read.
+    """
+    assets: list[AssetUpload] = []
+    positions: list[int] = []
+    results: list[ImagePayload] = []
+    for index, image in enumerate(images):
+        name = image.get("name")
+        if not isinstance(name, str) or not name:
+            raise AssetTransferError("each image must include a non-empty 'name'")
+        content_type = image.get("type") if isinstance(image.get("type"), str) else None
+        if "url" in image:
+            results.append(cast(ImagePayload, dict(image)))
+            continue
+        if not isinstance(image.get("image"), str):
+            raise AssetTransferError(f"image {name!r} needs 'image' or 'url'")
+        try:
+            data = base64.b64decode(image["image"], validate=True)
+        except (binascii.Error, ValueError) as exc:
+            raise AssetTransferError(f"image {name!r} is not valid base64") from exc
+        asset = AssetUpload(name=name, data=data, content_type=content_type)
+        results.append({"name": name})
+        assets.append(asset)
+        positions.append(index)
+
+    for index, ref in zip(positions, uploader.upload_many(assets), strict=True):
+        results[index] = ref.to_image_payload()
+    return results
+
+
+_shared_uploaders: dict[tuple[Any, ...], AssetUploader] = {}
+_shared_uploaders_lock = threading.Lock()
+
+
+def get_shared_asset_uploader(config: RunpodConfig) -> AssetUploader:
+    """One uploader (and S3 client connection pool) per distinct asset-store configuration."""
+    key = (
+        config.asset_bucket,
+        config.asset_prefix,
+        config.asset_endpoint_url,
+        config.asset_region,
+        config.asset_url_ttl_seconds,
+        config.asset_upload_workers,
+        config.verify_tls,
+    )
+    with _shared_uploaders_lock:
+        uploader = _shared_uploaders.get(key)
+        if uploader is None:
+            uploader = AssetUploader.from_config(config)
+            _shared_uploaders[key] = uploader
+        return uploader
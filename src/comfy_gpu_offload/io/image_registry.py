@@ -0,0 +1,239 @@
+"""Content-addressed index of input images a worker or object store already holds.
+
+Client side, ``ImageRegistry`` remembers which SHA-256 digests each scope (an endpoint's
+workers, an asset bucket) has received, and ``dedupe_image_payloads`` swaps known images for
+``{"name", "sha256"}`` references. Worker side, ``resolve_image_refs`` restores the data from a
+``BlobStore`` and reports ``image_blob_missing`` when a blob was dropped, so the client can
+forget it and resend.
+"""
+
+import base64
+import binascii
+import hashlib
+import re
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any, ClassVar, Protocol, cast
+
+from comfy_gpu_offload.workflow import ImagePayload
+
+# Workers report this ``error_code`` for unknown digests so clients resend images inline.
+IMAGE_BLOB_MISSING_CODE = "image_blob_missing"
+DEFAULT_REGISTRY_MAX_ENTRIES = 4096
+DEFAULT_VERIFY_AFTER_SECONDS = 3600.0
+DEFAULT_BLOB_STORE_MAX_ENTRIES = 256
+_SHA256_HEX = re.compile(r"[0-9a-f]{64}")
+
+
+class ImageBlobMissingError(RuntimeError):
+    """Raised on the worker when a job references image digests it does not hold.
+
+    Return ``{"error": exc.job_error()}`` from the handler so the client sees ``code``.
+    """
+
+    code: ClassVar[str] = IMAGE_BLOB_MISSING_CODE
+
+    def __init__(self, digests: Sequence[str]) -> None:
+        super().__init__(f"{IMAGE_BLOB_MISSING_CODE}: {', '.join(digests)}")
+        self.digests = tuple(digests)
+
+    def job_error(self) -> dict[str, str]:
+        return {"error_code": self.code, "message": str(self)}
+
+
+def image_digest(image: Mapping[str, Any]) -> str:
+    """SHA-256 of the decoded image bytes; a well-formed ``sha256`` field is trusted as is."""
+    digest = image.get("sha256")
+    if isinstance(digest, str) and _SHA256_HEX.fullmatch(digest):
+        return digest
+    data = image.get("image")
+    if not isinstance(data, str):
+        raise ValueError(f"image {image.get('name')!r} has no inline data to hash")
+    try:
+        raw = base64.b64decode(data, validate=True)
+    except (binascii.Error, ValueError) as exc:
+        raise ValueError(f"image {image.get('name')!r} is not valid base64") from exc
+    return hashlib.sha256(raw).hexdigest()
+
+
+class ImageRegistry:
+    """Bounded LRU of ``(scope, digest)`` pairs known to be held remotely.
+
+    Entries older than ``verify_after_seconds`` are re-checked through the caller's ``verify``
+    callback when one is given, so blobs expired remotely are uploaded again.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_REGISTRY_MAX_ENTRIES,
+        *,
+        verify_after_seconds: float = DEFAULT_VERIFY_AFTER_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self._max_entries = max_entries
+        self._verify_after_seconds = verify_after_seconds
+        self._clock = clock
+        self._entries: OrderedDict[tuple[str, str], float] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def is_known(
+        self, scope: str, digest: str, *, verify: Callable[[str], bool] | None = None
+    ) -> bool:
+        key = (scope, digest)
+        now = self._clock()
+        with self._lock:
+            confirmed_at = self._entries.get(key)
+            if confirmed_at is None:
+                return False
+            self._entries.move_to_end(key)
+        if verify is None or now - confirmed_at < self._verify_after_seconds:
+            return True
+        if not verify(digest):
+            self.discard(scope, [digest])
+            return False
+        self.add(scope, [digest])
+        return True
+
+    def add(self, scope: str, digests: Iterable[str]) -> None:
+        now = self._clock()
+        with self._lock:
+            for digest in digests:
+                self._entries[(scope, digest)] = now
+                self._entries.move_to_end((scope, digest))
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def discard(self, scope: str, digests: Iterable[str]) -> None:
+        with self._lock:
+            for digest in digests:
+                self._entries.pop((scope, digest), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+_shared_registry: ImageRegistry | None = None
+_shared_registry_lock = threading.Lock()
+
+
+def get_shared_image_registry() -> ImageRegistry:
+    global _shared_registry
+    with _shared_registry_lock:
+        if _shared_registry is None:
+            _shared_registry = ImageRegistry()
+        return _shared_registry
+
+
+@dataclass(frozen=True, slots=True)
+class DedupedImages:
+    """Images with known content replaced by references, plus the all-inline fallback."""
+
+    images: list[ImagePayload]
+    inline: list[ImagePayload]
+    digests: tuple[str, ...]
+
+
+def dedupe_image_payloads(
+    registry: ImageRegistry, scope: str, images: Sequence[Mapping[str, Any]]
+) -> DedupedImages:
+    """Hash each inline image once and send only a reference when ``scope`` already holds it.
+
+    URL entries pass through. Every inline entry gains ``sha256`` so the worker can store it;
+    add ``digests`` to the registry once the job succeeds.
+    """
+    deduped: list[ImagePayload] = []
+    inline: list[ImagePayload] = []
+    digests: list[str] = []
+    for image in images:
+        if "url" in image:
+            deduped.append(cast(ImagePayload, dict(image)))
+            inline.append(cast(ImagePayload, dict(image)))
+            continue
+        digest = image_digest(image)
+        full = cast(ImagePayload, {**image, "sha256": digest})
+        inline.append(full)
+        digests.append(digest)
+        if registry.is_known(scope, digest):
+            ref: ImagePayload = {"name": full["name"], "sha256": digest}
+            if "type" in full:
+                ref["type"] = full["type"]
+            deduped.append(ref)
+        else:
+            deduped.append(full)
+    return DedupedImages(images=deduped, inline=inline, digests=tuple(digests))
+
+
+class BlobStore(Protocol):
+    """Worker-side storage for image data keyed by SHA-256 (memory, network volume, ...)."""
+
+    def get(self, digest: str) -> str | None: ...
+
+    def put(self, digest: str, data: str) -> None: ...
+
+
+class InMemoryBlobStore:
+    """Process-local ``BlobStore`` with LRU eviction; holds base64 text as received."""
+
+    def __init__(self, max_entries: int = DEFAULT_BLOB_STORE_MAX_ENTRIES) -> None:
+        self._max_entries = max_entries
+        self._blobs: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, digest: str) -> str | None:
+        with self._lock:
+            data = self._blobs.get(digest)
+            if data is not None:
+                self._blobs.move_to_end(digest)
+            return data
+
+    def put(self, digest: str, data: str) -> None:
+        with self._lock:
+            self._blobs[digest] = data
+            self._blobs.move_to_end(digest)
+            while len(self._blobs) > self._max_entries:
+                self._blobs.popitem(last=False)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._blobs)
+
+
+def resolve_image_refs(job_input: Mapping[str, Any], store: BlobStore) -> dict[str, Any]:
+    """Worker-side: store inline images by digest and fill in data for reference-only entries.
+
+    Raises ``ImageBlobMissingError`` listing every digest the store no longer holds.
+    """
+    images = job_input.get("images")
+    if not isinstance(images, list):
+        return dict(job_input)
+    resolved: list[Any] = []
+    missing: list[str] = []
+    for image in images:
+        digest = image.get("sha256") if isinstance(image, Mapping) else None
+        if not isinstance(digest, str) or "url" in image:
+            resolved.append(image)
+            continue
+        if "image" in image:
+            if image_digest({"name": image.get("name"), "image": image["image"]}) != digest:
+                raise ValueError(f"image {image.get('name')!r} does not match its sha256")
+            store.put(digest, image["image"])
+            resolved.append(image)
+            continue
+        data = store.get(digest)
+        if data is None:
+            missing.append(digest)
+            continue
+        resolved.append({**image, "image": data})
+    if missing:
+        raise ImageBlobMissingError(missing)
+    return {**job_input, "images": resolved}
@@ -0,0 +1,215 @@
+"""Turn images in a job's ``output`` into ComfyUI ``IMAGE`` batches.
+
+``decode_output_images`` builds the batch in memory. For long frame sequences,
+``memmap_output_images`` streams the frames through an ``ArtifactSpool`` instead and returns
+a memory-mapped batch, so only the frames a node touches are paged in.
+"""
+
+import binascii
+import io
+import re
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from PIL import Image
+
+from comfy_gpu_offload.io.images import decode_images_to_array, iter_image_files_float
+from comfy_gpu_offload.io.temp_files import ArtifactSpool, SpoolEntry
+from comfy_gpu_offload.io.tensors import to_torch
+from comfy_gpu_offload.workflow import json_codec
+
+OUTPUT_IMAGES_KEY = "images"
+# Base64 text decoded per write when spooling; a multiple of 4 keeps chunks aligned.
+BASE64_CHUNK_CHARS = 4 * 256 * 1024
+_SUFFIX_FROM_NAME = re.compile(r".*(\.[A-Za-z0-9]{1,16})")
+# Entry types that carry a reference (e.g. a bucket URL) rather than inline data.
+_REFERENCE_TYPES = frozenset({"s3_url", "url"})
+
+
+@dataclass(frozen=True, slots=True)
+class OutputImage:
+    """A base64 image found in a job output."""
+
+    name: str
+    data: str
+
+
+def extract_output_images(
+    output: Mapping[str, Any] | str | bytes, *, key: str = OUTPUT_IMAGES_KEY
+) -> list[OutputImage]:
+    """Collect the inline base64 images listed under ``output[key]``, in order.
+
+    Entries may be strings or objects with the data in ``data`` (RunPod's ComfyUI worker) or
+    ``image`` (this package's payload format) and the name in ``filename`` or ``name``. URL
+    entries are skipped. ``output`` may also be the ``output_json`` text the nodes return.
+    """
+    if isinstance(output, str | bytes):
+        try:
+            output = json_codec.loads(output)
+        except json_codec.JSONDecodeError as exc:
+            raise ValueError(f"output is not valid JSON: {exc.msg}") from exc
+    if not isinstance(output, Mapping):
+        raise ValueError("output must be a JSON object")
+    entries = output.get(key)
+    if entries is None:
+        return []
+    if not isinstance(entries, list):
+        raise ValueError(f"output {key!r} must be a list")
+
+    images: list[OutputImage] = []
+    for index, entry in enumerate(entries):
+        if isinstance(entry, str):
+            images.append(OutputImage(name=f"image_{index}", data=entry))
+            continue
+        if not isinstance(entry, Mapping) or entry.get("type") in _REFERENCE_TYPES:
+            continue
+        data = entry.get("data", entry.get("image"))
+        if isinstance(data, str):
+            name = entry.get("filename") or entry.get("name") or f"image_{index}"
+            images.append(OutputImage(name=str(name), data=data))
+    return images
+
+
+def to_comfy_image(batch: Any) -> Any:
+    """Wrap a float32 ``BxHxWx3`` array as a torch tensor without copying when torch exists."""
+    return to_torch(batch)
+
+
+def decode_output_images(
+    output: Mapping[str, Any] | str | bytes, *, key: str = OUTPUT_IMAGES_KEY
+) -> Any:
+    """Decode every inline image in ``output`` into one ComfyUI ``IMAGE`` batch.
+
+    Raises ``ValueError`` when the output holds no images or they differ in size.
+    """
+    images = extract_output_images(output, key=key)
+    if not images:
+        raise ValueError(f"output has no inline images under {key!r}")
+    return to_comfy_image(decode_images_to_array([image.data for image in images]))
+
+
+@dataclass(frozen=True, slots=True)
+class SpooledImage:
+    """An output image stored encoded in the spool; pixels are read only when opened."""
+
+    name: str
+    entry: SpoolEntry
+
+    @property
+    def path(self) -> Path:
+        return self.entry.path
+
+    @property
+    def size(self) -> tuple[int, int]:
+        """``(width, height)`` read from the file header."""
+        try:
+            with Image.open(self.entry.path) as image:
+                return image.size
+        except OSError as exc:
+            raise ValueError(f"{self.name} could not be decoded: {exc}") from exc
+
+    def open(self) -> Image.Image:
+        """Open the image lazily; the caller closes it."""
+        return Image.open(self.entry.path)
+
+
+def _base64_chunks(data: str) -> Iterator[bytes]:
+    start = data.find(",") + 1 if data.startswith("data:") else 0
+    try:
+        if any(char in data for char in "\r\n "):
+            # Whitespace would shift chunk boundaries off 4-character groups.
+            yield binascii.a2b_base64(data[start:])
+            return
+        for offset in range(start, len(data), BASE64_CHUNK_CHARS):
+            yield binascii.a2b_base64(data[offset : offset + BASE64_CHUNK_CHARS])
+    except (binascii.Error, ValueError) as exc:
+        raise ValueError("image data is not valid base64") from exc
+
+
+def spool_output_images(
+    output: Mapping[str, Any] | str | bytes,
+    spool: ArtifactSpool,
+    *,
+    job_id: str | None = None,
+    key: str = OUTPUT_IMAGES_KEY,
+    pin: bool = False,
+) -> list[SpooledImage]:
+    """Decode each inline image in ``output`` straight into a spool file, indexed by ``job_id``.
+
+    The base64 text is decoded a chunk at a time, so the decoded bytes are never held whole.
+    With ``pin`` every returned entry is pinned (see ``ArtifactSpool.put_chunks``) and the
+    caller must ``unpin`` each one.
+    """
+    spooled: list[SpooledImage] = []
+    try:
+        for image in extract_output_images(output, key=key):
+            match = _SUFFIX_FROM_NAME.fullmatch(image.name)
+            entry = spool.put_chunks(
+                _base64_chunks(image.data),
+                job_id=job_id,
+                suffix=match[1].lower() if match else "",
+                pin=pin,
+            )
+            spooled.append(SpooledImage(name=image.name, entry=entry))
+    except BaseException:
+        if pin:
+            for done in spooled:
+                spool.unpin(done.entry.digest)
+        raise
+    return spooled
+
+
+def _npy_stream(images: list[SpooledImage], shape: tuple[int, ...]) -> Iterator[Any]:
+    import numpy as np
+
+    header = io.BytesIO()
+    np.lib.format.write_array_header_1_0(
+        header, {"descr": np.dtype(np.float32).str, "fortran_order": False, "shape": shape}
+    )
+    yield header.getvalue()
+    yield from iter_image_files_float([image.path for image in images])
+
+
+def memmap_output_images(
+    output: Mapping[str, Any] | str | bytes,
+    spool: ArtifactSpool,
+    *,
+    job_id: str | None = None,
+    key: str = OUTPUT_IMAGES_KEY,
+) -> Any:
+    """Spool ``output``'s images and return them as a memory-mapped ``BxHxWx3`` float32 batch.
+
+    Frames are decoded a window at a time into a ``.npy`` spool file, which is mapped
+    copy-on-write so the batch can be handed to torch without a read-only warning. Pages
+    load only when a frame is read. The frames stay pinned until the batch is built, so
+    concurrent writes cannot evict them mid-read. Once returned, the ``.npy`` is an ordinary
+    spool entry: on POSIX the mapping survives its eviction, while on Windows the mapped
+    file cannot be deleted and stays on disk until the spool next starts. Requires numpy.
+    """
+    import numpy as np
+
+    images = spool_output_images(output, spool, job_id=job_id, key=key, pin=True)
+    entry: SpoolEntry | None = None
+    try:
+        if not images:
+            raise ValueError(f"output has no inline images under {key!r}")
+        sizes = {image.size for image in images}
+        if len(sizes) > 1:
+            raise ValueError(f"images differ in size: {sorted(sizes)}")
+        width, height = images[0].size
+        entry = spool.put_chunks(
+            _npy_stream(images, (len(images), height, width, 3)),
+            job_id=job_id,
+            suffix=".npy",
+            pin=True,
+        )
+        batch = np.load(entry.path, mmap_mode="c")
+    finally:
+        # Frames first, so an over-budget spool evicts them before the batch just built.
+        for image in images:
+            spool.unpin(image.entry.digest)
+        if entry is not None:
+            spool.unpin(entry.digest)
+    return batch
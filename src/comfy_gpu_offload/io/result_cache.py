@@ -0,0 +1,214 @@
+"""Content-addressed cache of completed RunPod job outputs."""
+
+import hashlib
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from comfy_gpu_offload.config import RunpodConfig
+from comfy_gpu_offload.config.runpod import (
+    DEFAULT_RESULT_CACHE_MAX_BYTES,
+    DEFAULT_RESULT_CACHE_TTL_SECONDS,
+)
+from comfy_gpu_offload.io.temp_files import ensure_directory, write_bytes_secure
+from comfy_gpu_offload.workflow import json_codec
+from comfy_gpu_offload.workflow.hashing import content_hash
+from comfy_gpu_offload.workflow.loader import EncodedPayload
+
+DEFAULT_MEMORY_ENTRIES = 128
+RESULT_CACHE_SUBDIR = "comfy-gpu-offload-results"
+_KEY_PATTERN = re.compile(r"[0-9a-f]{16,128}")
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class CachedResult:
+    job_id: str
+    output_json: str
+
+
+def result_cache_key(config: RunpodConfig, payload: Mapping[str, Any] | EncodedPayload) -> str:
+    """Key a payload by the endpoint it runs on plus its content hash.
+
+    Mappings are hashed in canonical form. Pre-encoded payloads hash their request body
+    directly, which avoids a second serialization of multi-megabyte inputs.
+    """
+    endpoint = [config.base_url, config.endpoint_id]
+    if isinstance(payload, EncodedPayload):
+        body_digest = hashlib.sha256(payload.body).hexdigest()
+        return content_hash({"endpoint": endpoint, "body_sha256": body_digest})
+    return content_hash({"endpoint": endpoint, "input": payload})
+
+
+class ResultCache:
+    """Two-tier LRU cache: a bounded in-memory map plus an optional on-disk directory.
+
+    Disk entries are ``<key>.json`` files written with 0o600 permissions to a 0o700
+    ``RESULT_CACHE_SUBDIR`` below ``directory``, which may be shared; nothing else in it is
+    read, evicted or re-permissioned. File mtimes double as the LRU clock (hits touch the
+    file), so eviction by TTL and byte budget survives process restarts. The disk tier is
+    best-effort: write failures are logged, never raised.
+    """
+
+    def __init__(
+        self,
+        *,
+        directory: Path | None = None,
+        max_memory_entries: int = DEFAULT_MEMORY_ENTRIES,
+        max_disk_bytes: int = DEFAULT_RESULT_CACHE_MAX_BYTES,
+        ttl_seconds: float = DEFAULT_RESULT_CACHE_TTL_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._root = directory / RESULT_CACHE_SUBDIR if directory is not None else None
+        self._max_entries = max_memory_entries
+        self._max_disk_bytes = max_disk_bytes
+        self._ttl = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._memory: OrderedDict[str, tuple[float, CachedResult]] = OrderedDict()
+
+    @classmethod
+    def from_config(cls, config: RunpodConfig) -> "ResultCache":
+        directory = Path(config.result_cache_dir).expanduser() if config.result_cache_dir else None
+        return cls(
+            directory=directory,
+            max_disk_bytes=config.result_cache_max_bytes,
+            ttl_seconds=config.result_cache_ttl_seconds,
+        )
+
+    def get(self, key: str) -> CachedResult | None:
+        _check_key(key)
+        now = self._clock()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                stored_at, cached = entry
+                if now - stored_at <= self._ttl:
+                    self._memory.move_to_end(key)
+                    return cached
+                del self._memory[key]
+            from_disk = self._read_disk(key, now)
+            if from_disk is not None:
+                self._remember(key, from_disk, now)
+            return from_disk
+
+    def put(self, key: str, result: CachedResult) -> None:
+        _check_key(key)
+        now = self._clock()
+        with self._lock:
+            self._remember(key, result, now)
+            try:
+                self._write_disk(key, result, now)
+            except OSError:
+                # The job already completed (and was paid for); only the disk copy is lost.
+                logger.warning("Could not write result cache entry %s", key, exc_info=True)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            for path in self._disk_entries():
+                path.unlink(missing_ok=True)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._memory)
+
+    def _remember(self, key: str, result: CachedResult, now: float) -> None:
+        self._memory[key] = (now, result)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self._max_entries:
+            self._memory.popitem(last=False)
+
+    def _disk_entries(self) -> list[Path]:
+        if self._root is None or not self._root.is_dir():
+            return []
+        return [
+            path
+            for path in self._root.glob("*.json")
+            if _KEY_PATTERN.fullmatch(path.stem) and path.is_file()
+        ]
+
+    def _read_disk(self, key: str, now: float) -> CachedResult | None:
+        if self._root is None:
+            return None
+        path = self._root / f"{key}.json"
+        try:
+            if now - path.stat().st_mtime > self._ttl:
+                path.unlink(missing_ok=True)
+                return None
+            data = json_codec.loads(path.read_bytes())
+            result = CachedResult(job_id=str(data["job_id"]), output_json=str(data["output_json"]))
+            os.utime(path, (now, now))
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        return result
+
+    def _write_disk(self, key: str, result: CachedResult, now: float) -> None:
+        if self._root is None:
+            return
+        data = json_codec.dumps({"job_id": result.job_id, "output_json": result.output_json})
+        if len(data) > self._max_disk_bytes:
+            return
+        self._root.parent.mkdir(parents=True, exist_ok=True)
+        ensure_directory(self._root, 0o700)
+        target = self._root / f"{key}.json"
+        partial = self._root / f".{key}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            write_bytes_secure(partial, data)
+            os.replace(partial, target)
+        except OSError:
+            partial.unlink(missing_ok=True)
+            raise
+        os.utime(target, (now, now))
+        self._evict_disk(now)
+
+    def _evict_disk(self, now: float) -> None:
+        entries: list[tuple[float, int, Path]] = []
+        for path in self._disk_entries():
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            if now - stat.st_mtime > self._ttl:
+                path.unlink(missing_ok=True)
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self._max_disk_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+
+def _check_key(key: str) -> None:
+    # Keys become file names; only accept hex digests so they cannot escape the directory.
+    if not _KEY_PATTERN.fullmatch(key):
+        raise ValueError("result cache keys must be lowercase hex digests")
+
+
+_shared_caches: dict[tuple[str | None, int, float], ResultCache] = {}
+_shared_lock = threading.Lock()
+
+
+def get_shared_result_cache(config: RunpodConfig) -> ResultCache:
+    """Return the process-wide cache for the cache settings in ``config``."""
+    settings = (
+        config.result_cache_dir,
+        config.result_cache_max_bytes,
+        config.result_cache_ttl_seconds,
+    )
+    with _shared_lock:
+        cache = _shared_caches.get(settings)
+        if cache is None:
+            cache = ResultCache.from_config(config)
+            _shared_caches[settings] = cache
+        return cache
@@ -1,10 +1,26 @@
 """Temporary directory and file helpers with cautious permissions."""
 
+import hashlib
 import os
+import re
 import shutil
 import tempfile
+import threading
+import time
+from collections import Counter, OrderedDict
+from collections.abc import Buffer, Callable, Iterable
+from dataclasses import dataclass
 from pathlib import Path
 
+from comfy_gpu_offload.config import RunpodConfig
+from comfy_gpu_offload.config.runpod import DEFAULT_SPOOL_MAX_BYTES, DEFAULT_SPOOL_TTL_SECONDS
+
+_SPOOL_NAME = re.compile(r"(?P<digest>[0-9a-f]{64})(?P<suffix>\.[A-Za-z0-9]{1,16})?")
+_SUFFIX = re.compile(r"(\.[A-Za-z0-9]{1,16})?")
+# ``tempfile.mkstemp(prefix=".", suffix=".tmp")`` names: eight random name characters.
+_PARTIAL_NAME = re.compile(r"\.[a-z0-9_]{8}\.tmp")
+SPOOL_SUBDIR = "comfy-gpu-offload-spool"
+
 
 def new_temp_dir(prefix: str = "comfy-gpu-offload-") -> Path:
     """Create a temporary directory with restrictive permissions (0o700)."""
@@ -38,3 +54,264 @@ def remove_path_safely(path: Path) -> None:
     except OSError:
         # Intentionally swallow errors to avoid cascading failures during cleanup.
         return
+
+
+@dataclass(frozen=True, slots=True)
+class SpoolEntry:
+    """An artifact file in an ``ArtifactSpool``, named by the SHA-256 of its content."""
+
+    digest: str
+    path: Path
+    size: int
+
+
+class ArtifactSpool:
+    """Content-addressed directory of job artifacts with a byte budget and LRU/TTL eviction.
+
+    Writes go to a 0o600 temp file in the spool that is renamed into place once complete, so
+    readers never see partial files. File mtimes double as the LRU clock (hits touch the
+    file), and files already in the spool are adopted on first use, so eviction survives
+    restarts. Lookups by digest or job id are dictionary hits; the job index is in memory
+    only. A configured ``directory`` may be shared, so the spool works in its own 0o700
+    ``SPOOL_SUBDIR`` below it and leaves the rest untouched; without ``directory`` a
+    private temp directory is created on first write.
+    """
+
+    def __init__(
+        self,
+        directory: Path | None = None,
+        *,
+        max_bytes: int = DEFAULT_SPOOL_MAX_BYTES,
+        ttl_seconds: float = DEFAULT_SPOOL_TTL_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+        self._directory = directory
+        self._root_path: Path | None = None
+        self._max_bytes = max_bytes
+        self._ttl = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._entries: OrderedDict[str, tuple[float, SpoolEntry]] = OrderedDict()
+        self._jobs: dict[str, list[str]] = {}
+        self._pins: Counter[str] = Counter()
+        self._total_bytes = 0
+
+    @classmethod
+    def from_config(cls, config: RunpodConfig) -> "ArtifactSpool":
+        directory = Path(config.spool_dir).expanduser() if config.spool_dir else None
+        return cls(
+            directory, max_bytes=config.spool_max_bytes, ttl_seconds=config.spool_ttl_seconds
+        )
+
+    @property
+    def directory(self) -> Path:
+        with self._lock:
+            return self._root()
+
+    @property
+    def total_bytes(self) -> int:
+        with self._lock:
+            return self._total_bytes
+
+    def put(self, data: Buffer, *, job_id: str | None = None, suffix: str = "") -> SpoolEntry:
+        """Store ``data`` (deduplicated by content) and index it under ``job_id``."""
+        return self.put_chunks([data], job_id=job_id, suffix=suffix)
+
+    def put_chunks(
+        self,
+        chunks: Iterable[Buffer],
+        *,
+        job_id: str | None = None,
+        suffix: str = "",
+        pin: bool = False,
+    ) -> SpoolEntry:
+        """Stream ``chunks`` into the spool without holding the whole artifact in memory.
+
+        With ``pin`` the entry is exempt from eviction until a matching ``unpin``, so callers
+        can keep reading it while other writes push the spool past its budget. Raises
+        ``ValueError`` if the artifact alone exceeds the byte budget.
+        """
+        if not _SUFFIX.fullmatch(suffix):
+            raise ValueError("suffix must be empty or a short alphanumeric extension")
+        with self._lock:
+            root = self._root()
+        digest, size, partial = self._write_partial(root, chunks)
+        now = self._clock()
+        with self._lock:
+            existing = self._entries.pop(digest, None)
+            if existing is not None:
+                Path(partial).unlink(missing_ok=True)
+                entry = existing[1]
+            else:
+                entry = SpoolEntry(digest=digest, path=root / f"{digest}{suffix}", size=size)
+                os.replace(partial, entry.path)
+                self._total_bytes += size
+            os.utime(entry.path, (now, now))
+            self._entries[digest] = (now, entry)
+            if job_id is not None and digest not in self._jobs.setdefault(job_id, []):
+                self._jobs[job_id].append(digest)
+            if pin:
+                self._pins[digest] += 1
+            self._evict(now, keep=digest)
+        return entry
+
+    def unpin(self, digest: str) -> None:
+        """Release one ``pin`` on ``digest``; evicts again once nothing holds it."""
+        with self._lock:
+            self._pins[digest] -= 1
+            if self._pins[digest] <= 0:
+                del self._pins[digest]
+            self._evict(self._clock(), keep=None)
+
+    def get(self, digest: str) -> SpoolEntry | None:
+        now = self._clock()
+        with self._lock:
+            self._root()
+            return self._touch(digest, now)
+
+    def for_job(self, job_id: str) -> list[SpoolEntry]:
+        """Artifacts stored under ``job_id``, in the order they were added."""
+        now = self._clock()
+        with self._lock:
+            self._root()
+            entries = (self._touch(digest, now) for digest in self._jobs.get(job_id, []))
+            return [entry for entry in entries if entry is not None]
+
+    def discard(self, digest: str) -> None:
+        with self._lock:
+            self._root()
+            self._drop(digest)
+
+    def discard_job(self, job_id: str) -> None:
+        """Remove a job's artifacts unless another job still references them."""
+        with self._lock:
+            self._root()
+            for digest in self._jobs.pop(job_id, []):
+                if not any(digest in digests for digests in self._jobs.values()):
+                    self._drop(digest)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._root()
+            for digest in list(self._entries):
+                self._drop(digest)
+            self._jobs.clear()
+
+    def __contains__(self, digest: object) -> bool:
+        with self._lock:
+            self._root()
+            return digest in self._entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._root()
+            return len(self._entries)
+
+    def _root(self) -> Path:
+        # Caller holds the lock. Creates the spool directory and adopts existing files once.
+        if self._root_path is None:
+            if self._directory is None:
+                self._root_path = new_temp_dir(prefix=f"{SPOOL_SUBDIR}-")
+            else:
+                self._directory.mkdir(parents=True, exist_ok=True)
+                self._root_path = self._directory / SPOOL_SUBDIR
+        if not self._loaded:
+            ensure_directory(self._root_path, 0o700)
+            self._adopt(self._root_path)
+            self._loaded = True
+        return self._root_path
+
+    def _adopt(self, root: Path) -> None:
+        found: list[tuple[float, SpoolEntry]] = []
+        for path in root.iterdir():
+            match = _SPOOL_NAME.fullmatch(path.name)
+            if match is None:
+                if _PARTIAL_NAME.fullmatch(path.name):
+                    path.unlink(missing_ok=True)  # Left behind by an interrupted write.
+                continue
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entry = SpoolEntry(digest=match["digest"], path=path, size=stat.st_size)
+            found.append((stat.st_mtime, entry))
+        for used_at, entry in sorted(found, key=lambda item: item[0]):
+            self._entries[entry.digest] = (used_at, entry)
+            self._total_bytes += entry.size
+        self._evict(self._clock(), keep=None)
+
+    def _write_partial(self, root: Path, chunks: Iterable[Buffer]) -> tuple[str, int, str]:
+        hasher = hashlib.sha256()
+        size = 0
+        handle, partial = tempfile.mkstemp(dir=root, prefix=".", suffix=".tmp")  # 0o600
+        try:
+            with os.fdopen(handle, "wb") as file:
+                for chunk in chunks:
+                    view = memoryview(chunk)
+                    hasher.update(view)
+                    size += view.nbytes
+                    if size > self._max_bytes:
+                        raise ValueError(
+                            f"artifact exceeds the spool budget of {self._max_bytes} bytes"
+                        )
+                    file.write(view)
+        except BaseException:
+            Path(partial).unlink(missing_ok=True)
+            raise
+        return hasher.hexdigest(), size, partial
+
+    def _touch(self, digest: str, now: float) -> SpoolEntry | None:
+        slot = self._entries.get(digest)
+        if slot is None:
+            return None
+        used_at, entry = slot
+        if now - used_at > self._ttl or not entry.path.exists():
+            self._drop(digest)
+            return None
+        try:
+            os.utime(entry.path, (now, now))
+        except OSError:
+            pass
+        self._entries[digest] = (now, entry)
+        self._entries.move_to_end(digest)
+        return entry
+
+    def _drop(self, digest: str) -> None:
+        slot = self._entries.pop(digest, None)
+        if slot is not None:
+            try:
+                slot[1].path.unlink(missing_ok=True)
+            except OSError:
+                # e.g. Windows refuses to delete a file that is still memory-mapped; the file
+                # leaves the budget now and is adopted again when the spool next starts.
+                pass
+            self._total_bytes -= slot[1].size
+
+    def _evict(self, now: float, *, keep: str | None) -> None:
+        # Pinned entries may hold the spool over budget until they are released.
+        for digest, (used_at, _) in list(self._entries.items()):
+            if now - used_at > self._ttl and digest != keep and digest not in self._pins:
+                self._drop(digest)
+        for digest in list(self._entries):
+            if self._total_bytes <= self._max_bytes:
+                break
+            if digest != keep and digest not in self._pins:
+                self._drop(digest)
+
+
+_shared_spools: dict[tuple[str | None, int, float], ArtifactSpool] = {}
+_shared_spools_lock = threading.Lock()
+
+
+def get_shared_artifact_spool(config: RunpodConfig) -> ArtifactSpool:
+    """Return the process-wide spool for the spool settings in ``config``."""
+    settings = (config.spool_dir, config.spool_max_bytes, config.spool_ttl_seconds)
+    with _shared_spools_lock:
+        spool = _shared_spools.get(settings)
+        if spool is None:
+            spool = ArtifactSpool.from_config(config)
+            _shared_spools[settings] = spool
+        return spool
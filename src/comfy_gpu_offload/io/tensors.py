@@ -0,0 +1,169 @@
+"""Compact binary transfer of tensors (e.g. latents) as ``TensorPayload`` entries.
+
+Tensors travel as their raw little-endian bytes with dtype and shape alongside, optionally
+downcast (float32 to float16 halves a latent) and zlib-compressed, instead of being
+quantized to 8-bit images and PNG-encoded. numpy is required; torch tensors are accepted and
+returned when torch is installed.
+"""
+
+import binascii
+import importlib
+import math
+import zlib
+from collections.abc import Mapping
+from typing import Any, cast
+
+from comfy_gpu_offload.workflow import json_codec
+from comfy_gpu_offload.workflow.payload import TENSOR_DTYPES, TensorPayload
+
+OUTPUT_TENSORS_KEY = "tensors"
+LATENT_SAMPLES_KEY = "samples"
+DEFAULT_COMPRESS_LEVEL = 1
+MAX_TENSOR_BYTES = 4 * 1024**3
+
+
+class TensorPayloadError(ValueError):
+    """Raised when a tensor cannot be encoded or a tensor payload is malformed."""
+
+
+def _as_numpy(tensor: Any) -> Any:
+    import numpy as np
+
+    if hasattr(tensor, "detach"):
+        tensor = tensor.detach().cpu()
+        if str(tensor.dtype) == "torch.bfloat16":
+            tensor = tensor.float()  # numpy has no bfloat16
+        tensor = tensor.numpy()
+    return np.asarray(tensor)
+
+
+def to_torch(array: Any) -> Any:
+    """Share a numpy array's memory with a torch tensor when torch is installed."""
+    try:
+        torch = importlib.import_module("torch")
+    except ImportError:
+        return array
+    return torch.from_numpy(array)
+
+
+def encode_tensor(
+    name: str,
+    tensor: Any,
+    *,
+    dtype: str | None = None,
+    compress: bool = False,
+    compress_level: int = DEFAULT_COMPRESS_LEVEL,
+) -> TensorPayload:
+    """Encode an array or torch tensor, optionally cast to ``dtype`` and zlib-compressed.
+
+    ``compress_level`` 1 keeps compression cheap; float latents rarely shrink much further.
+    """
+    import numpy as np
+
+    array = _as_numpy(tensor)
+    source = array.dtype.name
+    target = dtype or source
+    if source not in TENSOR_DTYPES or target not in TENSOR_DTYPES:
+        raise TensorPayloadError(f"tensor {name!r}: unsupported dtype {source} -> {target}")
+    array = np.ascontiguousarray(array, dtype=np.dtype(target).newbyteorder("<"))
+    raw: bytes | memoryview = memoryview(array).cast("B")
+    if compress:
+        raw = zlib.compress(raw, compress_level)
+    payload: TensorPayload = {
+        "name": name,
+        "dtype": target,
+        "shape": list(array.shape),
+        "data": binascii.b2a_base64(raw, newline=False).decode("ascii"),
+    }
+    if compress:
+        payload["encoding"] = "zlib"
+    if target != source:
+        payload["source_dtype"] = source
+    return payload
+
+
+def decode_tensor(payload: Mapping[str, Any], *, restore_dtype: bool = True) -> Any:
+    """Decode a ``TensorPayload`` into a writable numpy array.
+
+    The byte count is checked against dtype and shape, and decompression is capped at that
+    size; tensors larger than ``MAX_TENSOR_BYTES`` are refused. With ``restore_dtype`` a
+    downcast tensor is cast back to its ``source_dtype``.
+    """
+    import numpy as np
+
+    name = payload.get("name")
+    dtype = payload.get("dtype")
+    shape = payload.get("shape")
+    if dtype not in TENSOR_DTYPES:
+        raise TensorPayloadError(f"tensor {name!r} has an invalid dtype {dtype!r}")
+    if not isinstance(shape, list | tuple) or not all(
+        isinstance(dim, int) and not isinstance(dim, bool) and dim >= 0 for dim in shape
+    ):
+        raise TensorPayloadError(f"tensor {name!r} shape must be a list of non-negative ints")
+    data = payload.get("data", "")
+    if not isinstance(data, str):
+        raise TensorPayloadError(f"tensor {name!r} data must be a base64 string")
+    item = np.dtype(dtype).newbyteorder("<")
+    expected = math.prod(shape) * item.itemsize
+    if expected > MAX_TENSOR_BYTES:
+        raise TensorPayloadError(
+            f"tensor {name!r} needs {expected} bytes; the limit is {MAX_TENSOR_BYTES}"
+        )
+    try:
+        raw = binascii.a2b_base64(data)
+        if payload.get("encoding", "raw") == "zlib":
+            inflater = zlib.decompressobj()
+            raw = inflater.decompress(raw, expected + 1)
+        elif payload.get("encoding", "raw") != "raw":
+            raise TensorPayloadError(f"tensor {name!r} has an unknown encoding")
+    except (binascii.Error, zlib.error) as exc:
+        raise TensorPayloadError(f"tensor {name!r} data could not be decoded: {exc}") from exc
+    if len(raw) != expected:
+        raise TensorPayloadError(
+            f"tensor {name!r} has {len(raw)} bytes; dtype and shape need {expected}"
+        )
+    array = np.frombuffer(raw, dtype=item).reshape(shape)
+    source = payload.get("source_dtype")
+    if restore_dtype and source in TENSOR_DTYPES and source != dtype:
+        return array.astype(source)
+    return array.copy() if not array.flags.writeable else array
+
+
+def encode_latent(
+    latent: Mapping[str, Any],
+    *,
+    name: str = "latent",
+    dtype: str | None = "float16",
+    compress: bool = True,
+) -> TensorPayload:
+    """Encode a ComfyUI ``LATENT`` (its ``samples`` tensor), as float16 by default."""
+    samples = latent.get(LATENT_SAMPLES_KEY)
+    if samples is None:
+        raise TensorPayloadError(f"latent {name!r} has no {LATENT_SAMPLES_KEY!r} tensor")
+    return encode_tensor(name, samples, dtype=dtype, compress=compress)
+
+
+def decode_latent(payload: Mapping[str, Any]) -> dict[str, Any]:
+    """Rebuild a ComfyUI ``LATENT`` from ``encode_latent`` output."""
+    return {LATENT_SAMPLES_KEY: to_torch(decode_tensor(payload))}
+
+
+def extract_output_tensors(
+    output: Mapping[str, Any] | str | bytes, *, key: str = OUTPUT_TENSORS_KEY
+) -> dict[str, TensorPayload]:
+    """Tensor payloads listed under ``output[key]``, by name."""
+    if isinstance(output, str | bytes):
+        try:
+            output = json_codec.loads(output)
+        except json_codec.JSONDecodeError as exc:
+            raise TensorPayloadError(f"output is not valid JSON: {exc.msg}") from exc
+    if not isinstance(output, Mapping):
+        raise TensorPayloadError("output must be a JSON object")
+    entries = output.get(key) or []
+    if not isinstance(entries, list):
+        raise TensorPayloadError(f"output {key!r} must be a list")
+    return {
+        str(entry["name"]): cast(TensorPayload, entry)
+        for entry in entries
+        if isinstance(entry, Mapping) and isinstance(entry.get("name"), str)
+    }
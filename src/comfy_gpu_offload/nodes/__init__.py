@@ -1,13 +1,37 @@
 """ComfyUI node definitions for RunPod offload."""
 
+from .runpod_decode_images import RunPodDecodeImages
+from .runpod_decode_latent import RunPodDecodeLatent
 from .runpod_remote_execute import RunPodRemoteExecute
+from .runpod_submit_await import RunPodAwait, RunpodJobHandle, RunPodSubmit
+from .runpod_sweep import RunPodSweep
 
 NODE_CLASS_MAPPINGS: dict[str, type] = {
     "RunPodRemoteExecute": RunPodRemoteExecute,
+    "RunPodSubmit": RunPodSubmit,
+    "RunPodAwait": RunPodAwait,
+    "RunPodSweep": RunPodSweep,
+    "RunPodDecodeImages": RunPodDecodeImages,
+    "RunPodDecodeLatent": RunPodDecodeLatent,
 }
 
 NODE_DISPLAY_NAME_MAPPINGS: dict[str, str] = {
     "RunPodRemoteExecute": "RunPod Remote Execute",
+    "RunPodSubmit": "RunPod Submit",
+    "RunPodAwait": "RunPod Await",
+    "RunPodSweep": "RunPod Sweep",
+    "RunPodDecodeImages": "RunPod Decode Images",
+    "RunPodDecodeLatent": "RunPod Decode Latent",
 }
 
-__all__ = ["NODE_CLASS_MAPPINGS", "NODE_DISPLAY_NAME_MAPPINGS", "RunPodRemoteExecute"]
+__all__ = [
+    "NODE_CLASS_MAPPINGS",
+    "NODE_DISPLAY_NAME_MAPPINGS",
+    "RunPodAwait",
+    "RunPodDecodeImages",
+    "RunPodDecodeLatent",
+    "RunPodRemoteExecute",
+    "RunPodSubmit",
+    "RunPodSweep",
+    "RunpodJobHandle",
+]
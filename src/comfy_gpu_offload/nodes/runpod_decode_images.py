@@ -0,0 +1,79 @@
+"""Decode images from a job's ``output_json`` into a ComfyUI ``IMAGE`` batch."""
+
+from collections.abc import Callable
+from typing import Any
+
+from comfy_gpu_offload.config import ConfigError, RunpodConfig, load_runpod_config_cached
+from comfy_gpu_offload.io import (
+    OUTPUT_IMAGES_KEY,
+    ArtifactSpool,
+    decode_output_images,
+    get_shared_artifact_spool,
+    memmap_output_images,
+    to_comfy_image,
+)
+
+
+class RunPodDecodeImages:
+    """Decode the base64 images in a RunPod job output in parallel."""
+
+    CATEGORY = "RunPod"
+    FUNCTION = "decode"
+    RETURN_TYPES = ("IMAGE",)
+    RETURN_NAMES = ("images",)
+
+    spool_factory: Callable[[RunpodConfig], ArtifactSpool] = staticmethod(get_shared_artifact_spool)
+
+    @classmethod
+    def INPUT_TYPES(cls) -> dict[str, Any]:  # noqa: N802 (ComfyUI requires this name)
+        return {
+            "required": {"output_json": ("STRING", {"forceInput": True})},
+            "optional": {
+                "output_key": (
+                    "STRING",
+                    {
+                        "default": OUTPUT_IMAGES_KEY,
+                        "tooltip": "Key of the image list in the job output.",
+                    },
+                ),
+                "memory_map": (
+                    "BOOLEAN",
+                    {
+                        "default": False,
+                        "tooltip": "Write frames to the artifact spool and memory-map them, so "
+                        "long sequences are paged in only as nodes read them.",
+                    },
+                ),
+                "job_id": (
+                    "STRING",
+                    {
+                        "default": "",
+                        "tooltip": "Index spooled frames under this job id.",
+                    },
+                ),
+            },
+        }
+
+    def decode(
+        self,
+        output_json: str,
+        output_key: str = OUTPUT_IMAGES_KEY,
+        memory_map: bool = False,
+        job_id: str = "",
+    ) -> tuple[Any]:
+        key = output_key or OUTPUT_IMAGES_KEY
+        try:
+            if not memory_map:
+                return (decode_output_images(output_json, key=key),)
+            try:
+                config = load_runpod_config_cached()
+            except ConfigError as exc:
+                raise RuntimeError(f"RunPod configuration error: {exc}") from exc
+            batch = memmap_output_images(
+                output_json, self.spool_factory(config), job_id=job_id or None, key=key
+            )
+            return (to_comfy_image(batch),)
+        except ImportError as exc:
+            raise RuntimeError(f"Decoding images requires numpy: {exc}") from exc
+        except ValueError as exc:
+            raise RuntimeError(f"Failed to decode output images: {exc}") from exc
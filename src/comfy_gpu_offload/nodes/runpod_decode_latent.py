@@ -0,0 +1,38 @@
+"""Decode a binary tensor from a job's ``output_json`` into a ComfyUI ``LATENT``."""
+
+from typing import Any
+
+from comfy_gpu_offload.io import OUTPUT_TENSORS_KEY, decode_latent, extract_output_tensors
+
+
+class RunPodDecodeLatent:
+    """Rebuild a latent a worker returned under ``tensors`` without an image round trip."""
+
+    CATEGORY = "RunPod"
+    FUNCTION = "decode"
+    RETURN_TYPES = ("LATENT",)
+    RETURN_NAMES = ("latent",)
+
+    @classmethod
+    def INPUT_TYPES(cls) -> dict[str, Any]:  # noqa: N802 (ComfyUI requires this name)
+        return {
+            "required": {"output_json": ("STRING", {"forceInput": True})},
+            "optional": {
+                "tensor_name": (
+                    "STRING",
+                    {"default": "latent", "tooltip": "Name of the tensor in the job output."},
+                ),
+            },
+        }
+
+    def decode(self, output_json: str, tensor_name: str = "latent") -> tuple[dict[str, Any]]:
+        try:
+            tensors = extract_output_tensors(output_json, key=OUTPUT_TENSORS_KEY)
+            payload = tensors.get(tensor_name)
+            if payload is None:
+                raise ValueError(f"output has no tensor named {tensor_name!r}")
+            return (decode_latent(payload),)
+        except ImportError as exc:
+            raise RuntimeError(f"Decoding tensors requires numpy: {exc}") from exc
+        except ValueError as exc:
+            raise RuntimeError(f"Failed to decode latent: {exc}") from exc
@@ -1,26 +1,120 @@
 """ComfyUI node for offloading workflows to RunPod."""
 
-import json
+import logging
 from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
 from typing import Any, cast
 
-from comfy_gpu_offload.api import RunpodClient
-from comfy_gpu_offload.config import ConfigError, RunpodConfig, load_runpod_config
+from comfy_gpu_offload.api import (
+    AdaptivePollSchedule,
+    JobPoller,
+    JobStatus,
+    RunpodClient,
+    RunpodJobError,
+    RunpodStatus,
+    SubmissionCoalescer,
+    get_shared_client,
+    get_shared_coalescer,
+    get_shared_poller,
+)
+from comfy_gpu_offload.config import ConfigError, RunpodConfig, load_runpod_config_cached
+from comfy_gpu_offload.io import (
+    CODECS,
+    AssetTransferError,
+    AssetUploader,
+    CachedResult,
+    ImageRegistry,
+    ResultCache,
+    dedupe_image_payloads,
+    encode_image_payloads,
+    encode_latent,
+    get_shared_asset_uploader,
+    get_shared_image_registry,
+    get_shared_result_cache,
+    result_cache_key,
+    upload_image_payloads,
+)
+from comfy_gpu_offload.io.image_registry import IMAGE_BLOB_MISSING_CODE
 from comfy_gpu_offload.workflow import (
     BuildPayloadError,
+    EncodedPayload,
     ImagePayload,
     RunpodInputPayload,
+    TemplateRegistry,
+    TensorPayload,
     WorkflowLoadError,
+    WorkflowTemplate,
     build_run_payload,
-    ensure_payload_size,
+    content_hash,
+    encode_payload,
     fetch_workflow_from_url,
-    load_workflow_from_path,
+    get_shared_template_registry,
+    json_codec,
+    load_workflow_cached,
     validate_workflow_schema,
 )
+from comfy_gpu_offload.workflow import prune_workflow as prune
+from comfy_gpu_offload.workflow.loader import DEFAULT_MAX_PAYLOAD_BYTES
+from comfy_gpu_offload.workflow.prune import DEFAULT_OUTPUT_NODE_TYPES
+from comfy_gpu_offload.workflow.templates import TEMPLATE_MISSING_CODE
+
+logger = logging.getLogger(__name__)
+
+SUBMIT_MODES = ("auto", "run", "runsync")
+LATENT_DTYPES = ("float16", "float32")
+# Worker error codes after which the job is resent with the full workflow and inline images.
+RESEND_IN_FULL_CODES = frozenset({TEMPLATE_MISSING_CODE, IMAGE_BLOB_MISSING_CODE})
+# Payloads this small carry no images and only a modest graph; /runsync saves a poll round trip.
+RUNSYNC_AUTO_MAX_PAYLOAD_BYTES = 64_000
+
+
+@dataclass(frozen=True, slots=True)
+class RunInputs:
+    """Node inputs parsed and validated once, before any payload is built from them."""
+
+    config: RunpodConfig
+    workflow: dict[str, Any]
+    params: dict[str, Any]
+    images: list[ImagePayload]
+    tensors: list[TensorPayload]
+
+
+@dataclass(frozen=True, slots=True)
+class PreparedRun:
+    """A validated payload ready to submit, plus the config it was sized against.
+
+    ``registers`` and ``image_digests`` are recorded as held by the worker once the job
+    succeeds; ``fallback`` rebuilds the payload in full if the worker reports a missing template
+    or image blob.
+    """
+
+    config: RunpodConfig
+    encoded: EncodedPayload
+    submit_mode: str = "auto"
+    registers: WorkflowTemplate | None = None
+    image_digests: tuple[str, ...] = ()
+    fallback: "Callable[[], PreparedRun] | None" = None
+
+    @property
+    def payload(self) -> RunpodInputPayload:
+        return cast(RunpodInputPayload, self.encoded.payload)
 
 
-def _default_client_factory(config: RunpodConfig) -> RunpodClient:
-    return RunpodClient(config)
+def _use_runsync(
+    submit_mode: str,
+    *,
+    payload_bytes: int,
+    expected_seconds: float,
+    wait_seconds: float,
+) -> bool:
+    if submit_mode == "runsync":
+        return True
+    if submit_mode == "run":
+        return False
+    if expected_seconds:
+        return expected_seconds <= wait_seconds
+    return payload_bytes <= RUNSYNC_AUTO_MAX_PAYLOAD_BYTES
 
 
 class RunPodRemoteExecute:
@@ -28,11 +122,23 @@ class RunPodRemoteExecute:
 
     CATEGORY = "RunPod"
     FUNCTION = "execute"
-    RETURN_TYPES = ("STRING", "STRING", "STRING")  # status, job_id, output_json
-    RETURN_NAMES = ("status", "job_id", "output_json")
+    RETURN_TYPES: tuple[str, ...] = ("STRING", "STRING", "STRING")  # status, job_id, output_json
+    RETURN_NAMES: tuple[str, ...] = ("status", "job_id", "output_json")
     OUTPUT_NODE = True
 
-    client_factory: Callable[[RunpodConfig], RunpodClient] = _default_client_factory
+    client_factory: Callable[[RunpodConfig], RunpodClient] = staticmethod(get_shared_client)
+    poller_factory: Callable[[], JobPoller] = staticmethod(get_shared_poller)
+    coalescer_factory: Callable[[], SubmissionCoalescer] = staticmethod(get_shared_coalescer)
+    result_cache_factory: Callable[[RunpodConfig], ResultCache] = staticmethod(
+        get_shared_result_cache
+    )
+    template_registry_factory: Callable[[], TemplateRegistry] = staticmethod(
+        get_shared_template_registry
+    )
+    asset_uploader_factory: Callable[[RunpodConfig], AssetUploader] = staticmethod(
+        get_shared_asset_uploader
+    )
+    image_registry_factory: Callable[[], ImageRegistry] = staticmethod(get_shared_image_registry)
     max_payload_bytes: int | None = None  # override for tests; defaults to loader default
 
     @classmethod
@@ -90,6 +196,89 @@ class RunPodRemoteExecute:
                     },
                 ),
                 "timeout_seconds": ("FLOAT", {"default": 900.0, "min": 1.0, "max": 3600.0}),
+                "expected_seconds": (
+                    "FLOAT",
+                    {
+                        "default": 0.0,
+                        "min": 0.0,
+                        "max": 3600.0,
+                        "tooltip": "Typical run time; polling tightens near it (0 = unknown).",
+                    },
+                ),
+                "submit_mode": (
+                    list(SUBMIT_MODES),
+                    {
+                        "default": "auto",
+                        "tooltip": "auto uses /runsync for short or small jobs, /run otherwise.",
+                    },
+                ),
+                "use_result_cache": (
+                    "BOOLEAN",
+                    {
+                        "default": True,
+                        "tooltip": "Reuse the output of an identical completed run instead of "
+                        "submitting a new job.",
+                    },
+                ),
+                "prune_workflow": (
+                    "BOOLEAN",
+                    {
+                        "default": False,
+                        "tooltip": "Drop nodes that feed no output and editor-only layout data "
+                        "before upload.",
+                    },
+                ),
+                "output_node_types": (
+                    "STRING",
+                    {
+                        "multiline": False,
+                        "default": "",
+                        "placeholder": "VHS_VideoCombine, MyCustomSave",
+                        "tooltip": "Custom output node types (comma-separated) that "
+                        "prune_workflow keeps, on top of the built-in save/preview nodes.",
+                    },
+                ),
+                "use_workflow_template": (
+                    "BOOLEAN",
+                    {
+                        "default": False,
+                        "tooltip": "Send the workflow once, then only changed widget values. "
+                        "The worker must resolve templates.",
+                    },
+                ),
+                "upload_assets": (
+                    "BOOLEAN",
+                    {
+                        "default": False,
+                        "tooltip": "Upload images to RUNPOD_ASSET_BUCKET and send presigned URLs "
+                        "instead of base64.",
+                    },
+                ),
+                "image": ("IMAGE", {"tooltip": "Images appended to images_json as image_<n>."}),
+                "image_codec": (
+                    list(CODECS),
+                    {
+                        "default": "png_fast",
+                        "tooltip": "Encoding for the image input; png_fast trades a slightly "
+                        "larger file for much faster compression.",
+                    },
+                ),
+                "latent": ("LATENT", {"tooltip": "Latent sent as the binary tensor 'latent'."}),
+                "latent_dtype": (
+                    list(LATENT_DTYPES),
+                    {
+                        "default": "float16",
+                        "tooltip": "float16 halves the transfer; the worker restores float32.",
+                    },
+                ),
+                "dedupe_images": (
+                    "BOOLEAN",
+                    {
+                        "default": False,
+                        "tooltip": "Send images the worker already holds as sha256 references. "
+                        "The worker must resolve image refs.",
+                    },
+                ),
             },
         }
 
@@ -103,68 +292,364 @@ class RunPodRemoteExecute:
         workflow_path: str = "",
         max_payload_bytes: int | None = 9_500_000,
         workflow_url: str = "",
+        expected_seconds: float = 0.0,
+        submit_mode: str = "auto",
+        use_result_cache: bool = True,
+        prune_workflow: bool = False,
+        output_node_types: str = "",
+        use_workflow_template: bool = False,
+        upload_assets: bool = False,
+        dedupe_images: bool = False,
+        image: Any = None,
+        image_codec: str = "png_fast",
+        latent: Any = None,
+        latent_dtype: str = "float16",
     ) -> tuple[str, str, str]:
         if not use_runpod:
             return ("disabled", "", "{}")
 
-        if workflow_url.strip():
-            workflow = self._load_workflow_from_url(workflow_url.strip(), max_payload_bytes)
-        elif workflow_path.strip():
+        prepared = self._prepare_run(
+            workflow_json,
+            params_json=params_json,
+            images_json=images_json,
+            workflow_path=workflow_path,
+            max_payload_bytes=max_payload_bytes,
+            workflow_url=workflow_url,
+            submit_mode=submit_mode,
+            prune_workflow=prune_workflow,
+            output_node_types=output_node_types,
+            use_workflow_template=use_workflow_template,
+            upload_assets=upload_assets,
+            dedupe_images=dedupe_images,
+            image=image,
+            image_codec=image_codec,
+            latent=latent,
+            latent_dtype=latent_dtype,
+        )
+        return self._run_prepared(
+            prepared,
+            timeout_seconds=timeout_seconds,
+            expected_seconds=expected_seconds,
+            use_result_cache=use_result_cache,
+        )
+
+    def _prepare_run(
+        self,
+        workflow_json: str,
+        *,
+        params_json: str = "{}",
+        images_json: str = "[]",
+        workflow_path: str = "",
+        max_payload_bytes: int | None = 9_500_000,
+        workflow_url: str = "",
+        submit_mode: str = "auto",
+        prune_workflow: bool = False,
+        output_node_types: str = "",
+        use_workflow_template: bool = False,
+        upload_assets: bool = False,
+        dedupe_images: bool = False,
+        image: Any = None,
+        image_codec: str = "png_fast",
+        latent: Any = None,
+        latent_dtype: str = "float16",
+    ) -> PreparedRun:
+        """Load, validate and size-check everything needed to submit; no network calls to RunPod."""
+        inputs = self._load_inputs(
+            workflow_json,
+            params_json=params_json,
+            images_json=images_json,
+            workflow_path=workflow_path,
+            max_payload_bytes=max_payload_bytes,
+            workflow_url=workflow_url,
+            submit_mode=submit_mode,
+            prune_workflow=prune_workflow,
+            output_node_types=output_node_types,
+            upload_assets=upload_assets,
+            image=image,
+            image_codec=image_codec,
+            latent=latent,
+            latent_dtype=latent_dtype,
+        )
+        config, workflow = inputs.config, inputs.workflow
+
+        inline_images = inputs.images
+        sent_images = inline_images
+        image_digests: tuple[str, ...] = ()
+        if dedupe_images and inline_images and not upload_assets:
+            # Uploaded assets are already deduplicated per bucket by the uploader.
+            try:
+                deduped = dedupe_image_payloads(
+                    self.image_registry_factory(), config.endpoint_id, inline_images
+                )
+            except ValueError as exc:
+                raise RuntimeError(f"Invalid images_json: {exc}") from exc
+            inline_images, sent_images = deduped.inline, deduped.images
+            image_digests = deduped.digests
+
+        def prepare(
+            template: WorkflowTemplate | None = None, *, inline: bool = False
+        ) -> PreparedRun:
+            try:
+                payload = build_run_payload(
+                    workflow=workflow,
+                    images=inline_images if inline else sent_images,
+                    params=inputs.params,
+                    tensors=inputs.tensors,
+                    template=template,
+                    register_template=use_workflow_template and template is None,
+                )
+            except BuildPayloadError as exc:
+                raise RuntimeError(f"Invalid payload: {exc}") from exc
+            registers = None
+            if "workflow_hash" in payload and template is None:
+                registers = WorkflowTemplate(hash=payload["workflow_hash"], workflow=workflow)
+            return PreparedRun(
+                config=config,
+                encoded=self._encode_payload(payload, max_payload_bytes),
+                submit_mode=submit_mode,
+                registers=registers,
+                image_digests=image_digests,
+                fallback=(
+                    None
+                    if inline or (template is None and sent_images is inline_images)
+                    else lambda: prepare(inline=True)
+                ),
+            )
+
+        if use_workflow_template:
+            template = self.template_registry_factory().lookup(config.endpoint_id, workflow)
+            return prepare(template)
+        return prepare()
+
+    def _load_inputs(
+        self,
+        workflow_json: str,
+        *,
+        params_json: str = "{}",
+        images_json: str = "[]",
+        workflow_path: str = "",
+        max_payload_bytes: int | None = 9_500_000,
+        workflow_url: str = "",
+        submit_mode: str = "auto",
+        prune_workflow: bool = False,
+        output_node_types: str = "",
+        upload_assets: bool = False,
+        image: Any = None,
+        image_codec: str = "png_fast",
+        latent: Any = None,
+        latent_dtype: str = "float16",
+    ) -> RunInputs:
+        """Parse and validate node inputs; encodes image/latent sockets and uploads assets."""
+        if workflow_path.strip() and not workflow_url.strip():
+            # Cached by (path, mtime, size) and validated when first loaded.
             workflow = self._load_workflow_from_path(workflow_path.strip())
         else:
-            workflow = self._parse_json_mapping(workflow_json, "workflow_json")
-        try:
-            validate_workflow_schema(workflow)
-        except ValueError as exc:
-            raise RuntimeError(f"Invalid workflow schema: {exc}") from exc
+            if workflow_url.strip():
+                workflow = self._load_workflow_from_url(workflow_url.strip(), max_payload_bytes)
+            else:
+                workflow = self._parse_json_mapping(workflow_json, "workflow_json")
+            try:
+                validate_workflow_schema(workflow, workflow_hash=content_hash(workflow))
+            except ValueError as exc:
+                raise RuntimeError(f"Invalid workflow schema: {exc}") from exc
+        if prune_workflow:
+            extra_types = {name.strip() for name in output_node_types.split(",") if name.strip()}
+            pruned = prune(workflow, output_node_types=DEFAULT_OUTPUT_NODE_TYPES | extra_types)
+            removed = set(pruned.removed_node_ids)
+            removed_types = sorted(
+                {str(node.get("type")) for node in workflow["nodes"] if node.get("id") in removed}
+            )
+            logger.info(
+                "prune_workflow removed %d node(s) (types: %s) and saved %d bytes; "
+                "list custom output nodes in output_node_types to keep them",
+                len(removed),
+                ", ".join(removed_types) or "none",
+                pruned.bytes_saved,
+            )
+            workflow = pruned.workflow
 
         params = self._parse_json_mapping(params_json, "params_json", allow_empty=True)
         images = self._parse_json_sequence(images_json, "images_json")
+        if image is not None:
+            if image_codec not in CODECS:
+                raise RuntimeError(f"image_codec must be one of {', '.join(CODECS)}")
+            try:
+                images.extend(
+                    cast(
+                        list[dict[str, Any]],
+                        encode_image_payloads(image, codec=CODECS[image_codec]),
+                    )
+                )
+            except (ImportError, ValueError) as exc:
+                raise RuntimeError(f"Failed to encode image input: {exc}") from exc
+        tensors: list[TensorPayload] = []
+        if latent is not None:
+            if latent_dtype not in LATENT_DTYPES:
+                raise RuntimeError(f"latent_dtype must be one of {', '.join(LATENT_DTYPES)}")
+            try:
+                tensors.append(encode_latent(latent, dtype=latent_dtype))
+            except (ImportError, ValueError) as exc:
+                raise RuntimeError(f"Failed to encode latent input: {exc}") from exc
 
         try:
-            config = load_runpod_config()
+            config = load_runpod_config_cached()
         except ConfigError as exc:
             raise RuntimeError(f"RunPod configuration error: {exc}") from exc
 
-        payload: RunpodInputPayload
+        if submit_mode not in SUBMIT_MODES:
+            raise RuntimeError(f"submit_mode must be one of {', '.join(SUBMIT_MODES)}")
+
+        if upload_assets and images:
+            try:
+                images = cast(
+                    list[dict[str, Any]],
+                    upload_image_payloads(self.asset_uploader_factory(config), images),
+                )
+            except (AssetTransferError, ConfigError) as exc:
+                raise RuntimeError(f"Asset upload failed: {exc}") from exc
+
+        return RunInputs(
+            config=config,
+            workflow=workflow,
+            params=params,
+            images=cast(list[ImagePayload], images),
+            tensors=tensors,
+        )
+
+    def _encode_payload(
+        self, payload: RunpodInputPayload, max_payload_bytes: int | None
+    ) -> EncodedPayload:
+        # Encoded once: the same bytes are size-checked, hashed for the cache and sent.
+        limit = max_payload_bytes if max_payload_bytes else self.max_payload_bytes
         try:
-            payload = build_run_payload(
-                workflow=workflow,
-                images=cast(list[ImagePayload], images),
-                params=params,
-            )
-            limit = max_payload_bytes if max_payload_bytes else self.max_payload_bytes
-            if limit is not None:
-                ensure_payload_size(payload, max_bytes=limit)
-        except BuildPayloadError as exc:
-            raise RuntimeError(f"Invalid payload: {exc}") from exc
+            return encode_payload(payload, max_bytes=limit)
         except WorkflowLoadError as exc:
             raise RuntimeError(f"Payload too large: {exc}") from exc
 
+    def _run_prepared(
+        self,
+        prepared: PreparedRun,
+        *,
+        timeout_seconds: float | None = None,
+        expected_seconds: float = 0.0,
+        use_result_cache: bool = True,
+    ) -> tuple[str, str, str]:
+        """Serve from cache or submit, then block until the job completes."""
+        try:
+            result = self._submit_and_wait(
+                prepared,
+                timeout_seconds=timeout_seconds,
+                expected_seconds=expected_seconds,
+                use_result_cache=use_result_cache,
+            )
+        except RunpodJobError as exc:
+            if prepared.fallback is None or exc.error_code not in RESEND_IN_FULL_CODES:
+                raise
+            # The worker that took the job lacked a template or image (cold start, another
+            # worker, eviction): forget what was referenced and resend in full, which
+            # registers it again.
+            endpoint_id = prepared.config.endpoint_id
+            payload = prepared.payload
+            if "workflow_hash" in payload and "workflow" not in payload:
+                self.template_registry_factory().forget(endpoint_id, payload["workflow_hash"])
+            self.image_registry_factory().discard(endpoint_id, prepared.image_digests)
+            result = self._submit_and_wait(
+                prepared.fallback(),
+                timeout_seconds=timeout_seconds,
+                expected_seconds=expected_seconds,
+                use_result_cache=use_result_cache,
+            )
+        return result
+
+    def _submit_and_wait(
+        self,
+        prepared: PreparedRun,
+        *,
+        timeout_seconds: float | None,
+        expected_seconds: float,
+        use_result_cache: bool,
+    ) -> tuple[str, str, str]:
+        config = prepared.config
+        encoded = prepared.encoded
+        cache_key = result_cache_key(config, encoded)
+        cache = self.result_cache_factory(config) if use_result_cache else None
+        if cache is not None:
+            cached = cache.get(cache_key)
+            if cached is not None:
+                return (RunpodStatus.COMPLETED, cached.job_id, cached.output_json)
+
         client = self.client_factory(config)
 
-        job_id = client.submit_job(payload)
-        status = client.poll_job(job_id, timeout_seconds=timeout_seconds)
+        use_runsync = _use_runsync(
+            prepared.submit_mode,
+            payload_bytes=encoded.size,
+            expected_seconds=expected_seconds,
+            wait_seconds=config.runsync_wait_seconds,
+        )
+
+        def submit() -> JobStatus:
+            # /runsync answers terminal jobs inline; longer ones fall back to the shared poller.
+            if use_runsync:
+                return client.submit_job_sync(encoded)
+            return JobStatus(job_id=client.submit_job(encoded), status=RunpodStatus.IN_QUEUE)
+
+        # Identical payloads already in flight join that job instead of taking another worker.
+        status = self.coalescer_factory().run(
+            cache_key,
+            submit,
+            lambda job_id: self._wait_for_job(
+                client, config, job_id, timeout_seconds, expected_seconds
+            ),
+        )
+        job_id = status.job_id
 
-        output_json = json.dumps(status.output or {})
+        output_json = json_codec.dumps_str(status.output or {})
+        if status.status == RunpodStatus.COMPLETED:
+            if cache is not None:
+                cache.put(cache_key, CachedResult(job_id=job_id, output_json=output_json))
+            if prepared.registers is not None:
+                self.template_registry_factory().remember(config.endpoint_id, prepared.registers)
+            if prepared.image_digests:
+                self.image_registry_factory().add(config.endpoint_id, prepared.image_digests)
         return (status.status, job_id, output_json)
 
+    def _wait_for_job(
+        self,
+        client: RunpodClient,
+        config: RunpodConfig,
+        job_id: str,
+        timeout_seconds: float | None,
+        expected_seconds: float | None = None,
+    ) -> JobStatus:
+        # One shared scheduling loop tracks every in-flight job instead of a loop per execute.
+        return self.poller_factory().wait(
+            client,
+            job_id,
+            timeout_seconds=timeout_seconds or config.max_poll_duration_seconds,
+            schedule=AdaptivePollSchedule.from_config(
+                config, expected_duration_seconds=expected_seconds or None
+            ),
+        )
+
     def _load_workflow_from_path(self, path_str: str) -> dict[str, Any]:
         try:
             path = Path(path_str)
         except OSError as exc:
             raise RuntimeError(f"Invalid workflow_path: {exc}") from exc
 
+        # The file-size guard is a stat; the full payload is size-checked once when encoded.
         try:
-            workflow = load_workflow_from_path(path)
+            loaded = load_workflow_cached(
+                path, max_bytes=self.max_payload_bytes or DEFAULT_MAX_PAYLOAD_BYTES
+            )
+        except WorkflowLoadError as exc:
+            raise RuntimeError(f"Failed to load workflow from path: {exc}") from exc
+        except ValueError as exc:
+            raise RuntimeError(f"Invalid workflow schema: {exc}") from exc
         except Exception as exc:
             raise RuntimeError(f"Failed to load workflow from path: {exc}") from exc
-
-        # Guard payload size if configured
-        max_bytes = self.max_payload_bytes
-        if max_bytes is not None:
-            ensure_payload_size({"workflow": workflow}, max_bytes=max_bytes)
-        return workflow
+        # Shallow copy: the cached mapping is shared across executions.
+        return dict(loaded.workflow)
 
     def _load_workflow_from_url(
         self, url: str, max_payload_bytes: int | None = None
@@ -183,8 +668,8 @@ class RunPodRemoteExecute:
     @staticmethod
     def _parse_json_mapping(value: str, field: str, *, allow_empty: bool = False) -> dict[str, Any]:
         try:
-            parsed = json.loads(value) if value else {}
-        except json.JSONDecodeError as exc:
+            parsed = json_codec.loads(value) if value else {}
+        except json_codec.JSONDecodeError as exc:
             raise RuntimeError(f"{field} is not valid JSON: {exc}") from exc
         if not isinstance(parsed, dict):
             raise RuntimeError(f"{field} must be a JSON object")
@@ -197,8 +682,8 @@ class RunPodRemoteExecute:
         if not value:
             return []
         try:
-            parsed = json.loads(value)
-        except json.JSONDecodeError as exc:
+            parsed = json_codec.loads(value)
+        except json_codec.JSONDecodeError as exc:
             raise RuntimeError(f"{field} is not valid JSON: {exc}") from exc
         if not isinstance(parsed, list):
             raise RuntimeError(f"{field} must be a JSON array")
@@ -0,0 +1,142 @@
+"""Split submit/await nodes so local graph branches overlap with remote GPU time."""
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
+from typing import Any
+
+from comfy_gpu_offload.nodes.runpod_remote_execute import RunPodRemoteExecute
+
+JOB_HANDLE_TYPE = "RUNPOD_JOB"
+MAX_BACKGROUND_JOBS = 32
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def _job_executor() -> ThreadPoolExecutor:
+    # Created on first submit so importing the node pack starts no threads.
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=MAX_BACKGROUND_JOBS, thread_name_prefix="runpod-job"
+            )
+        return _executor
+
+
+@dataclass(frozen=True, slots=True)
+class RunpodJobHandle:
+    """Opaque value passed from ``RunPodSubmit`` to ``RunPodAwait``."""
+
+    future: Future[tuple[str, str, str]]
+
+    @property
+    def done(self) -> bool:
+        return self.future.done()
+
+    def result(self, timeout: float | None = None) -> tuple[str, str, str]:
+        """Block for ``(status, job_id, output_json)``."""
+        return self.future.result(timeout=timeout)
+
+
+class RunPodSubmit(RunPodRemoteExecute):
+    """Validate and submit a workflow, returning a job handle without waiting for the result."""
+
+    FUNCTION = "submit"
+    RETURN_TYPES = (JOB_HANDLE_TYPE,)
+    RETURN_NAMES = ("job",)
+    OUTPUT_NODE = False
+
+    @classmethod
+    def INPUT_TYPES(cls) -> dict[str, Any]:  # noqa: N802 (ComfyUI requires this name)
+        inputs = super().INPUT_TYPES()
+        inputs["required"].pop("use_runpod", None)
+        return inputs
+
+    def submit(
+        self,
+        workflow_json: str,
+        params_json: str = "{}",
+        images_json: str = "[]",
+        timeout_seconds: float | None = None,
+        workflow_path: str = "",
+        max_payload_bytes: int | None = 9_500_000,
+        workflow_url: str = "",
+        expected_seconds: float = 0.0,
+        submit_mode: str = "auto",
+        use_result_cache: bool = True,
+        prune_workflow: bool = False,
+        output_node_types: str = "",
+        upload_assets: bool = False,
+        image: Any = None,
+        image_codec: str = "png_fast",
+        latent: Any = None,
+        latent_dtype: str = "float16",
+        dedupe_images: bool = False,
+        use_workflow_template: bool = False,
+    ) -> tuple[RunpodJobHandle]:
+        # Input problems surface here, on the submit node; the RunPod round trips run in the
+        # background and any failure is raised by RunPodAwait.
+        prepared = self._prepare_run(
+            workflow_json,
+            params_json=params_json,
+            images_json=images_json,
+            workflow_path=workflow_path,
+            max_payload_bytes=max_payload_bytes,
+            workflow_url=workflow_url,
+            submit_mode=submit_mode,
+            prune_workflow=prune_workflow,
+            output_node_types=output_node_types,
+            upload_assets=upload_assets,
+            image=image,
+            image_codec=image_codec,
+            latent=latent,
+            latent_dtype=latent_dtype,
+            dedupe_images=dedupe_images,
+            use_workflow_template=use_workflow_template,
+        )
+        future = _job_executor().submit(
+            self._run_prepared,
+            prepared,
+            timeout_seconds=timeout_seconds,
+            expected_seconds=expected_seconds,
+            use_result_cache=use_result_cache,
+        )
+        return (RunpodJobHandle(future),)
+
+
+class RunPodAwait:
+    """Wait for a job handle from ``RunPodSubmit`` and return its results."""
+
+    CATEGORY = "RunPod"
+    FUNCTION = "await_job"
+    RETURN_TYPES = ("STRING", "STRING", "STRING")  # status, job_id, output_json
+    RETURN_NAMES = ("status", "job_id", "output_json")
+    OUTPUT_NODE = True
+
+    @classmethod
+    def INPUT_TYPES(cls) -> dict[str, Any]:  # noqa: N802 (ComfyUI requires this name)
+        return {
+            "required": {"job": (JOB_HANDLE_TYPE, {"forceInput": True})},
+            "optional": {
+                "timeout_seconds": (
+                    "FLOAT",
+                    {
+                        "default": 0.0,
+                        "min": 0.0,
+                        "max": 3600.0,
+                        "tooltip": "Extra wait limit; 0 relies on the submit node's timeout.",
+                    },
+                ),
+            },
+        }
+
+    def await_job(self, job: RunpodJobHandle, timeout_seconds: float = 0.0) -> tuple[str, str, str]:
+        if not isinstance(job, RunpodJobHandle):
+            raise RuntimeError("job must come from a RunPod Submit node")
+        try:
+            return job.result(timeout=timeout_seconds or None)
+        except FutureTimeoutError as exc:
+            raise RuntimeError(f"RunPod job not finished after {timeout_seconds}s") from exc
@@ -0,0 +1,130 @@
+"""ComfyUI node that fans one workflow out over a list of parameter overrides."""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from comfy_gpu_offload.api import build_sweep_payloads
+from comfy_gpu_offload.api.sweep import DEFAULT_MAX_PARALLEL
+from comfy_gpu_offload.nodes.runpod_remote_execute import PreparedRun, RunPodRemoteExecute
+from comfy_gpu_offload.workflow import BuildPayloadError
+
+
+class RunPodSweep(RunPodRemoteExecute):
+    """Run one job per entry in ``sweep_json`` concurrently and return results in order."""
+
+    FUNCTION = "sweep"
+    RETURN_TYPES = ("STRING", "STRING", "STRING")  # JSON arrays, one item per sweep entry
+    RETURN_NAMES = ("statuses_json", "job_ids_json", "outputs_json")
+
+    @classmethod
+    def INPUT_TYPES(cls) -> dict[str, Any]:  # noqa: N802 (ComfyUI requires this name)
+        inputs = super().INPUT_TYPES()
+        inputs["required"].pop("use_runpod", None)
+        # Sweep payloads are rebuilt per entry from the full workflow and images, so there is
+        # no per-entry fallback for a worker that lost a template or image blob.
+        inputs["optional"].pop("use_workflow_template", None)
+        inputs["optional"].pop("dedupe_images", None)
+        inputs["required"]["sweep_json"] = (
+            "STRING",
+            {
+                "multiline": True,
+                "default": "[]",
+                "placeholder": '[{"seed": 1}, {"seed": 2}, {"cfg": 7.5}]',
+            },
+        )
+        inputs["optional"]["max_parallel"] = (
+            "INT",
+            {
+                "default": DEFAULT_MAX_PARALLEL,
+                "min": 1,
+                "max": 64,
+                "tooltip": "Jobs kept in flight at once; each one holds a RunPod worker.",
+            },
+        )
+        return inputs
+
+    def sweep(
+        self,
+        workflow_json: str,
+        sweep_json: str = "[]",
+        params_json: str = "{}",
+        images_json: str = "[]",
+        timeout_seconds: float | None = None,
+        workflow_path: str = "",
+        max_payload_bytes: int | None = 9_500_000,
+        workflow_url: str = "",
+        expected_seconds: float = 0.0,
+        submit_mode: str = "auto",
+        use_result_cache: bool = True,
+        prune_workflow: bool = False,
+        output_node_types: str = "",
+        upload_assets: bool = False,
+        image: Any = None,
+        image_codec: str = "png_fast",
+        latent: Any = None,
+        latent_dtype: str = "float16",
+        max_parallel: int = DEFAULT_MAX_PARALLEL,
+    ) -> tuple[str, str, str]:
+        overrides = self._parse_json_sequence(sweep_json, "sweep_json")
+        if not overrides:
+            raise RuntimeError("sweep_json must list at least one params object")
+        if max_parallel < 1:
+            raise RuntimeError("max_parallel must be at least 1")
+
+        # params_json acts as the shared base; each sweep entry overrides keys on top of it.
+        inputs = self._load_inputs(
+            workflow_json,
+            params_json=params_json,
+            images_json=images_json,
+            workflow_path=workflow_path,
+            max_payload_bytes=max_payload_bytes,
+            workflow_url=workflow_url,
+            submit_mode=submit_mode,
+            prune_workflow=prune_workflow,
+            output_node_types=output_node_types,
+            upload_assets=upload_assets,
+            image=image,
+            image_codec=image_codec,
+            latent=latent,
+            latent_dtype=latent_dtype,
+        )
+        try:
+            payloads = build_sweep_payloads(
+                inputs.workflow,
+                overrides,
+                images=inputs.images,
+                base_params=inputs.params,
+                tensors=inputs.tensors,
+            )
+        except BuildPayloadError as exc:
+            raise RuntimeError(f"Invalid payload: {exc}") from exc
+        runs = [
+            PreparedRun(
+                config=inputs.config,
+                encoded=self._encode_payload(payload, max_payload_bytes),
+                submit_mode=submit_mode,
+            )
+            for payload in payloads
+        ]
+
+        with ThreadPoolExecutor(
+            max_workers=min(max_parallel, len(runs)), thread_name_prefix="runpod-sweep"
+        ) as pool:
+            results = list(
+                pool.map(
+                    lambda run: self._run_prepared(
+                        run,
+                        timeout_seconds=timeout_seconds,
+                        expected_seconds=expected_seconds,
+                        use_result_cache=use_result_cache,
+                    ),
+                    runs,
+                )
+            )
+
+        statuses = [status for status, _, _ in results]
+        job_ids = [job_id for _, job_id, _ in results]
+        # Outputs are already JSON text; splice them instead of re-parsing.
+        outputs_json = "[" + ",".join(output for _, _, output in results) + "]"
+        return (json.dumps(statuses), json.dumps(job_ids), outputs_json)
@@ -1,27 +1,84 @@
 """Workflow serialization and transformation utilities."""
 
 from .payload import (
+    TENSOR_DTYPES,
     BuildPayloadError,
     ImagePayload,
     RunpodInputPayload,
+    TensorPayload,
     build_run_payload,
 )
 from .loader import (
+    EncodedPayload,
     WorkflowLoadError,
+    encode_payload,
     ensure_payload_size,
     load_workflow_from_path,
 )
-from .fetcher import fetch_workflow_from_url
-from .schema import validate_workflow_schema
+from .fetcher import clear_workflow_url_cache, fetch_workflow_from_url
+from .schema import WorkflowSchemaError, clear_validation_cache, validate_workflow_schema
+from .hashing import canonical_json_bytes, content_hash
+from .path_cache import LoadedWorkflow, clear_workflow_path_cache, load_workflow_cached
+from .prune import PruneResult, prune_workflow
+from .partition import (
+    BoundaryValue,
+    PartitionError,
+    WorkflowPartition,
+    partition_workflow,
+    tag_nodes,
+)
+from .templates import (
+    InMemoryTemplateStore,
+    TemplateError,
+    TemplateMissingError,
+    TemplateRegistry,
+    TemplateStore,
+    WorkflowTemplate,
+    apply_overrides,
+    compute_overrides,
+    get_shared_template_registry,
+    resolve_template_input,
+)
+from . import json_codec
 
 __all__ = [
     "BuildPayloadError",
     "ImagePayload",
     "RunpodInputPayload",
+    "TENSOR_DTYPES",
+    "TensorPayload",
     "build_run_payload",
+    "EncodedPayload",
     "WorkflowLoadError",
+    "encode_payload",
     "load_workflow_from_path",
     "ensure_payload_size",
     "fetch_workflow_from_url",
+    "clear_workflow_url_cache",
+    "WorkflowSchemaError",
+    "clear_validation_cache",
     "validate_workflow_schema",
+    "canonical_json_bytes",
+    "content_hash",
+    "json_codec",
+    "LoadedWorkflow",
+    "clear_workflow_path_cache",
+    "load_workflow_cached",
+    "PruneResult",
+    "prune_workflow",
+    "BoundaryValue",
+    "PartitionError",
+    "WorkflowPartition",
+    "partition_workflow",
+    "tag_nodes",
+    "InMemoryTemplateStore",
+    "TemplateError",
+    "TemplateMissingError",
+    "TemplateRegistry",
+    "TemplateStore",
+    "WorkflowTemplate",
+    "apply_overrides",
+    "compute_overrides",
+    "get_shared_template_registry",
+    "resolve_template_input",
 ]
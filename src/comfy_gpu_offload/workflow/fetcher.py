@@ -1,15 +1,71 @@
 """Fetch workflow JSON from a URL (e.g., ComfyUI API export)."""
 
-import json
-from typing import Any, Mapping
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
 from urllib.parse import urlparse
 
 import requests
 from requests import Response
 from requests.exceptions import RequestException
 
+from comfy_gpu_offload.workflow import json_codec
 from comfy_gpu_offload.workflow.loader import DEFAULT_MAX_PAYLOAD_BYTES, WorkflowLoadError
-from comfy_gpu_offload.workflow.payload import RunpodInputPayload
+
+DOWNLOAD_CHUNK_BYTES = 64 * 1024
+URL_CACHE_MAX_ENTRIES = 32
+
+
+@dataclass(frozen=True, slots=True)
+class _CachedWorkflow:
+    etag: str | None
+    last_modified: str | None
+    workflow: Mapping[str, Any]
+
+
+_url_cache: OrderedDict[str, _CachedWorkflow] = OrderedDict()
+_url_cache_lock = threading.Lock()
+
+
+def clear_workflow_url_cache() -> None:
+    """Forget validators and parsed workflows remembered from earlier fetches."""
+    with _url_cache_lock:
+        _url_cache.clear()
+
+
+def _cached(url: str) -> _CachedWorkflow | None:
+    with _url_cache_lock:
+        entry = _url_cache.get(url)
+        if entry is not None:
+            _url_cache.move_to_end(url)
+        return entry
+
+
+def _remember(url: str, entry: _CachedWorkflow) -> None:
+    with _url_cache_lock:
+        _url_cache[url] = entry
+        _url_cache.move_to_end(url)
+        while len(_url_cache) > URL_CACHE_MAX_ENTRIES:
+            _url_cache.popitem(last=False)
+
+
+def _read_capped(resp: Response, max_bytes: int) -> bytes:
+    declared = resp.headers.get("Content-Length")
+    if declared and declared.isdigit() and int(declared) > max_bytes:
+        raise WorkflowLoadError(
+            f"Workflow payload too large ({declared} bytes), limit {max_bytes} bytes"
+        )
+    buffer = bytearray()
+    for chunk in resp.iter_content(chunk_size=DOWNLOAD_CHUNK_BYTES):
+        buffer += chunk
+        if len(buffer) > max_bytes:
+            # Stop reading as soon as the cap is crossed instead of buffering the rest.
+            raise WorkflowLoadError(
+                f"Workflow payload too large (over {max_bytes} bytes), limit {max_bytes} bytes"
+            )
+    return bytes(buffer)
 
 
 def fetch_workflow_from_url(
@@ -18,8 +74,15 @@ def fetch_workflow_from_url(
     timeout_seconds: float = 10.0,
     verify_tls: bool = True,
     max_bytes: int = DEFAULT_MAX_PAYLOAD_BYTES,
+    use_cache: bool = True,
 ) -> Mapping[str, Any]:
-    """Fetch a workflow JSON document from a URL with validation and size guard."""
+    """Fetch a workflow JSON document from a URL with validation and size guard.
+
+    The body is streamed and abandoned once it exceeds ``max_bytes``. When the server sends
+    ``ETag``/``Last-Modified`` the parsed workflow is remembered, later fetches are
+    conditional, and a ``304 Not Modified`` returns the remembered workflow without a
+    download or re-parse. Treat the returned mapping as read-only; it may be shared.
+    """
     parsed = urlparse(url)
     if parsed.scheme not in {"https", "http"}:
         raise WorkflowLoadError("workflow_url must use http or https")
@@ -27,23 +90,38 @@ def fetch_workflow_from_url(
         # We allow http only if caller disables verification explicitly.
         raise WorkflowLoadError("workflow_url must be https when verify_tls is enabled")
 
+    cached = _cached(url) if use_cache else None
+    headers: dict[str, str] = {}
+    if cached is not None:
+        if cached.etag:
+            headers["If-None-Match"] = cached.etag
+        if cached.last_modified:
+            headers["If-Modified-Since"] = cached.last_modified
+
     try:
-        resp: Response = requests.get(url, timeout=timeout_seconds, verify=verify_tls)
+        resp: Response = requests.get(
+            url, timeout=timeout_seconds, verify=verify_tls, stream=True, headers=headers
+        )
     except RequestException as exc:
         raise WorkflowLoadError(f"Failed to fetch workflow from URL: {exc}") from exc
 
-    if resp.status_code >= 400:
-        raise WorkflowLoadError(f"Workflow URL returned HTTP {resp.status_code}")
-
-    raw = resp.content
-    if len(raw) > max_bytes:
-        raise WorkflowLoadError(
-            f"Workflow payload too large ({len(raw)} bytes), limit {max_bytes} bytes"
-        )
+    try:
+        if resp.status_code == 304 and cached is not None:
+            return cached.workflow
+        if resp.status_code >= 400:
+            raise WorkflowLoadError(f"Workflow URL returned HTTP {resp.status_code}")
+        try:
+            raw = _read_capped(resp, max_bytes)
+        except RequestException as exc:
+            raise WorkflowLoadError(f"Failed to fetch workflow from URL: {exc}") from exc
+        etag = resp.headers.get("ETag")
+        last_modified = resp.headers.get("Last-Modified")
+    finally:
+        resp.close()
 
     try:
-        parsed_json = json.loads(raw)
-    except json.JSONDecodeError as exc:
+        parsed_json = json_codec.loads(raw)
+    except ValueError as exc:
         raise WorkflowLoadError(f"Invalid JSON from workflow_url: {exc}") from exc
 
     if not isinstance(parsed_json, Mapping):
@@ -51,5 +129,6 @@ def fetch_workflow_from_url(
     if not parsed_json:
         raise WorkflowLoadError("workflow at workflow_url must not be empty")
 
+    if use_cache and (etag or last_modified):
+        _remember(url, _CachedWorkflow(etag, last_modified, parsed_json))
     return parsed_json
-
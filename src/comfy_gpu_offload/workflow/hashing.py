@@ -0,0 +1,28 @@
+"""Canonical JSON encoding and content hashes for workflows and payloads."""
+
+import hashlib
+import json
+from typing import Any
+
+from comfy_gpu_offload.workflow.loader import WorkflowLoadError
+
+
+def canonical_json_bytes(value: Any) -> bytes:
+    """Encode ``value`` deterministically: sorted keys, compact separators, UTF-8.
+
+    Always the stdlib encoder, never ``json_codec``: orjson spells some floats differently
+    (``0.00001`` vs ``1e-05``), and hashes must match between clients and workers whichever
+    backend each has installed.
+    """
+    try:
+        text = json.dumps(
+            value, sort_keys=True, separators=(",", ":"), ensure_ascii=False, allow_nan=False
+        )
+    except ValueError as exc:
+        raise WorkflowLoadError(f"Workflow cannot be hashed as JSON: {exc}") from exc
+    return text.encode("utf-8")
+
+
+def content_hash(value: Any) -> str:
+    """SHA-256 hex digest of the canonical JSON encoding of ``value``."""
+    return hashlib.sha256(canonical_json_bytes(value)).hexdigest()
@@ -0,0 +1,75 @@
+"""JSON encode/decode with an optional fast backend.
+
+``orjson`` is used when installed (``pip install comfy-gpu-offload[fast]``); otherwise the
+stdlib ``json`` module. Both paths produce compact UTF-8 bytes and raise the stdlib error
+types (``orjson.JSONDecodeError`` subclasses ``json.JSONDecodeError``; encode failures are
+``TypeError``/``ValueError``), so callers need no backend-specific handling.
+
+NaN and infinities have no JSON spelling. ``loads`` rejects them (``NaN``, ``Infinity`` and
+overflowing literals such as ``1e999``) with both backends, so parsed user input never holds
+them. ``dumps`` does not re-check: orjson writes a non-finite float as ``null``, the stdlib
+backend raises ``ValueError``. Content hashes use their own fixed encoder (see ``hashing``).
+"""
+
+import json
+import math
+from types import ModuleType
+from typing import Any
+
+_orjson: ModuleType | None
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - depends on the optional extra
+    _orjson = None
+
+JSONDecodeError = json.JSONDecodeError
+
+
+class _NonFiniteNumber(ValueError):
+    pass
+
+
+def backend_name() -> str:
+    return "orjson" if _orjson is not None else "json"
+
+
+def dumps(value: Any, *, sort_keys: bool = False) -> bytes:
+    """Encode ``value`` as compact UTF-8 JSON bytes."""
+    if _orjson is not None:
+        option = _orjson.OPT_NON_STR_KEYS | (_orjson.OPT_SORT_KEYS if sort_keys else 0)
+        try:
+            return bytes(_orjson.dumps(value, option=option))
+        except TypeError:
+            # orjson rejects a few values stdlib accepts (e.g. ints beyond 64 bits).
+            pass
+    return json.dumps(
+        value, separators=(",", ":"), ensure_ascii=False, sort_keys=sort_keys, allow_nan=False
+    ).encode("utf-8")
+
+
+def dumps_str(value: Any, *, sort_keys: bool = False) -> str:
+    return dumps(value, sort_keys=sort_keys).decode("utf-8")
+
+
+def loads(data: bytes | bytearray | memoryview | str) -> Any:
+    """Decode JSON text or UTF-8 bytes."""
+    if _orjson is not None:
+        return _orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    try:
+        return json.loads(data, parse_constant=_reject_constant, parse_float=_finite_float)
+    except _NonFiniteNumber as exc:
+        # Matches orjson, which has no NaN/Infinity literals and rejects overflowing numbers.
+        raise JSONDecodeError(f"non-finite number {exc} is not valid JSON", "", 0) from None
+
+
+def _reject_constant(name: str) -> Any:
+    raise _NonFiniteNumber(name)
+
+
+def _finite_float(text: str) -> float:
+    value = float(text)
+    if not math.isfinite(value):
+        raise _NonFiniteNumber(text)
+    return value
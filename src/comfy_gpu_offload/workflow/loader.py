@@ -1,9 +1,11 @@
 """Helpers for loading ComfyUI workflow JSON and guarding payload sizes."""
 
-import json
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Mapping
 
+from comfy_gpu_offload.workflow import json_codec
+
 DEFAULT_MAX_PAYLOAD_BYTES = 9_500_000  # conservative vs RunPod 10 MB limit
 
 
@@ -22,9 +24,8 @@ def load_workflow_from_path(path: Path, *, max_bytes: int = DEFAULT_MAX_PAYLOAD_
         raise WorkflowLoadError(f"Workflow file too large ({size} bytes), limit {max_bytes} bytes")
 
     try:
-        data = path.read_text(encoding="utf-8")
-        parsed = json.loads(data)
-    except (OSError, json.JSONDecodeError) as exc:
+        parsed = json_codec.loads(path.read_bytes())
+    except (OSError, ValueError) as exc:
         raise WorkflowLoadError(f"Failed to read/parse workflow JSON: {exc}") from exc
 
     if not isinstance(parsed, Mapping):
@@ -34,14 +35,45 @@ def load_workflow_from_path(path: Path, *, max_bytes: int = DEFAULT_MAX_PAYLOAD_
     return dict(parsed)
 
 
-def ensure_payload_size(payload: Mapping[str, Any], *, max_bytes: int = DEFAULT_MAX_PAYLOAD_BYTES) -> None:
-    """Validate that a payload fits within the size budget when JSON-encoded."""
+_BODY_WRAPPER_BYTES = len(b'{"input":}')
+
+
+@dataclass(frozen=True, slots=True)
+class EncodedPayload:
+    """A payload serialized once as the compact ``{"input": ...}`` request body.
+
+    The same bytes serve the size guard and the HTTP body, so multi-megabyte payloads are
+    not re-encoded by the client. ``payload`` keeps the source mapping for inspection.
+    """
+
+    payload: Mapping[str, Any]
+    body: bytes
+
+    @property
+    def size(self) -> int:
+        """Encoded size of the payload itself, excluding the ``input`` wrapper."""
+        return len(self.body) - _BODY_WRAPPER_BYTES
+
+
+def encode_payload(
+    payload: Mapping[str, Any], *, max_bytes: int | None = DEFAULT_MAX_PAYLOAD_BYTES
+) -> EncodedPayload:
+    """Encode ``payload`` as the /run request body, enforcing ``max_bytes`` when set."""
     try:
-        encoded = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        body = json_codec.dumps({"input": payload})
     except (TypeError, ValueError) as exc:
         raise WorkflowLoadError(f"Failed to encode payload to JSON: {exc}") from exc
-    if len(encoded) > max_bytes:
+    encoded = EncodedPayload(payload=payload, body=body)
+    if max_bytes is not None and encoded.size > max_bytes:
         raise WorkflowLoadError(
-            f"Payload too large ({len(encoded)} bytes), limit {max_bytes} bytes; "
+            f"Payload too large ({encoded.size} bytes), limit {max_bytes} bytes; "
             "reduce workflow size or strip unused assets."
         )
+    return encoded
+
+
+def ensure_payload_size(
+    payload: Mapping[str, Any], *, max_bytes: int = DEFAULT_MAX_PAYLOAD_BYTES
+) -> int:
+    """Validate that a payload fits within the size budget; returns its JSON-encoded size."""
+    return encode_payload(payload, max_bytes=max_bytes).size
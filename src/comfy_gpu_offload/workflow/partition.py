@@ -0,0 +1,386 @@
+"""Split a workflow into a remote GPU-heavy subgraph and a local remainder.
+
+Nodes are tagged GPU-heavy (pinned remote), local-only (loaders of local files, outputs) or
+free. Each link costs roughly the size of the value it would carry across the boundary;
+models, CLIP, VAE and conditioning cannot be transferred, so their links are uncuttable. A
+minimum s-t cut (Edmonds-Karp) then places every free node on the side that moves the
+fewest bytes, which for typical graphs means cutting at a LATENT rather than an IMAGE.
+
+Both halves are returned as standalone workflows. Values crossing the boundary are routed
+through ``RunPodBoundaryInput``/``RunPodBoundaryOutput`` placeholder nodes named after the
+producing slot, so the host can ship them (e.g. as ``TensorPayload`` entries) between runs.
+"""
+
+import math
+from collections import deque
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from typing import Any, Literal
+
+from comfy_gpu_offload.workflow.prune import DEFAULT_OUTPUT_NODE_TYPES
+from comfy_gpu_offload.workflow.schema import LinkRef, parse_link
+
+DEFAULT_GPU_NODE_TYPES = frozenset(
+    {
+        "ImageUpscaleWithModel",
+        "KSampler",
+        "KSamplerAdvanced",
+        "SamplerCustom",
+        "SamplerCustomAdvanced",
+        "VAEDecode",
+        "VAEDecodeTiled",
+        "VAEEncode",
+        "VAEEncodeForInpaint",
+        "VAEEncodeTiled",
+    }
+)
+DEFAULT_LOCAL_NODE_TYPES = frozenset({"LoadImage", "LoadImageMask"}) | DEFAULT_OUTPUT_NODE_TYPES
+# Relative bytes per pixel: an SD latent is 4 channels at 1/8 resolution, a mask 1 full-res
+# channel, an image 3. Types missing here (MODEL, CLIP, VAE, CONDITIONING, ...) never cross.
+DEFAULT_EDGE_COSTS: Mapping[str, float] = {
+    "BOOLEAN": 0.01,
+    "FLOAT": 0.01,
+    "INT": 0.01,
+    "STRING": 0.01,
+    "LATENT": 1.0,
+    "MASK": 16.0,
+    "IMAGE": 48.0,
+}
+BOUNDARY_INPUT_TYPE = "RunPodBoundaryInput"
+BOUNDARY_OUTPUT_TYPE = "RunPodBoundaryOutput"
+
+NodeTag = Literal["gpu", "local", "free"]
+Direction = Literal["to_remote", "to_local"]
+
+
+class PartitionError(ValueError):
+    """Raised when a workflow cannot be split into one remote and one local part."""
+
+
+@dataclass(frozen=True, slots=True)
+class BoundaryValue:
+    """One output slot whose value crosses between the remote and local workflows."""
+
+    name: str
+    origin_id: Any
+    origin_slot: int
+    type: str
+    direction: Direction
+    link_ids: tuple[Any, ...]
+    cost: float
+
+
+@dataclass(frozen=True, slots=True)
+class WorkflowPartition:
+    """The remote sub-workflow, the local remainder and the values passed between them."""
+
+    remote: dict[str, Any]
+    local: dict[str, Any]
+    remote_node_ids: tuple[Any, ...]
+    local_node_ids: tuple[Any, ...]
+    boundary: tuple[BoundaryValue, ...]
+
+    @property
+    def inputs(self) -> tuple[BoundaryValue, ...]:
+        """Values the local side sends to the remote workflow."""
+        return tuple(value for value in self.boundary if value.direction == "to_remote")
+
+    @property
+    def outputs(self) -> tuple[BoundaryValue, ...]:
+        """Values the remote workflow returns to the local side."""
+        return tuple(value for value in self.boundary if value.direction == "to_local")
+
+    @property
+    def cut_cost(self) -> float:
+        return sum(value.cost for value in self.boundary)
+
+
+def tag_nodes(
+    workflow: Mapping[str, Any],
+    *,
+    gpu_node_types: Iterable[str] = DEFAULT_GPU_NODE_TYPES,
+    local_node_types: Iterable[str] = DEFAULT_LOCAL_NODE_TYPES,
+) -> dict[Any, NodeTag]:
+    """Tag each node by ``type``: ``gpu`` must run remotely, ``local`` must stay local."""
+    gpu, local = frozenset(gpu_node_types), frozenset(local_node_types)
+    tags: dict[Any, NodeTag] = {}
+    for node in _nodes(workflow):
+        node_type = node.get("type")
+        tags[node["id"]] = "gpu" if node_type in gpu else "local" if node_type in local else "free"
+    return tags
+
+
+def partition_workflow(
+    workflow: Mapping[str, Any],
+    *,
+    gpu_node_types: Iterable[str] = DEFAULT_GPU_NODE_TYPES,
+    local_node_types: Iterable[str] = DEFAULT_LOCAL_NODE_TYPES,
+    edge_costs: Mapping[str, float] = DEFAULT_EDGE_COSTS,
+) -> WorkflowPartition:
+    """Cut ``workflow`` at the cheapest boundary around its GPU-heavy nodes.
+
+    Free nodes that tie go local. Local nodes sitting on a path between two remote nodes are
+    pulled remote afterwards, so the remote part runs as a single job. Raises
+    ``PartitionError`` when there is no GPU-heavy node or an uncuttable link joins a
+    GPU-heavy node to a local-only one. The input is never mutated.
+    """
+    nodes = {node["id"]: node for node in _nodes(workflow)}
+    tags = tag_nodes(workflow, gpu_node_types=gpu_node_types, local_node_types=local_node_types)
+    if "gpu" not in tags.values():
+        raise PartitionError("workflow has no GPU-heavy nodes to offload")
+    links = [
+        link
+        for link in (parse_link(raw) for raw in workflow.get("links") or [])
+        if link is not None and link.origin_id in nodes and link.target_id in nodes
+    ]
+    slots = _group_by_slot(links)
+    slot_types = {key: _link_type(nodes, group[0]) for key, group in slots.items()}
+
+    remote = _min_cut(
+        tags, slots, {key: edge_costs.get(t, math.inf) for key, t in slot_types.items()}
+    )
+    remote |= _between(remote, links)
+    pinned = sorted(str(node_id) for node_id in remote if tags[node_id] == "local")
+    if pinned:
+        raise PartitionError(f"local-only nodes {', '.join(pinned)} would have to run remotely")
+
+    boundary: list[BoundaryValue] = []
+    for (origin_id, origin_slot), group in slots.items():
+        crossing = [link for link in group if (link.target_id in remote) != (origin_id in remote)]
+        if not crossing:
+            continue
+        link_type = slot_types[(origin_id, origin_slot)]
+        boundary.append(
+            BoundaryValue(
+                name=f"boundary_{origin_id}_{origin_slot}",
+                origin_id=origin_id,
+                origin_slot=origin_slot,
+                type=link_type,
+                direction="to_local" if origin_id in remote else "to_remote",
+                link_ids=tuple(link.id for link in crossing),
+                cost=edge_costs.get(link_type, math.inf),
+            )
+        )
+
+    remote_ids = tuple(node_id for node_id in nodes if node_id in remote)
+    local_ids = tuple(node_id for node_id in nodes if node_id not in remote)
+    return WorkflowPartition(
+        remote=_subgraph(workflow, set(remote_ids), links, boundary),
+        local=_subgraph(workflow, set(local_ids), links, boundary),
+        remote_node_ids=remote_ids,
+        local_node_ids=local_ids,
+        boundary=tuple(boundary),
+    )
+
+
+def _nodes(workflow: Mapping[str, Any]) -> list[Mapping[str, Any]]:
+    return [
+        node for node in workflow.get("nodes", []) if isinstance(node, Mapping) and "id" in node
+    ]
+
+
+def _group_by_slot(links: list[LinkRef]) -> dict[tuple[Any, int], list[LinkRef]]:
+    slots: dict[tuple[Any, int], list[LinkRef]] = {}
+    for link in links:
+        slots.setdefault((link.origin_id, link.origin_slot), []).append(link)
+    return slots
+
+
+def _link_type(nodes: Mapping[Any, Mapping[str, Any]], link: LinkRef) -> str:
+    if link.type:
+        return link.type
+    outputs = nodes[link.origin_id].get("outputs")
+    if isinstance(outputs, list) and 0 <= link.origin_slot < len(outputs):
+        slot = outputs[link.origin_slot]
+        if isinstance(slot, Mapping) and isinstance(slot.get("type"), str):
+            return str(slot["type"])
+    return "*"
+
+
+def _min_cut(
+    tags: Mapping[Any, NodeTag],
+    slots: Mapping[tuple[Any, int], list[LinkRef]],
+    costs: Mapping[tuple[Any, int], float],
+) -> set[Any]:
+    """Node ids on the remote (source) side of a minimum cut."""
+    source, sink = ("source",), ("sink",)
+    capacity: dict[Any, dict[Any, float]] = {source: {}, sink: {}}
+
+    def add(u: Any, v: Any, amount: float) -> None:
+        capacity.setdefault(u, {})
+        capacity.setdefault(v, {})
+        capacity[u][v] = capacity[u].get(v, 0.0) + amount
+        capacity[v].setdefault(u, 0.0)
+
+    for node_id, tag in tags.items():
+        capacity.setdefault(("node", node_id), {})
+        if tag == "gpu":
+            add(source, ("node", node_id), math.inf)
+        elif tag == "local":
+            add(("node", node_id), sink, math.inf)
+    # One slot feeding several consumers crosses once, whichever way it goes: route its
+    # links through a "down" vertex (remote producer, local consumers) and an "up" vertex
+    # (local producer, remote consumers) that each carry the slot's cost once.
+    for (origin_id, origin_slot), group in slots.items():
+        cost = costs[(origin_id, origin_slot)]
+        down, up = ("down", origin_id, origin_slot), ("up", origin_id, origin_slot)
+        add(("node", origin_id), down, cost)
+        add(up, ("node", origin_id), cost)
+        for link in group:
+            add(down, ("node", link.target_id), math.inf)
+            add(("node", link.target_id), up, math.inf)
+
+    while True:
+        parents = _augmenting_path(capacity, source, sink)
+        if sink not in parents:
+            break
+        path: list[tuple[Any, Any]] = []
+        vertex = sink
+        while vertex != source:
+            path.append((parents[vertex], vertex))
+            vertex = parents[vertex]
+        flow = min(capacity[u][v] for u, v in path)
+        if math.isinf(flow):
+            raise PartitionError(
+                "a GPU-heavy node is joined to a local-only node by links that cannot cross "
+                "the boundary"
+            )
+        for u, v in path:
+            capacity[u][v] -= flow
+            capacity[v][u] += flow
+
+    reached = _augmenting_path(capacity, source, sink)
+    return {vertex[1] for vertex in reached if vertex[0] == "node"}
+
+
+def _augmenting_path(
+    capacity: Mapping[Any, Mapping[Any, float]], source: Any, sink: Any
+) -> dict[Any, Any]:
+    # Breadth-first search over residual edges; the parent map doubles as the reached set.
+    parents: dict[Any, Any] = {source: None}
+    queue = deque([source])
+    while queue and sink not in parents:
+        vertex = queue.popleft()
+        for neighbour, residual in capacity[vertex].items():
+            if residual > 0 and neighbour not in parents:
+                parents[neighbour] = vertex
+                queue.append(neighbour)
+    return parents
+
+
+def _between(remote: set[Any], links: list[LinkRef]) -> set[Any]:
+    """Non-remote nodes that are both downstream and upstream of remote nodes."""
+    downstream: dict[Any, list[Any]] = {}
+    upstream: dict[Any, list[Any]] = {}
+    for link in links:
+        downstream.setdefault(link.origin_id, []).append(link.target_id)
+        upstream.setdefault(link.target_id, []).append(link.origin_id)
+
+    def reach(edges: Mapping[Any, list[Any]]) -> set[Any]:
+        seen: set[Any] = set()
+        stack = [node_id for node_id in remote]
+        while stack:
+            for neighbour in edges.get(stack.pop(), ()):
+                if neighbour not in seen and neighbour not in remote:
+                    seen.add(neighbour)
+                    stack.append(neighbour)
+        return seen
+
+    return reach(downstream) & reach(upstream)
+
+
+def _subgraph(
+    workflow: Mapping[str, Any],
+    keep: set[Any],
+    links: list[LinkRef],
+    boundary: list[BoundaryValue],
+) -> dict[str, Any]:
+    raw_links = {link.id: raw for link, raw in _raw_links(workflow)}
+    node_ids = [node["id"] for node in _nodes(workflow)]
+    next_node_id = max((i for i in node_ids if isinstance(i, int)), default=0)
+    next_link_id = max((link.id for link in links if isinstance(link.id, int)), default=0)
+    crossing = {link_id for value in boundary for link_id in value.link_ids}
+
+    kept_links: list[Any] = [
+        raw_links[link.id]
+        for link in links
+        if link.id not in crossing and link.origin_id in keep and link.target_id in keep
+    ]
+    slot_links: dict[tuple[Any, int], list[Any]] = {}
+    glue_nodes: list[dict[str, Any]] = []
+    for value in boundary:
+        next_node_id += 1
+        if value.origin_id in keep:
+            # Producer side: the slot now also feeds a boundary output node.
+            next_link_id += 1
+            kept_links.append(
+                [next_link_id, value.origin_id, value.origin_slot, next_node_id, 0, value.type]
+            )
+            slot_links[(value.origin_id, value.origin_slot)] = [next_link_id]
+            glue_nodes.append(
+                {
+                    "id": next_node_id,
+                    "type": BOUNDARY_OUTPUT_TYPE,
+                    "mode": 0,
+                    "inputs": [{"name": value.name, "type": value.type, "link": next_link_id}],
+                    "outputs": [],
+                    "widgets_values": [value.name],
+                }
+            )
+        else:
+            # Consumer side: the crossing links now start at a boundary input node.
+            for link in links:
+                if link.id in value.link_ids:
+                    kept_links.append(
+                        [link.id, next_node_id, 0, link.target_id, link.target_slot, value.type]
+                    )
+            glue_nodes.append(
+                {
+                    "id": next_node_id,
+                    "type": BOUNDARY_INPUT_TYPE,
+                    "mode": 0,
+                    "inputs": [],
+                    "outputs": [
+                        {"name": value.name, "type": value.type, "links": list(value.link_ids)}
+                    ],
+                    "widgets_values": [value.name],
+                }
+            )
+
+    nodes = [
+        _rewire_outputs(node, crossing, slot_links)
+        for node in _nodes(workflow)
+        if node["id"] in keep
+    ]
+    sub = {key: value for key, value in workflow.items() if key not in ("nodes", "links")}
+    sub["nodes"] = nodes + glue_nodes
+    sub["links"] = kept_links
+    if "last_node_id" in workflow:
+        sub["last_node_id"] = next_node_id
+    if "last_link_id" in workflow:
+        sub["last_link_id"] = next_link_id
+    return sub
+
+
+def _raw_links(workflow: Mapping[str, Any]) -> list[tuple[LinkRef, Any]]:
+    pairs: list[tuple[LinkRef, Any]] = []
+    for raw in workflow.get("links") or []:
+        link = parse_link(raw)
+        if link is not None:
+            pairs.append((link, raw))
+    return pairs
+
+
+def _rewire_outputs(
+    node: Mapping[str, Any], crossing: set[Any], slot_links: Mapping[tuple[Any, int], list[Any]]
+) -> dict[str, Any]:
+    outputs = node.get("outputs")
+    if not isinstance(outputs, list):
+        return dict(node)
+    rewired: list[Any] = []
+    for index, output in enumerate(outputs):
+        if isinstance(output, Mapping) and isinstance(output.get("links"), list):
+            kept = [link_id for link_id in output["links"] if link_id not in crossing]
+            output = {**output, "links": kept + slot_links.get((node["id"], index), [])}
+        rewired.append(output)
+    return {**node, "outputs": rewired}
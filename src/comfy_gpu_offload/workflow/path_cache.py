@@ -0,0 +1,78 @@
+"""Process-level cache of parsed, validated workflow files keyed on their stat signature."""
+
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from comfy_gpu_offload.workflow.hashing import content_hash
+from comfy_gpu_offload.workflow.loader import (
+    DEFAULT_MAX_PAYLOAD_BYTES,
+    WorkflowLoadError,
+    load_workflow_from_path,
+)
+from comfy_gpu_offload.workflow.schema import validate_workflow_schema
+
+PATH_CACHE_MAX_ENTRIES = 16
+
+
+@dataclass(frozen=True, slots=True)
+class LoadedWorkflow:
+    """A schema-validated workflow and its canonical content hash.
+
+    Instances are shared between callers; treat ``workflow`` as read-only.
+    """
+
+    workflow: Mapping[str, Any]
+    content_hash: str
+
+
+_cache: OrderedDict[tuple[str, int, int], LoadedWorkflow] = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def clear_workflow_path_cache() -> None:
+    with _cache_lock:
+        _cache.clear()
+
+
+def load_workflow_cached(
+    path: Path, *, max_bytes: int = DEFAULT_MAX_PAYLOAD_BYTES
+) -> LoadedWorkflow:
+    """Load ``path`` once per ``(path, mtime_ns, size)``; unchanged files cost only a stat.
+
+    Raises ``WorkflowLoadError`` for unreadable files and ``WorkflowSchemaError`` from
+    ``validate_workflow_schema`` for structurally invalid workflows. Failures are not cached.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError as exc:
+        raise WorkflowLoadError(f"Workflow file not found: {path}") from exc
+    if stat.st_size > max_bytes:
+        raise WorkflowLoadError(
+            f"Workflow file too large ({stat.st_size} bytes), limit {max_bytes} bytes"
+        )
+
+    key = (os.path.realpath(path), stat.st_mtime_ns, stat.st_size)
+    with _cache_lock:
+        loaded = _cache.get(key)
+        if loaded is not None:
+            _cache.move_to_end(key)
+            return loaded
+
+    workflow = load_workflow_from_path(path, max_bytes=max_bytes)
+    workflow_hash = content_hash(workflow)
+    validate_workflow_schema(workflow, workflow_hash=workflow_hash)
+    loaded = LoadedWorkflow(workflow=workflow, content_hash=workflow_hash)
+
+    with _cache_lock:
+        # Drop stale signatures of the same file so edits do not pin old versions in memory.
+        for stale in [cached for cached in _cache if cached[0] == key[0]]:
+            del _cache[stale]
+        _cache[key] = loaded
+        while len(_cache) > PATH_CACHE_MAX_ENTRIES:
+            _cache.popitem(last=False)
+    return loaded
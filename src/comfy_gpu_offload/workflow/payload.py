@@ -3,21 +3,56 @@
 from collections.abc import Mapping, MutableMapping, Sequence
 from typing import Any, NotRequired, TypedDict
 
+from comfy_gpu_offload.workflow.hashing import content_hash
+from comfy_gpu_offload.workflow.templates import TemplateError, WorkflowTemplate, compute_overrides
+
+# Little-endian numpy dtype names a tensor payload may carry.
+TENSOR_DTYPES = frozenset(
+    {"float64", "float32", "float16", "int64", "int32", "int16", "int8", "uint8", "bool"}
+)
+TENSOR_ENCODINGS = frozenset({"raw", "zlib"})
+
 
 class BuildPayloadError(ValueError):
     """Raised when payload construction fails due to invalid inputs."""
 
 
 class ImagePayload(TypedDict):
+    """An input image sent inline (``image``), by URL (``url``) or by ``sha256`` reference.
+
+    A bare ``sha256`` entry names a blob the worker already holds from an earlier job.
+    """
+
     name: str
-    image: str  # base64 string without data URI prefix
+    image: NotRequired[str]  # base64 string without data URI prefix
+    url: NotRequired[str]  # https URL, e.g. a presigned object-store GET
     type: NotRequired[str]
+    sha256: NotRequired[str]
+
+
+class TensorPayload(TypedDict):
+    """A tensor sent as its C-order bytes, safetensors-style: dtype and shape plus raw data.
+
+    ``data`` is base64 of the bytes, zlib-compressed when ``encoding`` is ``"zlib"``.
+    ``source_dtype`` records the original dtype when the sender downcast it (e.g. float32
+    latents sent as float16), so the receiver can restore it.
+    """
+
+    name: str
+    dtype: str
+    shape: list[int]
+    data: str
+    encoding: NotRequired[str]
+    source_dtype: NotRequired[str]
 
 
 class RunpodInputPayload(TypedDict, total=False):
     workflow: MutableMapping[str, Any]
     images: list[ImagePayload]
+    tensors: list[TensorPayload]
     params: MutableMapping[str, Any]
+    workflow_hash: str
+    workflow_overrides: dict[str, Any]
 
 
 def build_run_payload(
@@ -25,36 +60,107 @@ def build_run_payload(
     workflow: Mapping[str, Any],
     images: Sequence[ImagePayload] | None = None,
     params: Mapping[str, Any] | None = None,
+    tensors: Sequence[TensorPayload] | None = None,
+    template: WorkflowTemplate | None = None,
+    register_template: bool = False,
 ) -> RunpodInputPayload:
-    """Validate and build the payload for RunPod /run."""
+    """Validate and build the payload for RunPod /run.
+
+    With ``template`` the workflow is sent as ``workflow_hash`` plus the widget values that
+    differ from it; ``register_template`` sends the full workflow with its hash so the worker
+    can store it as a template for later jobs.
+    """
     if not isinstance(workflow, Mapping):
         raise BuildPayloadError("workflow must be a mapping")
     if not workflow:
         raise BuildPayloadError("workflow must not be empty")
+    if template is not None and register_template:
+        raise BuildPayloadError("template and register_template are mutually exclusive")
 
-    payload: RunpodInputPayload = {"workflow": dict(workflow)}
+    payload: RunpodInputPayload
+    if template is not None:
+        try:
+            overrides = compute_overrides(template.workflow, workflow)
+        except TemplateError as exc:
+            raise BuildPayloadError(f"workflow does not fit its template: {exc}") from exc
+        payload = {"workflow_hash": template.hash, "workflow_overrides": overrides}
+    else:
+        payload = {"workflow": dict(workflow)}
+        if register_template:
+            payload["workflow_hash"] = content_hash(workflow)
 
     if images:
         validated_images: list[ImagePayload] = []
         for image in images:
             name = image.get("name")
             data = image.get("image")
+            url = image.get("url")
             if not isinstance(name, str) or not name:
                 raise BuildPayloadError("each image must include a non-empty 'name'")
-            if not isinstance(data, str) or not data:
+            img_entry: ImagePayload = {"name": name}
+            if url is not None:
+                if data is not None:
+                    raise BuildPayloadError("an image must set either 'image' or 'url', not both")
+                if not isinstance(url, str) or not url.startswith("https://"):
+                    raise BuildPayloadError("image 'url' must be an https URL")
+                img_entry["url"] = url
+            elif data is None and isinstance(image.get("sha256"), str):
+                pass  # Reference to content the worker already holds; see io.image_registry.
+            elif not isinstance(data, str) or not data:
                 raise BuildPayloadError("each image must include a non-empty 'image' base64 string")
-            img_entry: ImagePayload = {"name": name, "image": data}
-            maybe_type = image.get("type")
-            if maybe_type:
-                if not isinstance(maybe_type, str):
-                    raise BuildPayloadError("'type' must be a string if provided")
-                img_entry["type"] = maybe_type
+            else:
+                img_entry["image"] = data
+            for key in ("type", "sha256"):
+                value = image.get(key)
+                if value:
+                    if not isinstance(value, str):
+                        raise BuildPayloadError(f"'{key}' must be a string if provided")
+                    img_entry[key] = value
             validated_images.append(img_entry)
         payload["images"] = validated_images
 
+    if tensors:
+        payload["tensors"] = _validate_tensors(tensors)
+
     if params:
         if not isinstance(params, Mapping):
             raise BuildPayloadError("params must be a mapping if provided")
         payload["params"] = dict(params)
 
     return payload
+
+
+def _validate_tensors(tensors: Sequence[TensorPayload]) -> list[TensorPayload]:
+    validated: list[TensorPayload] = []
+    names: set[str] = set()
+    for tensor in tensors:
+        name = tensor.get("name")
+        if not isinstance(name, str) or not name:
+            raise BuildPayloadError("each tensor must include a non-empty 'name'")
+        if name in names:
+            raise BuildPayloadError(f"duplicate tensor name {name!r}")
+        names.add(name)
+        dtype = tensor.get("dtype")
+        if dtype not in TENSOR_DTYPES:
+            raise BuildPayloadError(f"tensor {name!r} has unsupported dtype {dtype!r}")
+        shape = tensor.get("shape")
+        if not isinstance(shape, list | tuple) or not all(
+            isinstance(dim, int) and not isinstance(dim, bool) and dim >= 0 for dim in shape
+        ):
+            raise BuildPayloadError(f"tensor {name!r} shape must be a list of non-negative ints")
+        data = tensor.get("data")
+        if not isinstance(data, str):
+            raise BuildPayloadError(f"tensor {name!r} must include base64 'data'")
+        entry: TensorPayload = {"name": name, "dtype": dtype, "shape": list(shape), "data": data}
+        encoding = tensor.get("encoding", "raw")
+        if encoding not in TENSOR_ENCODINGS:
+            raise BuildPayloadError(f"tensor {name!r} has unsupported encoding {encoding!r}")
+        if encoding != "raw":
+            entry["encoding"] = encoding
+        source_dtype = tensor.get("source_dtype")
+        if source_dtype is not None:
+            if source_dtype not in TENSOR_DTYPES:
+                raise BuildPayloadError(f"tensor {name!r} has unsupported source_dtype")
+            entry["source_dtype"] = source_dtype
+        validated.append(entry)
+    return validated
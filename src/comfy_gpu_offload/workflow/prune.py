@@ -0,0 +1,125 @@
+"""Drop nodes that never reach an output and UI-only metadata before submission."""
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from comfy_gpu_offload.workflow import json_codec
+from comfy_gpu_offload.workflow.schema import parse_link
+
+# Built-in ComfyUI nodes with OUTPUT_NODE = True. Custom output nodes can be passed explicitly.
+DEFAULT_OUTPUT_NODE_TYPES = frozenset(
+    {
+        "PreviewAudio",
+        "PreviewImage",
+        "SaveAnimatedPNG",
+        "SaveAnimatedWEBP",
+        "SaveAudio",
+        "SaveImage",
+        "SaveLatent",
+        "SaveVideo",
+        "SaveWEBM",
+    }
+)
+# Layout and styling read only by the browser editor.
+UI_NODE_KEYS = ("pos", "size", "flags", "color", "bgcolor", "shape")
+UI_WORKFLOW_KEYS = ("groups",)
+UI_EXTRA_KEYS = ("ds",)
+MODE_MUTED = 2
+
+
+@dataclass(frozen=True, slots=True)
+class PruneResult:
+    """The pruned workflow and what pruning removed."""
+
+    workflow: dict[str, Any]
+    removed_node_ids: tuple[Any, ...]
+    bytes_before: int
+    bytes_after: int
+
+    @property
+    def bytes_saved(self) -> int:
+        return self.bytes_before - self.bytes_after
+
+
+def _reachable_ids(
+    nodes: list[Mapping[str, Any]], links: list[Any], output_types: frozenset[str]
+) -> set[Any] | None:
+    roots = [
+        node["id"]
+        for node in nodes
+        if node.get("type") in output_types and node.get("mode") != MODE_MUTED
+    ]
+    if not roots:
+        return None
+
+    upstream: dict[Any, list[Any]] = {}
+    for raw in links:
+        link = parse_link(raw)
+        if link is not None:
+            upstream.setdefault(link.target_id, []).append(link.origin_id)
+
+    reached = set(roots)
+    stack = list(roots)
+    while stack:
+        for origin_id in upstream.get(stack.pop(), ()):
+            if origin_id not in reached:
+                reached.add(origin_id)
+                stack.append(origin_id)
+    return reached
+
+
+def _prune_node(node: Mapping[str, Any], kept_links: set[Any]) -> dict[str, Any]:
+    pruned = {key: value for key, value in node.items() if key not in UI_NODE_KEYS}
+    outputs = node.get("outputs")
+    if isinstance(outputs, list):
+        pruned["outputs"] = [
+            {**output, "links": [link for link in output["links"] if link in kept_links]}
+            if isinstance(output, Mapping) and isinstance(output.get("links"), list)
+            else output
+            for output in outputs
+        ]
+    return pruned
+
+
+def prune_workflow(
+    workflow: Mapping[str, Any],
+    *,
+    output_node_types: Iterable[str] = DEFAULT_OUTPUT_NODE_TYPES,
+) -> PruneResult:
+    """Keep only nodes upstream of an output node and strip editor-only metadata.
+
+    Output nodes are matched by ``type``; muted outputs (mode 2) are not roots. When the graph
+    has no recognised output node every node is kept and only metadata is stripped. The input
+    is never mutated, so shared cached workflows are safe to pass in.
+    """
+    nodes = [node for node in workflow.get("nodes", []) if isinstance(node, Mapping)]
+    links = list(workflow.get("links") or [])
+    reached = _reachable_ids(nodes, links, frozenset(output_node_types))
+    kept_nodes = nodes if reached is None else [node for node in nodes if node.get("id") in reached]
+    kept_ids = {node.get("id") for node in kept_nodes}
+
+    kept_links: list[Any] = []
+    kept_link_ids: set[Any] = set()
+    for raw in links:
+        link = parse_link(raw)
+        if link is not None and link.origin_id in kept_ids and link.target_id in kept_ids:
+            kept_links.append(raw)
+            kept_link_ids.add(link.id)
+
+    pruned: dict[str, Any] = {
+        key: value for key, value in workflow.items() if key not in UI_WORKFLOW_KEYS
+    }
+    pruned["nodes"] = [_prune_node(node, kept_link_ids) for node in kept_nodes]
+    if "links" in workflow:
+        pruned["links"] = kept_links
+    extra = workflow.get("extra")
+    if isinstance(extra, Mapping):
+        pruned["extra"] = {key: value for key, value in extra.items() if key not in UI_EXTRA_KEYS}
+
+    return PruneResult(
+        workflow=pruned,
+        removed_node_ids=tuple(node.get("id") for node in nodes if node.get("id") not in kept_ids),
+        bytes_before=len(json_codec.dumps(workflow)),
+        bytes_after=len(json_codec.dumps(pruned)),
+    )
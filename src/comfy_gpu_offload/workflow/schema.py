@@ -1,12 +1,207 @@
-"""Lightweight workflow schema validation."""
+"""Workflow schema and graph validation."""
 
-from typing import Any, Mapping
+import threading
+from collections import OrderedDict, deque
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
 
+VALIDATION_CACHE_MAX_ENTRIES = 256
+ANY_TYPE = "*"
+_ID_TYPES = (str, int, float)
 
-def validate_workflow_schema(workflow: Mapping[str, Any]) -> None:
-    """Ensure the workflow resembles a ComfyUI API-format workflow."""
+
+class WorkflowSchemaError(ValueError):
+    """Raised when a workflow is structurally invalid."""
+
+
+@dataclass(frozen=True, slots=True)
+class LinkRef:
+    """One edge of the graph, normalised from list-style or dict-style links."""
+
+    id: Any
+    origin_id: Any
+    origin_slot: int
+    target_id: Any
+    target_slot: int
+    type: str | None = None
+
+
+def parse_link(link: Any) -> LinkRef | None:
+    """Normalise a link entry; ``None`` when it is not a recognisable link."""
+    if isinstance(link, list | tuple) and len(link) >= 5:
+        link_type = link[5] if len(link) > 5 else None
+        fields = (link[0], link[1], link[2], link[3], link[4], link_type)
+    elif isinstance(link, Mapping) and "id" in link:
+        fields = (
+            link["id"],
+            link.get("origin_id"),
+            link.get("origin_slot", 0),
+            link.get("target_id"),
+            link.get("target_slot", 0),
+            link.get("type"),
+        )
+    else:
+        return None
+    link_id, origin_id, origin_slot, target_id, target_slot, link_type = fields
+    if not isinstance(origin_slot, int) or not isinstance(target_slot, int):
+        return None
+    return LinkRef(
+        id=link_id,
+        origin_id=origin_id,
+        origin_slot=origin_slot,
+        target_id=target_id,
+        target_slot=target_slot,
+        type=link_type if isinstance(link_type, str) else None,
+    )
+
+
+_cache: OrderedDict[str, str | None] = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def clear_validation_cache() -> None:
+    with _cache_lock:
+        _cache.clear()
+
+
+def validate_workflow_schema(
+    workflow: Mapping[str, Any], *, workflow_hash: str | None = None
+) -> None:
+    """Ensure the workflow is a well-formed ComfyUI graph.
+
+    Nodes and links are indexed once, then dangling links, slot type mismatches and cycles
+    are checked in ``O(nodes + links)``. Pass ``workflow_hash`` (see ``content_hash``) to
+    reuse the verdict for a workflow that was already validated.
+    """
+    if workflow_hash is not None:
+        with _cache_lock:
+            if workflow_hash in _cache:
+                _cache.move_to_end(workflow_hash)
+                error = _cache[workflow_hash]
+                if error is not None:
+                    raise WorkflowSchemaError(error)
+                return
+
+    try:
+        _validate(workflow)
+    except WorkflowSchemaError as exc:
+        _remember(workflow_hash, str(exc))
+        raise
+    _remember(workflow_hash, None)
+
+
+def _remember(workflow_hash: str | None, error: str | None) -> None:
+    if workflow_hash is None:
+        return
+    with _cache_lock:
+        _cache[workflow_hash] = error
+        while len(_cache) > VALIDATION_CACHE_MAX_ENTRIES:
+            _cache.popitem(last=False)
+
+
+def _validate(workflow: Mapping[str, Any]) -> None:
     if "nodes" not in workflow:
-        raise ValueError("workflow JSON must include a 'nodes' key")
+        raise WorkflowSchemaError("workflow JSON must include a 'nodes' key")
     if not isinstance(workflow["nodes"], list):
-        raise ValueError("'nodes' must be a list")
-    # Optional: future fields checks (e.g., 'links') could be added here.
+        raise WorkflowSchemaError("'nodes' must be a list")
+    links = workflow.get("links")
+    if links is None:
+        links = []
+    if not isinstance(links, list):
+        raise WorkflowSchemaError("'links' must be a list")
+
+    nodes: dict[Any, Mapping[str, Any]] = {}
+    for position, node in enumerate(workflow["nodes"]):
+        if not isinstance(node, Mapping) or "id" not in node:
+            raise WorkflowSchemaError(f"node at index {position} must be an object with an 'id'")
+        _check_id(node["id"], f"node at index {position}")
+        if node["id"] in nodes:
+            raise WorkflowSchemaError(f"duplicate node id {node['id']!r}")
+        nodes[node["id"]] = node
+
+    edges: dict[Any, list[Any]] = {node_id: [] for node_id in nodes}
+    in_degree: dict[Any, int] = dict.fromkeys(nodes, 0)
+    link_ids: set[Any] = set()
+    for position, raw in enumerate(links):
+        link = parse_link(raw)
+        if link is None:
+            raise WorkflowSchemaError(f"link at index {position} is malformed")
+        for value in (link.id, link.origin_id, link.target_id):
+            _check_id(value, f"link at index {position}")
+        if link.id in link_ids:
+            raise WorkflowSchemaError(f"duplicate link id {link.id!r}")
+        link_ids.add(link.id)
+        for endpoint in (link.origin_id, link.target_id):
+            if endpoint not in nodes:
+                raise WorkflowSchemaError(f"link {link.id!r} connects missing node {endpoint!r}")
+        _check_link_types(link, nodes[link.origin_id], nodes[link.target_id])
+        edges[link.origin_id].append(link.target_id)
+        in_degree[link.target_id] += 1
+
+    for node in nodes.values():
+        for slot in _slots(node, "inputs"):
+            link_id = slot.get("link")
+            if link_id is not None:
+                _check_id(link_id, f"node {node['id']!r} input {slot.get('name')!r}")
+            if link_id is not None and link_id not in link_ids:
+                raise WorkflowSchemaError(
+                    f"node {node['id']!r} input {slot.get('name')!r} references missing "
+                    f"link {link_id!r}"
+                )
+
+    # Kahn's algorithm: any node never reaching in-degree zero sits on a cycle.
+    ready = deque(node_id for node_id, degree in in_degree.items() if degree == 0)
+    visited = 0
+    while ready:
+        visited += 1
+        for target_id in edges[ready.popleft()]:
+            in_degree[target_id] -= 1
+            if in_degree[target_id] == 0:
+                ready.append(target_id)
+    if visited != len(nodes):
+        cyclic = sorted(str(node_id) for node_id, degree in in_degree.items() if degree > 0)
+        raise WorkflowSchemaError(f"workflow graph has a cycle through nodes {', '.join(cyclic)}")
+
+
+def _check_id(value: Any, owner: str) -> None:
+    # Ids index dicts and sets; lists or objects would surface as a bare TypeError.
+    if not isinstance(value, _ID_TYPES):
+        raise WorkflowSchemaError(f"{owner} has a non-scalar id {value!r}")
+
+
+def _slots(node: Mapping[str, Any], key: str) -> list[Mapping[str, Any]]:
+    slots = node.get(key)
+    if not isinstance(slots, list):
+        return []
+    return [slot if isinstance(slot, Mapping) else {} for slot in slots]
+
+
+def _slot_type(node: Mapping[str, Any], key: str, index: int, link: LinkRef) -> str | None:
+    slots = _slots(node, key)
+    if not slots:
+        return None  # Slots not serialised; nothing to check against.
+    if not 0 <= index < len(slots):
+        raise WorkflowSchemaError(
+            f"link {link.id!r} uses {key[:-1]} slot {index} of node {node['id']!r}, "
+            f"which has {len(slots)}"
+        )
+    slot_type = slots[index].get("type")
+    return slot_type if isinstance(slot_type, str) else None
+
+
+def _types_compatible(left: str, right: str) -> bool:
+    if ANY_TYPE in (left, right):
+        return True
+    # Slots such as "INT,FLOAT" accept any of the listed types.
+    return bool(set(left.split(",")) & set(right.split(",")))
+
+
+def _check_link_types(link: LinkRef, origin: Mapping[str, Any], target: Mapping[str, Any]) -> None:
+    origin_type = _slot_type(origin, "outputs", link.origin_slot, link) or link.type
+    target_type = _slot_type(target, "inputs", link.target_slot, link) or link.type
+    if origin_type and target_type and not _types_compatible(origin_type, target_type):
+        raise WorkflowSchemaError(
+            f"link {link.id!r} connects {origin_type} output of node {origin['id']!r} "
+            f"to {target_type} input of node {target['id']!r}"
+        )
@@ -0,0 +1,249 @@
+"""Workflow templates: register a graph once, then submit only its changed widget values.
+
+Client side, ``TemplateRegistry`` remembers which graph each endpoint already holds and
+``build_run_payload(template=...)`` diffs against it. Worker side, ``resolve_template_input``
+rebuilds the full workflow from a ``TemplateStore`` before handing the job to ComfyUI.
+"""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any, ClassVar, Protocol
+
+from comfy_gpu_offload.workflow.hashing import content_hash
+
+WIDGETS_KEY = "widgets_values"
+REPLACE_KEY = "replace"
+# Workers report this ``error_code`` when a hash is unknown so clients resend in full.
+TEMPLATE_MISSING_CODE = "workflow_template_missing"
+TEMPLATE_REGISTRY_MAX_ENTRIES = 64
+
+
+class TemplateError(ValueError):
+    """Raised when a workflow does not fit its template or a template payload is invalid."""
+
+
+class TemplateMissingError(TemplateError):
+    """Raised on the worker when a job references a template it has not stored.
+
+    Return ``{"error": exc.job_error()}`` from the handler so the client sees ``code``.
+    """
+
+    code: ClassVar[str] = TEMPLATE_MISSING_CODE
+
+    def job_error(self) -> dict[str, str]:
+        return {"error_code": self.code, "message": str(self)}
+
+
+@dataclass(frozen=True, slots=True)
+class WorkflowTemplate:
+    """A workflow registered with an endpoint under the hash of its full content."""
+
+    hash: str
+    workflow: Mapping[str, Any]
+
+    @classmethod
+    def from_workflow(cls, workflow: Mapping[str, Any]) -> "WorkflowTemplate":
+        return cls(hash=content_hash(workflow), workflow=workflow)
+
+
+def structure_hash(workflow: Mapping[str, Any]) -> str:
+    """Hash of the workflow with widget values removed; equal for graphs a template can cover."""
+    return content_hash(
+        {
+            **workflow,
+            "nodes": [
+                {key: value for key, value in node.items() if key != WIDGETS_KEY}
+                if isinstance(node, Mapping)
+                else node
+                for node in workflow.get("nodes", [])
+            ],
+        }
+    )
+
+
+def _nodes_by_id(workflow: Mapping[str, Any]) -> dict[str, Mapping[str, Any]]:
+    nodes = workflow.get("nodes")
+    if not isinstance(nodes, list):
+        raise TemplateError("'nodes' must be a list")
+    indexed = {str(node.get("id")): node for node in nodes if isinstance(node, Mapping)}
+    if len(indexed) != len(nodes):
+        raise TemplateError("template nodes must be objects with unique ids")
+    return indexed
+
+
+def compute_overrides(
+    template: Mapping[str, Any], workflow: Mapping[str, Any]
+) -> dict[str, dict[str, Any]]:
+    """Widget values of ``workflow`` that differ from ``template``, keyed by node id.
+
+    Each entry maps widget index (as a string) to its new value, or is ``{"replace": value}``
+    when the widgets cannot be patched index by index. Raises ``TemplateError`` if anything
+    besides widget values differs, since the worker could not rebuild the workflow.
+    """
+    if structure_hash(template) != structure_hash(workflow):
+        raise TemplateError("workflow structure differs from the template")
+    template_nodes = _nodes_by_id(template)
+    overrides: dict[str, dict[str, Any]] = {}
+    for node_id, node in _nodes_by_id(workflow).items():
+        old = template_nodes[node_id].get(WIDGETS_KEY)
+        new = node.get(WIDGETS_KEY)
+        if old == new:
+            continue
+        if isinstance(old, list) and isinstance(new, list) and len(old) == len(new):
+            overrides[node_id] = {
+                str(index): value
+                for index, (before, value) in enumerate(zip(old, new, strict=True))
+                if before != value
+            }
+        else:
+            overrides[node_id] = {REPLACE_KEY: new}
+    return overrides
+
+
+def apply_overrides(template: Mapping[str, Any], overrides: Mapping[str, Any]) -> dict[str, Any]:
+    """Rebuild a workflow from ``template`` and ``compute_overrides`` output.
+
+    Untouched nodes are shared with ``template``; only overridden nodes are copied.
+    """
+    template_nodes = _nodes_by_id(template)
+    unknown = set(overrides) - set(template_nodes)
+    if unknown:
+        raise TemplateError(f"overrides reference unknown nodes: {', '.join(sorted(unknown))}")
+
+    nodes: list[Any] = []
+    for node in template["nodes"]:
+        override = overrides.get(str(node.get("id")))
+        if override is None:
+            nodes.append(node)
+            continue
+        if not isinstance(override, Mapping):
+            raise TemplateError(f"override for node {node.get('id')!r} must be an object")
+        if REPLACE_KEY in override:
+            widgets = override[REPLACE_KEY]
+        else:
+            widgets = list(node.get(WIDGETS_KEY) or [])
+            for index, value in override.items():
+                position = int(index) if str(index).isdigit() else -1
+                if not 0 <= position < len(widgets):
+                    raise TemplateError(f"node {node.get('id')!r} has no widget {index!r}")
+                widgets[position] = value
+        patched = {key: value for key, value in node.items() if key != WIDGETS_KEY}
+        if widgets is not None:
+            patched[WIDGETS_KEY] = widgets
+        nodes.append(patched)
+    return {**template, "nodes": nodes}
+
+
+class TemplateRegistry:
+    """Client-side record of which template each endpoint holds, per graph structure."""
+
+    def __init__(self, max_entries: int = TEMPLATE_REGISTRY_MAX_ENTRIES) -> None:
+        self._max_entries = max_entries
+        self._templates: OrderedDict[tuple[str, str], WorkflowTemplate] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def lookup(self, endpoint_id: str, workflow: Mapping[str, Any]) -> WorkflowTemplate | None:
+        key = (endpoint_id, structure_hash(workflow))
+        with self._lock:
+            template = self._templates.get(key)
+            if template is not None:
+                self._templates.move_to_end(key)
+            return template
+
+    def remember(self, endpoint_id: str, template: WorkflowTemplate) -> None:
+        key = (endpoint_id, structure_hash(template.workflow))
+        with self._lock:
+            self._templates[key] = template
+            self._templates.move_to_end(key)
+            while len(self._templates) > self._max_entries:
+                self._templates.popitem(last=False)
+
+    def forget(self, endpoint_id: str, template_hash: str) -> None:
+        with self._lock:
+            for key in [
+                key
+                for key, template in self._templates.items()
+                if key[0] == endpoint_id and template.hash == template_hash
+            ]:
+                del self._templates[key]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._templates)
+
+
+_shared_registry: TemplateRegistry | None = None
+_shared_registry_lock = threading.Lock()
+
+
+def get_shared_template_registry() -> TemplateRegistry:
+    global _shared_registry
+    with _shared_registry_lock:
+        if _shared_registry is None:
+            _shared_registry = TemplateRegistry()
+        return _shared_registry
+
+
+class TemplateStore(Protocol):
+    """Worker-side storage for registered templates (memory, network volume, ...)."""
+
+    def get(self, template_hash: str) -> Mapping[str, Any] | None: ...
+
+    def put(self, template_hash: str, workflow: Mapping[str, Any]) -> None: ...
+
+
+class InMemoryTemplateStore:
+    """Process-local ``TemplateStore``; a warm worker keeps templates between jobs."""
+
+    def __init__(self) -> None:
+        self._templates: dict[str, Mapping[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, template_hash: str) -> Mapping[str, Any] | None:
+        with self._lock:
+            return self._templates.get(template_hash)
+
+    def put(self, template_hash: str, workflow: Mapping[str, Any]) -> None:
+        with self._lock:
+            self._templates[template_hash] = workflow
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._templates)
+
+
+def resolve_template_input(job_input: Mapping[str, Any], store: TemplateStore) -> dict[str, Any]:
+    """Worker-side: turn a template payload back into a job input with a full ``workflow``.
+
+    A payload carrying both ``workflow`` and ``workflow_hash`` registers the template; one
+    carrying only the hash is rebuilt from ``store`` plus ``workflow_overrides``. Inputs
+    without a hash pass through unchanged.
+    """
+    template_hash = job_input.get("workflow_hash")
+    if template_hash is None:
+        return dict(job_input)
+    if not isinstance(template_hash, str) or not template_hash:
+        raise TemplateError("workflow_hash must be a non-empty string")
+
+    resolved = {
+        key: value
+        for key, value in job_input.items()
+        if key not in ("workflow_hash", "workflow_overrides")
+    }
+    workflow = job_input.get("workflow")
+    if workflow is not None:
+        if not isinstance(workflow, Mapping) or content_hash(workflow) != template_hash:
+            raise TemplateError("workflow does not match workflow_hash")
+        store.put(template_hash, workflow)
+        return resolved
+
+    template = store.get(template_hash)
+    if template is None:
+        raise TemplateMissingError(f"{TEMPLATE_MISSING_CODE}: {template_hash}")
+    overrides = job_input.get("workflow_overrides") or {}
+    if not isinstance(overrides, Mapping):
+        raise TemplateError("workflow_overrides must be an object")
+    resolved["workflow"] = apply_overrides(template, overrides)
+    return resolved
@@ -0,0 +1,21 @@
+import pytest
+
+from comfy_gpu_offload.io import image_registry, result_cache, temp_files
+
+
+@pytest.fixture(autouse=True)
+def isolated_result_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep the process-wide result cache from leaking outputs between tests."""
+    monkeypatch.setattr(result_cache, "_shared_caches", {})
+
+
+@pytest.fixture(autouse=True)
+def isolated_image_registry(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Digests recorded by one test must not turn into references in another."""
+    monkeypatch.setattr(image_registry, "_shared_registry", None)
+
+
+@pytest.fixture(autouse=True)
+def isolated_artifact_spools(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Spools are keyed by settings; a fresh map keeps tmp_path spools out of later tests."""
+    monkeypatch.setattr(temp_files, "_shared_spools", {})
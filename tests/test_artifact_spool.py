@@ -0,0 +1,153 @@
+import hashlib
+import os
+from pathlib import Path
+
+import pytest
+
+from comfy_gpu_offload.config import RunpodConfig
+from comfy_gpu_offload.io import ArtifactSpool, get_shared_artifact_spool
+from comfy_gpu_offload.io.temp_files import SPOOL_SUBDIR
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_put_is_content_addressed_with_private_permissions(tmp_path: Path) -> None:
+    spool = ArtifactSpool(tmp_path / "spool")
+
+    entry = spool.put(b"frame-0", job_id="job-1", suffix=".png")
+    again = spool.put(bytearray(b"frame-0"), job_id="job-2")
+
+    assert entry == again
+    assert entry.digest == hashlib.sha256(b"frame-0").hexdigest()
+    assert entry.path.name == f"{entry.digest}.png"
+    assert entry.path.read_bytes() == b"frame-0"
+    assert oct(entry.path.stat().st_mode & 0o777) == oct(0o600)
+    assert oct(spool.directory.stat().st_mode & 0o777) == oct(0o700)
+    assert [path.name for path in spool.directory.iterdir()] == [entry.path.name]
+    assert spool.get(entry.digest) == entry
+    assert spool.for_job("job-1") == spool.for_job("job-2") == [entry]
+    assert spool.total_bytes == len(b"frame-0")
+
+
+def test_put_chunks_streams_and_rejects_oversized_artifacts(tmp_path: Path) -> None:
+    spool = ArtifactSpool(tmp_path, max_bytes=8)
+
+    entry = spool.put_chunks([b"ab", memoryview(b"cd")], job_id="job")
+
+    assert entry.path.read_bytes() == b"abcd"
+    with pytest.raises(ValueError, match="budget"):
+        spool.put_chunks([b"12345", b"67890"])
+    with pytest.raises(ValueError, match="suffix"):
+        spool.put(b"x", suffix="/../evil")
+    assert not list(spool.directory.glob("*.tmp"))
+    assert len(spool) == 1
+
+
+def test_evicts_least_recently_used_past_budget(tmp_path: Path) -> None:
+    clock = FakeClock()
+    spool = ArtifactSpool(tmp_path, max_bytes=10, clock=clock)
+    first = spool.put(b"aaaa", job_id="a")
+    clock.now += 1
+    second = spool.put(b"bbbb", job_id="b")
+    clock.now += 1
+    spool.get(first.digest)  # first is now the most recently used
+    clock.now += 1
+
+    third = spool.put(b"cccc", job_id="c")
+
+    assert first.digest in spool
+    assert second.digest not in spool
+    assert not second.path.exists()
+    assert spool.for_job("b") == []
+    assert spool.total_bytes == 8
+    assert third.path.exists()
+
+
+def test_pinned_entries_survive_eviction_until_unpinned(tmp_path: Path) -> None:
+    clock = FakeClock()
+    spool = ArtifactSpool(tmp_path, max_bytes=8, clock=clock)
+    pinned = spool.put_chunks([b"aaaa"], pin=True)
+    clock.now += 1
+    spool.put(b"bbbb")
+    clock.now += 1
+
+    spool.put(b"cccc")
+
+    assert pinned.path.exists()
+    assert spool.total_bytes == 8
+    spool.unpin(pinned.digest)
+    spool.put(b"dddd")
+    assert not pinned.path.exists()
+
+
+def test_expires_entries_after_ttl(tmp_path: Path) -> None:
+    clock = FakeClock()
+    spool = ArtifactSpool(tmp_path, ttl_seconds=10, clock=clock)
+    entry = spool.put(b"old", job_id="job")
+
+    clock.now += 11
+
+    assert spool.get(entry.digest) is None
+    assert not entry.path.exists()
+
+
+def test_discard_job_keeps_artifacts_shared_with_other_jobs(tmp_path: Path) -> None:
+    spool = ArtifactSpool(tmp_path)
+    shared = spool.put(b"shared", job_id="a")
+    spool.put(b"shared", job_id="b")
+    only_a = spool.put(b"only-a", job_id="a")
+
+    spool.discard_job("a")
+
+    assert shared.path.exists()
+    assert not only_a.path.exists()
+    assert spool.for_job("a") == []
+    spool.clear()
+    assert len(spool) == 0
+    assert not shared.path.exists()
+
+
+def test_adopts_existing_files_and_removes_partial_writes(tmp_path: Path) -> None:
+    clock = FakeClock()
+    spool = ArtifactSpool(tmp_path, clock=clock)
+    entry = spool.put(b"kept")
+    os.utime(entry.path, (clock.now, clock.now))
+    (spool.directory / ".k3j_9x2a.tmp").write_bytes(b"partial")
+    (spool.directory / "notes.tmp").write_bytes(b"not ours")
+
+    reopened = ArtifactSpool(tmp_path, clock=clock)
+
+    assert reopened.get(entry.digest) == entry
+    assert reopened.total_bytes == len(b"kept")
+    assert not (spool.directory / ".k3j_9x2a.tmp").exists()
+    assert (spool.directory / "notes.tmp").exists()
+
+
+def test_configured_directory_is_left_untouched(tmp_path: Path) -> None:
+    shared = tmp_path / "shared"
+    shared.mkdir(mode=0o755)
+    shared.chmod(0o755)
+    (shared / ".abcdefgh.tmp").write_bytes(b"someone else's download")
+    (shared / "upload.tmp").write_bytes(b"someone else's upload")
+
+    spool = ArtifactSpool(shared)
+    spool.put(b"artifact")
+
+    assert spool.directory == shared / SPOOL_SUBDIR
+    assert oct(shared.stat().st_mode & 0o777) == oct(0o755)
+    assert oct(spool.directory.stat().st_mode & 0o777) == oct(0o700)
+    assert (shared / ".abcdefgh.tmp").exists()
+    assert (shared / "upload.tmp").exists()
+
+
+def test_shared_spool_is_keyed_by_settings(tmp_path: Path) -> None:
+    config = RunpodConfig(api_key="k", endpoint_id="e", spool_dir=str(tmp_path))
+
+    assert get_shared_artifact_spool(config) is get_shared_artifact_spool(config)
+    assert get_shared_artifact_spool(config).directory == tmp_path / SPOOL_SUBDIR
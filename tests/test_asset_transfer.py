@@ -0,0 +1,244 @@
+import base64
+import hashlib
+import json
+import threading
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, cast
+
+import pytest
+
+from comfy_gpu_offload.api import JobStatus, RunpodClient, RunpodStatus
+from comfy_gpu_offload.config import ConfigError, RunpodConfig
+from comfy_gpu_offload.io import (
+    AssetTransferError,
+    AssetUpload,
+    AssetUploader,
+    ImageRegistry,
+    S3Client,
+    upload_image_payloads,
+)
+from comfy_gpu_offload.io.asset_transfer import MIN_PART_SIZE
+from comfy_gpu_offload.nodes.runpod_remote_execute import RunPodRemoteExecute
+
+
+class FakeS3:
+    """In-memory S3 stand-in implementing the calls AssetUploader makes."""
+
+    def __init__(self) -> None:
+        self.objects: dict[str, bytes] = {}
+        self.uploads: dict[str, dict[int, bytes]] = {}
+        self.aborted: list[str] = []
+        self.threads: set[str] = set()
+        self.presigned = 0
+        self.fail_part: int | None = None
+        self._lock = threading.Lock()
+
+    def _seen(self) -> None:
+        with self._lock:
+            self.threads.add(threading.current_thread().name)
+
+    def put_object(self, *, Bucket: str, Key: str, Body: bytes, **_: Any) -> Mapping[str, Any]:
+        self._seen()
+        self.objects[f"{Bucket}/{Key}"] = Body
+        return {"ETag": "etag"}
+
+    def head_object(self, *, Bucket: str, Key: str) -> Mapping[str, Any]:
+        if f"{Bucket}/{Key}" not in self.objects:
+            raise KeyError(Key)  # boto3 raises ClientError(404)
+        return {"ContentLength": len(self.objects[f"{Bucket}/{Key}"])}
+
+    def create_multipart_upload(self, *, Bucket: str, Key: str, **_: Any) -> Mapping[str, Any]:
+        upload_id = f"upload-{len(self.uploads)}"
+        self.uploads[upload_id] = {}
+        return {"UploadId": upload_id}
+
+    def upload_part(
+        self, *, Bucket: str, Key: str, UploadId: str, PartNumber: int, Body: bytes
+    ) -> Mapping[str, Any]:
+        self._seen()
+        if PartNumber == self.fail_part:
+            raise OSError("connection reset")
+        with self._lock:
+            self.uploads[UploadId][PartNumber] = Body
+        return {"ETag": f"etag-{PartNumber}"}
+
+    def complete_multipart_upload(
+        self, *, Bucket: str, Key: str, UploadId: str, MultipartUpload: Mapping[str, Any]
+    ) -> Mapping[str, Any]:
+        parts = self.uploads.pop(UploadId)
+        numbers = [part["PartNumber"] for part in MultipartUpload["Parts"]]
+        assert numbers == sorted(parts)
+        self.objects[f"{Bucket}/{Key}"] = b"".join(parts[number] for number in numbers)
+        return {}
+
+    def abort_multipart_upload(self, *, Bucket: str, Key: str, UploadId: str) -> Mapping[str, Any]:
+        self.aborted.append(UploadId)
+        self.uploads.pop(UploadId, None)
+        return {}
+
+    def generate_presigned_url(
+        self, client_method: str, Params: Mapping[str, Any], ExpiresIn: int
+    ) -> str:
+        self.presigned += 1
+        return (
+            f"https://s3.local/{Params['Bucket']}/{Params['Key']}"
+            f"?expires={ExpiresIn}&sig={self.presigned}"
+        )
+
+
+def _uploader(s3: FakeS3, **kwargs: Any) -> AssetUploader:
+    return AssetUploader(cast(S3Client, s3), "bucket", prefix="in/", max_workers=4, **kwargs)
+
+
+def test_small_assets_upload_in_parallel_keyed_by_content() -> None:
+    s3 = FakeS3()
+    assets = [AssetUpload(name=f"img{i}.png", data=bytes([i]) * 10) for i in range(8)]
+
+    refs = _uploader(s3).upload_many(assets)
+
+    assert [ref.name for ref in refs] == [asset.name for asset in assets]
+    digest = hashlib.sha256(bytes([3]) * 10).hexdigest()
+    assert refs[3].key == f"in/{digest}.png"
+    assert refs[3].content_type == "image/png"
+    assert s3.objects[f"bucket/in/{digest}.png"] == bytes([3]) * 10
+    assert refs[3].to_image_payload() == {
+        "name": "img3.png",
+        "url": refs[3].url,
+        "sha256": digest,
+        "type": "image/png",
+    }
+    assert all(name.startswith("asset-upload") for name in s3.threads)
+
+
+def test_large_files_use_multipart(tmp_path: Path) -> None:
+    s3 = FakeS3()
+    data = bytes(range(256)) * (MIN_PART_SIZE * 2 // 256 + 7)
+    path = tmp_path / "clip.mp4"
+    path.write_bytes(data)
+
+    ref = _uploader(s3, multipart_threshold=MIN_PART_SIZE, part_size=MIN_PART_SIZE).upload(
+        AssetUpload(name="clip.mp4", path=path)
+    )
+
+    assert s3.objects[f"bucket/{ref.key}"] == data
+    assert ref.size == len(data)
+    assert ref.content_type == "video/mp4"
+    assert s3.uploads == {}
+
+
+def test_failed_part_aborts_multipart_upload() -> None:
+    s3 = FakeS3()
+    s3.fail_part = 2
+    uploader = _uploader(s3, multipart_threshold=MIN_PART_SIZE, part_size=MIN_PART_SIZE)
+
+    with pytest.raises(AssetTransferError, match="connection reset"):
+        uploader.upload(AssetUpload(name="big.bin", data=b"x" * (MIN_PART_SIZE * 3)))
+
+    assert s3.aborted == ["upload-0"]
+    assert s3.objects == {}
+
+
+def test_presigned_urls_are_reused_for_half_their_lifetime() -> None:
+    s3 = FakeS3()
+    now = [0.0]
+    uploader = _uploader(s3, url_ttl_seconds=100, clock=lambda: now[0])
+    asset = AssetUpload(name="a.png", data=b"a")
+
+    first = uploader.upload(asset)
+    now[0] = 49.0
+    assert uploader.upload(asset).url == first.url
+    now[0] = 51.0
+    assert uploader.upload(asset).url != first.url
+
+
+def test_upload_image_payloads_replaces_inline_entries() -> None:
+    s3 = FakeS3()
+    images = [
+        {"name": "a.png", "image": base64.b64encode(b"pixels").decode()},
+        {"name": "mask.webp", "image": base64.b64encode(b"mask").decode()},
+        {"name": "remote.png", "url": "https://cdn.example/remote.png"},
+    ]
+
+    payloads = upload_image_payloads(_uploader(s3), images)
+
+    assert [entry["name"] for entry in payloads] == ["a.png", "mask.webp", "remote.png"]
+    assert all("image" not in entry for entry in payloads)
+    assert payloads[1]["sha256"] == hashlib.sha256(b"mask").hexdigest()
+    assert payloads[2] == images[2]
+    with pytest.raises(AssetTransferError, match="base64"):
+        upload_image_payloads(_uploader(s3), [{"name": "x", "image": "@@@"}])
+
+
+def test_upload_image_payloads_never_reads_local_paths(tmp_path: Path) -> None:
+    s3 = FakeS3()
+    secret = tmp_path / "secret.txt"
+    secret.write_bytes(b"token")
+
+    with pytest.raises(AssetTransferError, match="needs 'image' or 'url'"):
+        upload_image_payloads(_uploader(s3), [{"name": "x.png", "path": str(secret)}])
+
+    assert s3.objects == {}
+
+
+def test_known_keys_skip_upload_until_verification_fails() -> None:
+    s3 = FakeS3()
+    now = [0.0]
+    registry = ImageRegistry(verify_after_seconds=60, clock=lambda: now[0])
+    uploader = _uploader(s3, registry=registry)
+    asset = AssetUpload(name="a.png", data=b"a")
+    puts: list[str] = []
+    original_put = s3.put_object
+
+    def counting_put(**kwargs: Any) -> Mapping[str, Any]:
+        puts.append(kwargs["Key"])
+        return original_put(**kwargs)
+
+    s3.put_object = counting_put  # type: ignore[method-assign]
+
+    ref = uploader.upload(asset)
+    uploader.upload(asset)
+    assert puts == [ref.key]
+
+    s3.objects.clear()  # the bucket lifecycle rule expired the object
+    now[0] = 61.0
+    uploader.upload(asset)
+    assert puts == [ref.key, ref.key]
+
+
+def test_uploader_from_config_requires_bucket() -> None:
+    with pytest.raises(ConfigError):
+        AssetUploader.from_config(RunpodConfig(api_key="k", endpoint_id="e"))
+    uploader = AssetUploader.from_config(
+        RunpodConfig(api_key="k", endpoint_id="e", asset_bucket="b"),
+        client_factory=lambda _config: cast(S3Client, FakeS3()),
+    )
+    assert uploader.upload(AssetUpload(name="a", data=b"a")).key.startswith("comfy-gpu-offload/")
+
+
+def test_node_sends_presigned_references(monkeypatch: pytest.MonkeyPatch) -> None:
+    s3 = FakeS3()
+    submitted: list[Any] = []
+
+    class Client:
+        def submit_job_sync(self, payload: Any) -> JobStatus:
+            submitted.append(payload.payload)
+            return JobStatus(job_id="job", status=RunpodStatus.COMPLETED, output={})
+
+    node = RunPodRemoteExecute()
+    node.client_factory = lambda _config: cast(RunpodClient, Client())
+    node.asset_uploader_factory = lambda _config: _uploader(s3)
+    monkeypatch.setenv("RUNPOD_API_KEY", "k")
+    monkeypatch.setenv("RUNPOD_ENDPOINT_ID", "e")
+    images = [{"name": "in.png", "image": base64.b64encode(b"p" * 1000).decode()}]
+
+    node.execute(
+        workflow_json='{"nodes": []}',
+        images_json=json.dumps(images),
+        submit_mode="runsync",
+        upload_assets=True,
+    )
+
+    (image,) = submitted[0]["images"]
+    assert image["url"].startswith("https://s3.local/bucket/in/")
+    assert "image" not in image
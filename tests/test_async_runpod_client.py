@@ -0,0 +1,201 @@
+import asyncio
+import json
+from typing import Any, cast
+
+import aiohttp
+import pytest
+
+from comfy_gpu_offload.api import (
+    AsyncRunpodClient,
+    CircuitBreaker,
+    RetryPolicy,
+    RunpodApiError,
+    RunpodCancelledError,
+    RunpodJobError,
+    RunpodStatus,
+)
+from comfy_gpu_offload.api.retry import CircuitBreakerRegistry
+from comfy_gpu_offload.config import RunpodConfig
+
+
+class FakeAsyncResponse:
+    def __init__(self, status: int, json_data: Any) -> None:
+        self.status = status
+        self.headers: dict[str, str] = {}
+        self._body = json_data if isinstance(json_data, str) else json.dumps(json_data)
+
+    async def __aenter__(self) -> "FakeAsyncResponse":
+        return self
+
+    async def __aexit__(self, *_exc: Any) -> None:
+        return None
+
+    async def read(self) -> bytes:
+        return self._body.encode("utf-8")
+
+
+class FakeAsyncSession:
+    """Routes requests by URL so many concurrent jobs can share one fake pool."""
+
+    def __init__(self, responses: dict[str, list[FakeAsyncResponse]]) -> None:
+        self.responses = {url: list(items) for url, items in responses.items()}
+        self.calls: list[dict[str, Any]] = []
+
+    def request(self, method: str, url: str, **kwargs: Any) -> FakeAsyncResponse:
+        self.calls.append({"method": method, "url": url, **kwargs})
+        queue = self.responses.get(url)
+        if not queue:
+            raise AssertionError(f"No more fake responses for {url}")
+        return queue.pop(0)
+
+
+BASE = "https://api.runpod.ai/v2/e"
+
+
+def make_client(
+    responses: dict[str, list[FakeAsyncResponse]],
+) -> tuple[AsyncRunpodClient, FakeAsyncSession]:
+    session = FakeAsyncSession(responses)
+    cfg = RunpodConfig(api_key="k", endpoint_id="e")
+    client = AsyncRunpodClient(
+        cfg,
+        session=cast(aiohttp.ClientSession, session),
+        retry_policy=RetryPolicy(backoff_seconds=0.0),
+    )
+    return client, session
+
+
+def test_async_submit_job_returns_id_and_sets_auth_header() -> None:
+    client, session = make_client(
+        {f"{BASE}/run": [FakeAsyncResponse(200, {"id": "job-1", "status": RunpodStatus.IN_QUEUE})]}
+    )
+
+    job_id = asyncio.run(client.submit_job({"workflow": {"nodes": []}}))
+
+    assert job_id == "job-1"
+    call = session.calls[0]
+    assert call["method"] == "POST"
+    assert call["headers"]["Authorization"].startswith("Bearer ")
+    assert call["ssl"] is True
+    assert call["json"] == {"input": {"workflow": {"nodes": []}}}
+
+
+def test_async_poll_many_jobs_concurrently() -> None:
+    job_ids = [f"job-{index}" for index in range(200)]
+    responses = {
+        f"{BASE}/status/{job_id}": [
+            FakeAsyncResponse(200, {"id": job_id, "status": RunpodStatus.IN_PROGRESS}),
+            FakeAsyncResponse(
+                200, {"id": job_id, "status": RunpodStatus.COMPLETED, "output": {"id": job_id}}
+            ),
+        ]
+        for job_id in job_ids
+    }
+    client, session = make_client(responses)
+
+    async def run() -> list[Any]:
+        return await asyncio.gather(
+            *(client.poll_job(job_id, poll_interval_seconds=0.01) for job_id in job_ids)
+        )
+
+    statuses = asyncio.run(run())
+
+    assert [status.output["id"] for status in statuses] == job_ids
+    assert len(session.calls) == 400
+
+
+def test_async_poll_job_raises_on_failure_status() -> None:
+    client, _ = make_client(
+        {
+            f"{BASE}/status/job-1": [
+                FakeAsyncResponse(
+                    200, {"id": "job-1", "status": RunpodStatus.FAILED, "error": "boom"}
+                )
+            ]
+        }
+    )
+
+    with pytest.raises(RunpodJobError):
+        asyncio.run(client.poll_job("job-1", poll_interval_seconds=0.01))
+
+
+def test_async_poll_job_can_cancel() -> None:
+    client, _ = make_client(
+        {
+            f"{BASE}/status/job-1": [
+                FakeAsyncResponse(200, {"id": "job-1", "status": RunpodStatus.IN_QUEUE})
+            ]
+        }
+    )
+
+    with pytest.raises(RunpodCancelledError):
+        asyncio.run(client.poll_job("job-1", should_continue=lambda: False))
+
+
+def test_async_cancel_job_defaults_status() -> None:
+    client, _ = make_client({f"{BASE}/cancel/job-1": [FakeAsyncResponse(200, {})]})
+
+    status = asyncio.run(client.cancel_job("job-1"))
+
+    assert status.status == RunpodStatus.CANCELLED
+
+
+@pytest.mark.parametrize(
+    "response",
+    [FakeAsyncResponse(404, {"error": "missing"}), FakeAsyncResponse(200, "not-json")],
+)
+def test_async_errors_raise_api_error(response: FakeAsyncResponse) -> None:
+    client, _ = make_client({f"{BASE}/status/job-1": [response]})
+
+    with pytest.raises(RunpodApiError):
+        asyncio.run(client.get_job_status("job-1"))
+
+
+class HangingResponse(FakeAsyncResponse):
+    async def read(self) -> bytes:
+        await asyncio.sleep(3600)
+        raise AssertionError("unreachable")
+
+
+def test_cancelled_half_open_probe_is_released() -> None:
+    clock = [0.0]
+    breaker = CircuitBreaker(
+        failure_threshold=1, reset_timeout_seconds=10.0, clock=lambda: clock[0]
+    )
+    breakers = CircuitBreakerRegistry(failure_threshold=1, reset_timeout_seconds=10.0)
+    breakers._breakers["status"] = breaker
+    breaker.record_failure()
+    clock[0] = 10.0  # half-open: the next request is the probe
+    session = FakeAsyncSession({f"{BASE}/status/job-1": [HangingResponse(200, {})]})
+    client = AsyncRunpodClient(
+        RunpodConfig(api_key="k", endpoint_id="e"),
+        session=cast(aiohttp.ClientSession, session),
+        breakers=breakers,
+    )
+
+    async def cancel_probe() -> None:
+        task = asyncio.create_task(client.get_job_status("job-1"))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(cancel_probe())
+
+    assert breaker.allow()
+
+
+def test_async_status_retries_transient_errors() -> None:
+    client, session = make_client(
+        {
+            f"{BASE}/status/job-1": [
+                FakeAsyncResponse(503, {"error": "busy"}),
+                FakeAsyncResponse(200, {"id": "job-1", "status": RunpodStatus.IN_QUEUE}),
+            ]
+        }
+    )
+
+    status = asyncio.run(client.get_job_status("job-1"))
+
+    assert status.status == RunpodStatus.IN_QUEUE
+    assert len(session.calls) == 2
@@ -0,0 +1,92 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from comfy_gpu_offload.api import (
+    JobStatus,
+    RunpodApiError,
+    RunpodJobError,
+    RunpodStatus,
+    SubmissionCoalescer,
+)
+
+
+def test_identical_inflight_submissions_share_one_job() -> None:
+    coalescer = SubmissionCoalescer()
+    release = threading.Event()
+    submits: list[str] = []
+    waits: list[str] = []
+
+    def submit() -> JobStatus:
+        submits.append("submit")
+        return JobStatus(job_id="job-1", status=RunpodStatus.IN_QUEUE)
+
+    def wait(job_id: str) -> JobStatus:
+        waits.append(job_id)
+        release.wait(timeout=5)
+        return JobStatus(job_id=job_id, status=RunpodStatus.COMPLETED, output={"ok": True})
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [pool.submit(coalescer.run, "key", submit, wait) for _ in range(4)]
+        while len(waits) < 4:
+            threading.Event().wait(0.01)
+        release.set()
+        results = [future.result(timeout=5) for future in futures]
+
+    assert submits == ["submit"]
+    assert {result.job_id for result in results} == {"job-1"}
+    assert coalescer.in_flight == 0
+
+
+def test_distinct_keys_submit_separately_and_key_is_released() -> None:
+    coalescer = SubmissionCoalescer()
+    counter = iter(range(10))
+
+    def submit() -> JobStatus:
+        return JobStatus(job_id=f"job-{next(counter)}", status=RunpodStatus.COMPLETED)
+
+    def wait(job_id: str) -> JobStatus:
+        raise AssertionError("terminal submissions should not be polled")
+
+    first = coalescer.run("a", submit, wait)
+    second = coalescer.run("b", submit, wait)
+    again = coalescer.run("a", submit, wait)
+
+    assert [first.job_id, second.job_id, again.job_id] == ["job-0", "job-1", "job-2"]
+
+
+def test_submit_failure_reaches_waiting_followers() -> None:
+    coalescer = SubmissionCoalescer()
+    entered = threading.Event()
+    release = threading.Event()
+
+    def submit() -> JobStatus:
+        entered.set()
+        release.wait(timeout=5)
+        raise RunpodApiError("boom")
+
+    def wait(job_id: str) -> JobStatus:
+        raise AssertionError("unreachable")
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        leader = pool.submit(coalescer.run, "key", submit, wait)
+        entered.wait(timeout=5)
+        follower = pool.submit(coalescer.run, "key", submit, wait)
+        release.set()
+        with pytest.raises(RunpodApiError):
+            leader.result(timeout=5)
+        with pytest.raises(RunpodApiError):
+            follower.result(timeout=5)
+    assert coalescer.in_flight == 0
+
+
+def test_failed_terminal_submission_raises_job_error() -> None:
+    coalescer = SubmissionCoalescer()
+
+    with pytest.raises(RunpodJobError):
+        coalescer.run(
+            "key",
+            lambda: JobStatus(job_id="job-1", status=RunpodStatus.FAILED, error="oom"),
+            lambda job_id: JobStatus(job_id=job_id, status=RunpodStatus.COMPLETED),
+        )
@@ -1,6 +1,6 @@
 import pytest
 
-from comfy_gpu_offload.config import ConfigError, load_runpod_config
+from comfy_gpu_offload.config import ConfigError, load_runpod_config, load_runpod_config_cached
 
 
 def test_load_runpod_config_happy_path() -> None:
@@ -17,6 +17,8 @@ def test_load_runpod_config_happy_path() -> None:
     assert cfg.verify_tls is True
     assert cfg.poll_interval_seconds == 3.0
     assert cfg.max_poll_duration_seconds == 900.0
+    assert cfg.runsync_wait_seconds == 30.0
+    assert cfg.result_cache_dir is None
 
 
 def test_load_runpod_config_overrides_and_parsing() -> None:
@@ -28,6 +30,10 @@ def test_load_runpod_config_overrides_and_parsing() -> None:
         "RUNPOD_VERIFY_TLS": "false",
         "RUNPOD_POLL_INTERVAL": "1.2",
         "RUNPOD_MAX_POLL_DURATION": "123",
+        "RUNPOD_RUNSYNC_WAIT": "12.5",
+        "RUNPOD_MAX_RETRIES": "0",
+        "RUNPOD_CIRCUIT_FAILURE_THRESHOLD": "2",
+        "RUNPOD_HTTP_POOL_SIZE": "64",
     }
     cfg = load_runpod_config(env)
 
@@ -36,6 +42,10 @@ def test_load_runpod_config_overrides_and_parsing() -> None:
     assert cfg.verify_tls is False
     assert cfg.poll_interval_seconds == pytest.approx(1.2)
     assert cfg.max_poll_duration_seconds == pytest.approx(123.0)
+    assert cfg.runsync_wait_seconds == pytest.approx(12.5)
+    assert cfg.max_retries == 0
+    assert cfg.circuit_failure_threshold == 2
+    assert cfg.http_pool_size == 64
 
 
 @pytest.mark.parametrize(
@@ -56,6 +66,8 @@ def test_load_runpod_config_missing_required(env: dict[str, str], expected_messa
     [
         {"RUNPOD_API_KEY": "k", "RUNPOD_ENDPOINT_ID": "e", "RUNPOD_VERIFY_TLS": "maybe"},
         {"RUNPOD_API_KEY": "k", "RUNPOD_ENDPOINT_ID": "e", "RUNPOD_REQUEST_TIMEOUT": "0"},
+        {"RUNPOD_API_KEY": "k", "RUNPOD_ENDPOINT_ID": "e", "RUNPOD_MAX_RETRIES": "many"},
+        {"RUNPOD_API_KEY": "k", "RUNPOD_ENDPOINT_ID": "e", "RUNPOD_CIRCUIT_FAILURE_THRESHOLD": "0"},
     ],
 )
 def test_load_runpod_config_invalid_values(bad_env: dict[str, str]) -> None:
@@ -71,3 +83,50 @@ def test_load_runpod_config_requires_https() -> None:
     }
     with pytest.raises(ConfigError):
         load_runpod_config(env)
+
+
+def test_load_runpod_config_asset_store() -> None:
+    env = {
+        "RUNPOD_API_KEY": "k",
+        "RUNPOD_ENDPOINT_ID": "e",
+        "RUNPOD_ASSET_BUCKET": "inputs",
+        "RUNPOD_ASSET_ENDPOINT_URL": "https://minio.local:9000/",
+        "RUNPOD_ASSET_URL_TTL": "600",
+    }
+    config = load_runpod_config(env)
+    assert config.asset_bucket == "inputs"
+    assert config.asset_endpoint_url == "https://minio.local:9000"
+    assert config.asset_url_ttl_seconds == 600.0
+    assert config.asset_prefix == "comfy-gpu-offload/"
+
+    with pytest.raises(ConfigError):
+        load_runpod_config({**env, "RUNPOD_ASSET_ENDPOINT_URL": "http://minio.local:9000"})
+
+
+def test_load_runpod_config_spool() -> None:
+    env = {
+        "RUNPOD_API_KEY": "k",
+        "RUNPOD_ENDPOINT_ID": "e",
+        "RUNPOD_SPOOL_DIR": " /var/tmp/spool ",
+        "RUNPOD_SPOOL_MAX_BYTES": "1048576",
+        "RUNPOD_SPOOL_TTL": "60",
+    }
+    config = load_runpod_config(env)
+    assert config.spool_dir == "/var/tmp/spool"
+    assert config.spool_max_bytes == 1_048_576
+    assert config.spool_ttl_seconds == 60.0
+
+    with pytest.raises(ConfigError):
+        load_runpod_config({**env, "RUNPOD_SPOOL_MAX_BYTES": "0"})
+
+
+def test_cached_config_is_reused_until_env_changes() -> None:
+    env = {"RUNPOD_API_KEY": "k", "RUNPOD_ENDPOINT_ID": "e"}
+
+    first = load_runpod_config_cached(env)
+    second = load_runpod_config_cached(dict(env))
+    changed = load_runpod_config_cached({**env, "RUNPOD_POLL_INTERVAL": "1"})
+
+    assert second is first
+    assert changed is not first
+    assert changed.poll_interval_seconds == 1.0
@@ -0,0 +1,133 @@
+import base64
+import hashlib
+import json
+from typing import Any, cast
+
+import pytest
+
+from comfy_gpu_offload.api import JobStatus, RunpodClient, RunpodStatus
+from comfy_gpu_offload.io import (
+    ImageBlobMissingError,
+    ImageRegistry,
+    InMemoryBlobStore,
+    dedupe_image_payloads,
+    image_digest,
+    resolve_image_refs,
+)
+from comfy_gpu_offload.nodes.runpod_remote_execute import RunPodRemoteExecute
+
+PIXELS = base64.b64encode(b"init image").decode()
+DIGEST = hashlib.sha256(b"init image").hexdigest()
+
+
+def test_registry_is_a_bounded_lru_per_scope() -> None:
+    registry = ImageRegistry(max_entries=2)
+    registry.add("endpoint", ["a", "b"])
+    assert registry.is_known("endpoint", "a")  # refreshes "a"
+    registry.add("endpoint", ["c"])
+
+    assert not registry.is_known("endpoint", "b")
+    assert registry.is_known("endpoint", "a")
+    assert not registry.is_known("other", "a")
+    registry.discard("endpoint", ["a"])
+    assert len(registry) == 1
+
+
+def test_stale_entries_are_verified_before_reuse() -> None:
+    now = [0.0]
+    registry = ImageRegistry(verify_after_seconds=10, clock=lambda: now[0])
+    registry.add("bucket", ["a"])
+    checks: list[str] = []
+
+    def gone(digest: str) -> bool:
+        checks.append(digest)
+        return False
+
+    assert registry.is_known("bucket", "a", verify=gone)
+    now[0] = 11.0
+    assert not registry.is_known("bucket", "a", verify=gone)
+    assert checks == ["a"]
+    assert len(registry) == 0
+
+
+def test_dedupe_sends_known_images_by_reference() -> None:
+    registry = ImageRegistry()
+    images = [
+        {"name": "init.png", "image": PIXELS, "type": "image/png"},
+        {"name": "ref.png", "url": "https://cdn.example/ref.png"},
+    ]
+
+    first = dedupe_image_payloads(registry, "endpoint", images)
+    registry.add("endpoint", first.digests)
+    second = dedupe_image_payloads(registry, "endpoint", images)
+
+    assert first.digests == (DIGEST,)
+    assert first.images[0] == {**images[0], "sha256": DIGEST}
+    assert second.images == [
+        {"name": "init.png", "sha256": DIGEST, "type": "image/png"},
+        images[1],
+    ]
+    assert second.inline == first.images
+    with pytest.raises(ValueError, match="base64"):
+        image_digest({"name": "x", "image": "not base64!"})
+
+
+def test_worker_stores_inline_images_and_resolves_references() -> None:
+    store = InMemoryBlobStore(max_entries=1)
+    full = {"images": [{"name": "init.png", "image": PIXELS, "sha256": DIGEST}], "seed": 1}
+    ref = {"images": [{"name": "init.png", "sha256": DIGEST}], "seed": 2}
+
+    assert resolve_image_refs(full, store) == full
+    assert resolve_image_refs(ref, store) == {**ref, "images": full["images"]}
+
+    store.put("f" * 64, "Zg==")  # evicts the init image
+    with pytest.raises(ImageBlobMissingError, match=f"image_blob_missing: {DIGEST}"):
+        resolve_image_refs(ref, store)
+    with pytest.raises(ValueError, match="does not match"):
+        resolve_image_refs({"images": [{"name": "x", "image": "Zg==", "sha256": DIGEST}]}, store)
+
+
+def test_node_references_known_images_and_resends_missing_blobs(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    store = InMemoryBlobStore()
+    submitted: list[dict[str, Any]] = []
+
+    class WorkerClient:
+        def submit_job_sync(self, payload: Any) -> JobStatus:
+            submitted.append(payload.payload)
+            try:
+                resolved = resolve_image_refs(payload.payload, store)
+            except ImageBlobMissingError as exc:
+                return JobStatus(
+                    job_id="job",
+                    status=RunpodStatus.FAILED,
+                    error=str(exc),
+                    error_code=exc.code,
+                )
+            return JobStatus(job_id="job", status=RunpodStatus.COMPLETED, output=resolved)
+
+    node = RunPodRemoteExecute()
+    node.client_factory = lambda _config: cast(RunpodClient, WorkerClient())
+    registry = ImageRegistry()
+    node.image_registry_factory = lambda: registry
+    monkeypatch.setenv("RUNPOD_API_KEY", "k")
+    monkeypatch.setenv("RUNPOD_ENDPOINT_ID", "e")
+
+    def run(seed: int) -> dict[str, Any]:
+        node.execute(
+            workflow_json='{"nodes": []}',
+            params_json=json.dumps({"seed": seed}),
+            images_json=json.dumps([{"name": "init.png", "image": PIXELS}]),
+            submit_mode="runsync",
+            dedupe_images=True,
+        )
+        return submitted[-1]["images"][0]
+
+    assert "image" in run(1)
+    assert run(2) == {"name": "init.png", "sha256": DIGEST}
+
+    store = InMemoryBlobStore()  # a fresh worker without the blob
+    assert "image" in run(3)
+    assert "image" not in submitted[-2]["images"][0]
+    assert run(4) == {"name": "init.png", "sha256": DIGEST}
@@ -1,9 +1,14 @@
 from pathlib import Path
 
+import pytest
 from PIL import Image
 
 from comfy_gpu_offload.io import (
+    FAST_PNG,
+    LOSSLESS_WEBP,
     base64_to_image,
+    encode_image_payloads,
+    encode_images_base64,
     image_to_base64,
     new_temp_dir,
     remove_path_safely,
@@ -40,3 +45,41 @@ def test_image_base64_round_trip() -> None:
 
     assert decoded.size == (2, 2)
     assert decoded.mode == "RGB"
+
+
+def test_codec_round_trip_is_lossless() -> None:
+    image = Image.new("RGB", (4, 3), color=(10, 200, 30))
+
+    for codec in (FAST_PNG, LOSSLESS_WEBP):
+        decoded = base64_to_image(image_to_base64(image, codec=codec))
+        assert decoded.format == codec.format
+        assert decoded.convert("RGB").tobytes() == image.tobytes()
+
+
+def test_encode_images_base64_keeps_input_order() -> None:
+    images = [Image.new("L", (2, 2), color=shade) for shade in range(0, 250, 25)]
+
+    encoded = encode_images_base64(images)
+
+    assert [base64_to_image(data).getpixel((0, 0)) for data in encoded] == list(range(0, 250, 25))
+
+
+def test_encode_image_payloads_splits_float_batch() -> None:
+    np = pytest.importorskip("numpy")
+    batch = np.zeros((2, 3, 4, 3), dtype=np.float32)
+    batch[1] = 1.0
+
+    payloads = encode_image_payloads(batch, codec=LOSSLESS_WEBP)
+
+    assert [payload["name"] for payload in payloads] == ["image_0.webp", "image_1.webp"]
+    assert all(payload["type"] == "image/webp" for payload in payloads)
+    second = base64_to_image(payloads[1]["image"])
+    assert second.size == (4, 3)
+    assert second.convert("RGB").getpixel((0, 0)) == (255, 255, 255)
+
+
+def test_encode_images_base64_rejects_bad_shape() -> None:
+    np = pytest.importorskip("numpy")
+
+    with pytest.raises(ValueError, match="shape"):
+        encode_images_base64(np.zeros((3, 4, 5)))
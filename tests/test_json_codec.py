@@ -0,0 +1,75 @@
+import json
+import math
+
+import pytest
+
+from comfy_gpu_offload.workflow import (
+    WorkflowLoadError,
+    canonical_json_bytes,
+    content_hash,
+    json_codec,
+)
+
+BACKENDS = ["default", "stdlib"]
+
+
+@pytest.fixture(params=BACKENDS)
+def codec(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    if request.param == "stdlib":
+        monkeypatch.setattr(json_codec, "_orjson", None)
+    return json_codec.backend_name()
+
+
+def test_roundtrip_matches_stdlib_compact_encoding(codec: str) -> None:
+    value = {"b": [1, 2.5, None, True], "a": {"text": "héllo"}}
+
+    encoded = json_codec.dumps(value)
+
+    assert json_codec.loads(encoded) == value
+    assert json_codec.loads(encoded.decode("utf-8")) == value
+    assert json.loads(encoded) == value
+    assert b" " not in encoded
+
+
+def test_sort_keys_is_canonical(codec: str) -> None:
+    assert json_codec.dumps({"b": 1, "a": {"d": 2, "c": 3}}, sort_keys=True) == (
+        b'{"a":{"c":3,"d":2},"b":1}'
+    )
+
+
+def test_decode_errors_are_stdlib_errors(codec: str) -> None:
+    with pytest.raises(json.JSONDecodeError):
+        json_codec.loads(b"{not json")
+
+
+def test_unsupported_values_raise_type_error(codec: str) -> None:
+    with pytest.raises(TypeError):
+        json_codec.dumps({"value": object()})
+
+
+def test_non_finite_numbers_are_rejected_when_parsed(codec: str) -> None:
+    for text in ("[NaN]", "[Infinity]", "[-Infinity]", "[1e999]", "[-1e400]"):
+        with pytest.raises(json.JSONDecodeError):
+            json_codec.loads(text)
+    assert json_codec.loads("[1e308, -0.0]") == [1e308, -0.0]
+
+
+def test_non_finite_floats_fail_hashing_as_workflow_errors(codec: str) -> None:
+    with pytest.raises(WorkflowLoadError, match="cannot be hashed"):
+        content_hash({"nodes": [{"widgets_values": [math.nan]}]})
+
+
+def test_content_hash_does_not_depend_on_the_backend(monkeypatch: pytest.MonkeyPatch) -> None:
+    workflow = {"nodes": [{"id": 1, "widgets_values": [1e-05, 0.1, 2.5e20, "héllo"]}]}
+    with_default = content_hash(workflow)
+
+    monkeypatch.setattr(json_codec, "_orjson", None)
+
+    assert content_hash(workflow) == with_default
+    assert canonical_json_bytes(workflow) == json.dumps(
+        workflow, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+    ).encode("utf-8")
+
+
+def test_large_ints_fall_back_to_stdlib() -> None:
+    assert json_codec.loads(json_codec.dumps({"n": 2**70})) == {"n": 2**70}
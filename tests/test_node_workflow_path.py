@@ -4,7 +4,7 @@ from typing import Any, Callable, cast
 
 import pytest
 
-from comfy_gpu_offload.api import RunpodStatus, RunpodClient
+from comfy_gpu_offload.api import JobStatus, RunpodStatus, RunpodClient
 from comfy_gpu_offload.nodes.runpod_remote_execute import RunPodRemoteExecute
 
 
@@ -15,16 +15,15 @@ class FakeClient(RunpodClient):  # type: ignore[misc]
         self.output = {"ok": True}
 
     def submit_job(self, payload: Any) -> str:  # type: ignore[override]
-        self.submitted_payload = payload
+        self.submitted_payload = payload.payload
         return self.job_id
 
-    def poll_job(self, job_id: str, timeout_seconds: float | None = None):  # type: ignore[override]
-        class Status:
-            def __init__(self, outer: FakeClient) -> None:
-                self.status = RunpodStatus.COMPLETED
-                self.output = outer.output
+    def submit_job_sync(self, payload: Any) -> JobStatus:  # type: ignore[override]
+        self.submitted_payload = payload.payload
+        return JobStatus(job_id=self.job_id, status=RunpodStatus.COMPLETED, output=self.output)
 
-        return Status(self)
+    def get_job_status(self, job_id: str) -> JobStatus:  # type: ignore[override]
+        return JobStatus(job_id=job_id, status=RunpodStatus.COMPLETED, output=self.output)
 
 
 def test_node_loads_workflow_from_path(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
@@ -1,10 +1,17 @@
 import json
+import logging
 from typing import Any, cast
 
 import pytest
 
-from comfy_gpu_offload.api import RunpodClient, RunpodStatus
+from comfy_gpu_offload.api import JobStatus, RunpodClient, RunpodStatus
 from comfy_gpu_offload.nodes.runpod_remote_execute import RunPodRemoteExecute
+from comfy_gpu_offload.workflow import (
+    InMemoryTemplateStore,
+    TemplateMissingError,
+    TemplateRegistry,
+    resolve_template_input,
+)
 
 
 class FakeClient:
@@ -12,19 +19,19 @@ class FakeClient:
         self.submitted_payload: dict[str, Any] | None = None
         self.job_id = "job-xyz"
         self.status = RunpodStatus.COMPLETED
+        self.sync_status = RunpodStatus.COMPLETED
         self.output = {"ok": True}
 
     def submit_job(self, payload: Any) -> str:
-        self.submitted_payload = payload
+        self.submitted_payload = payload.payload
         return self.job_id
 
-    def poll_job(self, job_id: str, timeout_seconds: float | None = None):
-        class Status:
-            def __init__(self, outer: FakeClient) -> None:
-                self.status = outer.status
-                self.output = outer.output
+    def submit_job_sync(self, payload: Any) -> JobStatus:
+        self.submitted_payload = payload.payload
+        return JobStatus(job_id=self.job_id, status=self.sync_status, output=self.output)
 
-        return Status(self)
+    def get_job_status(self, job_id: str) -> JobStatus:
+        return JobStatus(job_id=job_id, status=self.status, output=self.output)
 
 
 def test_node_happy_path(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -89,3 +96,208 @@ def test_node_validates_images_json(monkeypatch: pytest.MonkeyPatch) -> None:
 
     with pytest.raises(RuntimeError):
         node.execute(workflow_json='{"nodes":[]}', use_runpod=True, images_json='{"not":"array"}')
+
+
+@pytest.mark.parametrize(
+    ("submit_mode", "sync_status", "expected_calls"),
+    [
+        ("run", RunpodStatus.COMPLETED, ["submit_job", "get_job_status"]),
+        ("runsync", RunpodStatus.COMPLETED, ["submit_job_sync"]),
+        ("runsync", RunpodStatus.IN_PROGRESS, ["submit_job_sync", "get_job_status"]),
+        ("auto", RunpodStatus.COMPLETED, ["submit_job_sync"]),
+    ],
+)
+def test_node_submit_modes(
+    monkeypatch: pytest.MonkeyPatch, submit_mode: str, sync_status: str, expected_calls: list[str]
+) -> None:
+    calls: list[str] = []
+
+    class RecordingClient(FakeClient):
+        def submit_job(self, payload: Any) -> str:
+            calls.append("submit_job")
+            return super().submit_job(payload)
+
+        def submit_job_sync(self, payload: Any) -> JobStatus:
+            calls.append("submit_job_sync")
+            return super().submit_job_sync(payload)
+
+        def get_job_status(self, job_id: str) -> JobStatus:
+            calls.append("get_job_status")
+            return super().get_job_status(job_id)
+
+    fake_client = RecordingClient()
+    fake_client.sync_status = sync_status
+    node = RunPodRemoteExecute()
+    node.client_factory = lambda _config: cast(RunpodClient, fake_client)
+    monkeypatch.setenv("RUNPOD_API_KEY", "k")
+    monkeypatch.setenv("RUNPOD_ENDPOINT_ID", "e")
+
+    status, job_id, output_json = node.execute(
+        workflow_json='{"nodes": []}', submit_mode=submit_mode, timeout_seconds=5.0
+    )
+
+    assert status == RunpodStatus.COMPLETED
+    assert job_id == fake_client.job_id
+    assert json.loads(output_json) == fake_client.output
+    assert calls == expected_calls
+
+
+def test_node_reuses_cached_result_for_identical_payload(monkeypatch: pytest.MonkeyPatch) -> None:
+    fake_client = FakeClient()
+    node = RunPodRemoteExecute()
+    node.client_factory = lambda _config: cast(RunpodClient, fake_client)
+    monkeypatch.setenv("RUNPOD_API_KEY", "k")
+    monkeypatch.setenv("RUNPOD_ENDPOINT_ID", "e")
+
+    first = node.execute(workflow_json='{"nodes": []}', params_json='{"seed": 1}')
+    fake_client.output = {"ok": False}
+    fake_client.submitted_payload = None
+    second = node.execute(workflow_json='{"nodes": []}', params_json='{"seed": 1}')
+    bypassed = node.execute(
+        workflow_json='{"nodes": []}', params_json='{"seed": 1}', use_result_cache=False
+    )
+
+    assert second == first
+    assert fake_client.submitted_payload is not None  # only the bypassed run was submitted
+    assert json.loads(bypassed[2]) == {"ok": False}
+
+
+def test_node_prunes_workflow_when_requested(monkeypatch: pytest.MonkeyPatch) -> None:
+    fake_client = FakeClient()
+    node = RunPodRemoteExecute()
+    node.client_factory = lambda _config: cast(RunpodClient, fake_client)
+    monkeypatch.setenv("RUNPOD_API_KEY", "k")
+    monkeypatch.setenv("RUNPOD_ENDPOINT_ID", "e")
+    workflow = {
+        "nodes": [{"id": 1, "type": "SaveImage", "pos": [0, 0]}, {"id": 2, "type": "Note"}],
+        "groups": [],
+    }
+
+    node.execute(workflow_json=json.dumps(workflow), submit_mode="run", prune_workflow=True)
+
+    assert fake_client.submitted_payload is not None
+    assert fake_client.submitted_payload["workflow"] == {"nodes": [{"id": 1, "type": "SaveImage"}]}
+
+
+def test_node_prune_keeps_custom_output_nodes_and_logs_savings(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    fake_client = FakeClient()
+    node = RunPodRemoteExecute()
+    node.client_factory = lambda _config: cast(RunpodClient, fake_client)
+    monkeypatch.setenv("RUNPOD_API_KEY", "k")
+    monkeypatch.setenv("RUNPOD_ENDPOINT_ID", "e")
+    workflow = {
+        "nodes": [
+            {"id": 1, "type": "SaveImage"},
+            {"id": 2, "type": "VHS_VideoCombine"},
+            {"id": 3, "type": "Note"},
+        ]
+    }
+
+    with caplog.at_level(logging.INFO):
+        node.execute(
+            workflow_json=json.dumps(workflow),
+            submit_mode="run",
+            prune_workflow=True,
+            output_node_types=" VHS_VideoCombine, ",
+        )
+
+    assert fake_client.submitted_payload is not None
+    assert [n["id"] for n in fake_client.submitted_payload["workflow"]["nodes"]] == [1, 2]
+    assert "removed 1 node(s) (types: Note) and saved" in caplog.text
+
+
+def test_node_sends_template_delta_and_resends_when_worker_lacks_it(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    store = InMemoryTemplateStore()
+    submitted: list[dict[str, Any]] = []
+
+    class WorkerClient(FakeClient):
+        def submit_job_sync(self, payload: Any) -> JobStatus:
+            submitted.append(payload.payload)
+            try:
+                resolved = resolve_template_input(payload.payload, store)
+            except TemplateMissingError as exc:
+                return JobStatus(
+                    job_id="job-1",
+                    status=RunpodStatus.FAILED,
+                    error=str(exc),
+                    error_code=exc.code,
+                )
+            return JobStatus(job_id="job-1", status=RunpodStatus.COMPLETED, output=resolved)
+
+    node = RunPodRemoteExecute()
+    node.client_factory = lambda _config: cast(RunpodClient, WorkerClient())
+    registry = TemplateRegistry()
+    node.template_registry_factory = lambda: registry
+    monkeypatch.setenv("RUNPOD_API_KEY", "k")
+    monkeypatch.setenv("RUNPOD_ENDPOINT_ID", "e")
+
+    def run(seed: int) -> dict[str, Any]:
+        workflow = {"nodes": [{"id": 1, "type": "KSampler", "widgets_values": [seed]}]}
+        _, _, output_json = node.execute(
+            workflow_json=json.dumps(workflow), submit_mode="runsync", use_workflow_template=True
+        )
+        assert json.loads(output_json)["workflow"] == workflow
+        return submitted[-1]
+
+    assert "workflow" in run(1)  # first run registers the template
+    assert run(2)["workflow_overrides"] == {"1": {"0": 2}}
+
+    store = InMemoryTemplateStore()  # a cold worker without the template
+    assert "workflow" in run(3)
+    assert [sorted(payload) for payload in submitted[-2:]] == [
+        ["workflow_hash", "workflow_overrides"],
+        ["workflow", "workflow_hash"],
+    ]
+    assert "workflow_overrides" in run(4)
+
+
+def test_node_encodes_image_input(monkeypatch: pytest.MonkeyPatch) -> None:
+    np = pytest.importorskip("numpy")
+    fake_client = FakeClient()
+    node = RunPodRemoteExecute()
+    node.client_factory = lambda _config: cast(RunpodClient, fake_client)
+    monkeypatch.setenv("RUNPOD_API_KEY", "k")
+    monkeypatch.setenv("RUNPOD_ENDPOINT_ID", "e")
+
+    node.execute(
+        workflow_json='{"nodes": []}',
+        submit_mode="run",
+        images_json='[{"name":"x","image":"ZmFrZQ=="}]',
+        image=np.ones((2, 2, 2, 3), dtype=np.float32),
+        image_codec="webp_lossless",
+    )
+
+    assert fake_client.submitted_payload is not None
+    names = [image["name"] for image in fake_client.submitted_payload["images"]]
+    assert names == ["x", "image_0.webp", "image_1.webp"]
+
+    with pytest.raises(RuntimeError, match="image_codec"):
+        node.execute(workflow_json='{"nodes": []}', image=np.ones((1, 2, 2, 3)), image_codec="gif")
+
+
+def test_node_sends_latent_as_binary_tensor(monkeypatch: pytest.MonkeyPatch) -> None:
+    np = pytest.importorskip("numpy")
+    from comfy_gpu_offload.io import decode_tensor
+
+    fake_client = FakeClient()
+    node = RunPodRemoteExecute()
+    node.client_factory = lambda _config: cast(RunpodClient, fake_client)
+    monkeypatch.setenv("RUNPOD_API_KEY", "k")
+    monkeypatch.setenv("RUNPOD_ENDPOINT_ID", "e")
+    samples = np.full((1, 4, 8, 8), 0.5, dtype=np.float32)
+
+    node.execute(workflow_json='{"nodes": []}', submit_mode="run", latent={"samples": samples})
+
+    assert fake_client.submitted_payload is not None
+    (tensor,) = fake_client.submitted_payload["tensors"]
+    assert (tensor["name"], tensor["dtype"]) == ("latent", "float16")
+    np.testing.assert_array_equal(decode_tensor(tensor), samples)
+
+    with pytest.raises(RuntimeError, match="latent_dtype"):
+        node.execute(
+            workflow_json='{"nodes": []}', latent={"samples": samples}, latent_dtype="int8"
+        )
@@ -0,0 +1,178 @@
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+from PIL import Image
+
+from comfy_gpu_offload.config import RunpodConfig
+from comfy_gpu_offload.io import (
+    ArtifactSpool,
+    decode_images_to_array,
+    decode_output_images,
+    extract_output_images,
+    image_to_base64,
+    memmap_output_images,
+    outputs,
+    spool_output_images,
+)
+from comfy_gpu_offload.nodes import RunPodDecodeImages
+
+np = pytest.importorskip("numpy")
+
+
+def _encoded(color: tuple[int, int, int], size: tuple[int, int] = (3, 2), mode: str = "RGB") -> str:
+    return image_to_base64(Image.new(mode, size, color=color if mode != "L" else color[0]))
+
+
+def test_extract_output_images_reads_worker_and_payload_shapes() -> None:
+    output = {
+        "images": [
+            {"filename": "a.png", "type": "base64", "data": "QQ=="},
+            {"filename": "b.png", "type": "s3_url", "data": "https://bucket/b.png"},
+            {"name": "c.png", "image": "Qw=="},
+            "RA==",
+        ]
+    }
+
+    images = extract_output_images(json.dumps(output))
+
+    assert [(image.name, image.data) for image in images] == [
+        ("a.png", "QQ=="),
+        ("c.png", "Qw=="),
+        ("image_3", "RA=="),
+    ]
+    assert extract_output_images({"ok": True}) == []
+    with pytest.raises(ValueError, match="JSON"):
+        extract_output_images("not json")
+
+
+def test_decode_images_to_array_fills_one_float_batch_in_order() -> None:
+    shades = [(0, 0, 0), (255, 0, 0), (0, 255, 0), (0, 0, 255)]
+
+    batch = decode_images_to_array([_encoded(color) for color in shades])
+
+    assert batch.shape == (4, 2, 3, 3)
+    assert batch.dtype == np.float32
+    assert batch.flags["C_CONTIGUOUS"]
+    assert [tuple(batch[index, 0, 0]) for index in range(4)] == [
+        tuple(channel / 255 for channel in color) for color in shades
+    ]
+
+
+def test_decode_images_to_array_converts_modes_and_data_uris() -> None:
+    gray = "data:image/png;base64," + _encoded((128, 0, 0), mode="L")
+
+    batch = decode_images_to_array([gray, _encoded((255, 255, 255))])
+
+    assert batch[0, 0, 0].tolist() == pytest.approx([128 / 255] * 3)
+    assert batch[1].min() == 1.0
+
+
+def test_decode_images_to_array_rejects_mixed_sizes_and_bad_data() -> None:
+    with pytest.raises(ValueError, match="differ in size"):
+        decode_images_to_array([_encoded((0, 0, 0)), _encoded((0, 0, 0), size=(4, 4))])
+    with pytest.raises(ValueError, match="decoded"):
+        decode_images_to_array(["aGVsbG8="])
+
+
+def test_decode_node_returns_image_batch() -> None:
+    output_json = json.dumps({"images": [{"filename": "x.png", "data": _encoded((255, 0, 0))}]})
+
+    (images,) = RunPodDecodeImages().decode(output_json)
+
+    assert tuple(images.shape) == (1, 2, 3, 3)
+    assert float(images[0, 0, 0, 0]) == 1.0
+    with pytest.raises(RuntimeError, match="no inline images"):
+        RunPodDecodeImages().decode('{"images": []}')
+
+    assert decode_output_images(output_json).shape[0] == 1
+
+
+def test_spool_output_images_decodes_in_chunks_to_lazy_handles(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(outputs, "BASE64_CHUNK_CHARS", 8)
+    encoded = _encoded((0, 128, 255), size=(5, 4))
+    spool = ArtifactSpool(tmp_path)
+
+    (spooled,) = spool_output_images(
+        {"images": [{"filename": "frame.PNG", "data": encoded}]}, spool, job_id="job-1"
+    )
+
+    assert spooled.path.suffix == ".png"
+    assert spooled.size == (5, 4)
+    with spooled.open() as image:
+        assert image.convert("RGB").getpixel((0, 0)) == (0, 128, 255)
+    assert spool.for_job("job-1") == [spooled.entry]
+
+
+def test_memmap_output_images_maps_a_float_batch(tmp_path: Path) -> None:
+    colors = [(255, 0, 0), (0, 255, 0), (0, 0, 255)]
+    output = {
+        "images": [{"filename": f"{i}.png", "data": _encoded(c)} for i, c in enumerate(colors)]
+    }
+    spool = ArtifactSpool(tmp_path)
+
+    batch = memmap_output_images(output, spool, job_id="job")
+
+    assert isinstance(batch, np.memmap)
+    assert batch.shape == (3, 2, 3, 3)
+    assert batch.dtype == np.float32
+    assert batch[2, 1, 2].tolist() == [0.0, 0.0, 1.0]
+    np.testing.assert_array_equal(batch, decode_output_images(output))
+    batch[0] = 0.0  # copy-on-write: the spool file is untouched
+    assert np.load(Path(batch.filename))[0, 0, 0, 0] == 1.0
+    assert [entry.path.suffix for entry in spool.for_job("job")] == [".png"] * 3 + [".npy"]
+
+
+def test_memmap_output_images_pins_frames_while_building(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    colors = [(255, 0, 0), (0, 255, 0), (0, 0, 255)]
+    output = {"images": [_encoded(c) for c in colors]}
+    npy_bytes = 128 + 3 * 2 * 3 * 3 * 4
+    spool = ArtifactSpool(tmp_path, max_bytes=npy_bytes + 100)
+    read_frames = outputs.iter_image_files_float
+
+    def read_after_concurrent_write(paths: list[Path]) -> Any:
+        spool.put(b"x" * npy_bytes)  # another job's artifact pushes the spool over budget
+        return read_frames(paths)
+
+    monkeypatch.setattr(outputs, "iter_image_files_float", read_after_concurrent_write)
+
+    batch = memmap_output_images(output, spool, job_id="job")
+
+    assert batch[1, 0, 0].tolist() == [0.0, 1.0, 0.0]
+    assert spool.total_bytes <= npy_bytes + 100
+    assert Path(batch.filename).exists()
+
+
+def test_memmap_output_images_rejects_mixed_sizes(tmp_path: Path) -> None:
+    output = {"images": [_encoded((0, 0, 0)), _encoded((0, 0, 0), size=(4, 4))]}
+
+    with pytest.raises(ValueError, match="differ in size"):
+        memmap_output_images(output, ArtifactSpool(tmp_path))
+
+
+def test_decode_node_memory_maps_through_the_spool(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("RUNPOD_API_KEY", "k")
+    monkeypatch.setenv("RUNPOD_ENDPOINT_ID", "e")
+    spool = ArtifactSpool(tmp_path)
+    seen: list[RunpodConfig] = []
+
+    def spool_factory(config: RunpodConfig) -> ArtifactSpool:
+        seen.append(config)
+        return spool
+
+    node = RunPodDecodeImages()
+    node.spool_factory = spool_factory
+    output_json = json.dumps({"images": [_encoded((255, 255, 255))]})
+
+    (images,) = node.decode(output_json, memory_map=True, job_id="job-9")
+
+    assert tuple(images.shape) == (1, 2, 3, 3)
+    assert seen and seen[0].endpoint_id == "e"
+    assert len(spool.for_job("job-9")) == 2
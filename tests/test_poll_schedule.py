@@ -0,0 +1,71 @@
+import pytest
+
+from comfy_gpu_offload.api import AdaptivePollSchedule, FixedPollSchedule, RunpodStatus
+from comfy_gpu_offload.config import RunpodConfig
+
+
+def test_fixed_schedule_ignores_state() -> None:
+    schedule = FixedPollSchedule(2.0)
+    assert schedule.next_interval(RunpodStatus.IN_QUEUE, attempt=5, elapsed_seconds=60) == 2.0
+
+
+def test_adaptive_schedule_backs_off_while_queued() -> None:
+    schedule = AdaptivePollSchedule(
+        initial_interval_seconds=0.5, max_queue_interval_seconds=4.0, jitter_ratio=0.0
+    )
+
+    intervals = [
+        schedule.next_interval(RunpodStatus.IN_QUEUE, attempt=attempt, elapsed_seconds=0.0)
+        for attempt in range(1, 6)
+    ]
+
+    assert intervals == [0.5, 1.0, 2.0, 4.0, 4.0]
+
+
+def test_adaptive_schedule_caps_in_progress_at_steady_interval() -> None:
+    schedule = AdaptivePollSchedule(
+        initial_interval_seconds=0.5, max_interval_seconds=3.0, jitter_ratio=0.0
+    )
+
+    first = schedule.next_interval(RunpodStatus.IN_PROGRESS, attempt=1, elapsed_seconds=0.5)
+    later = schedule.next_interval(RunpodStatus.IN_PROGRESS, attempt=8, elapsed_seconds=60.0)
+
+    assert first == 0.5
+    assert later == 3.0
+
+
+def test_adaptive_schedule_tightens_near_expected_completion() -> None:
+    schedule = AdaptivePollSchedule(
+        initial_interval_seconds=0.5,
+        max_interval_seconds=3.0,
+        expected_duration_seconds=10.0,
+        jitter_ratio=0.0,
+    )
+
+    early = schedule.next_interval(RunpodStatus.IN_PROGRESS, attempt=2, elapsed_seconds=2.0)
+    close = schedule.next_interval(RunpodStatus.IN_PROGRESS, attempt=4, elapsed_seconds=8.8)
+    overdue = schedule.next_interval(RunpodStatus.IN_PROGRESS, attempt=6, elapsed_seconds=12.0)
+
+    assert early == 3.0
+    assert close == pytest.approx(1.2)
+    assert overdue == 0.5
+
+
+def test_adaptive_schedule_applies_bounded_jitter() -> None:
+    low = AdaptivePollSchedule(jitter_ratio=0.2, random_source=lambda: 0.0)
+    high = AdaptivePollSchedule(jitter_ratio=0.2, random_source=lambda: 1.0)
+
+    low_interval = low.next_interval(RunpodStatus.IN_QUEUE, attempt=1, elapsed_seconds=0)
+    high_interval = high.next_interval(RunpodStatus.IN_QUEUE, attempt=1, elapsed_seconds=0)
+
+    assert low_interval == pytest.approx(0.4)
+    assert high_interval == pytest.approx(0.6)
+
+
+def test_adaptive_schedule_from_config_uses_poll_interval_as_ceiling() -> None:
+    config = RunpodConfig(api_key="k", endpoint_id="e", poll_interval_seconds=0.2)
+
+    schedule = AdaptivePollSchedule.from_config(config)
+
+    assert schedule.initial_interval_seconds == 0.2
+    assert schedule.max_interval_seconds == 0.2
@@ -0,0 +1,143 @@
+import threading
+import time
+from collections.abc import Iterator
+
+import pytest
+
+from comfy_gpu_offload.api import (
+    JobPoller,
+    JobStatus,
+    RunpodApiError,
+    RunpodCancelledError,
+    RunpodJobError,
+    RunpodStatus,
+    RunpodTimeoutError,
+)
+
+
+class FakeSource:
+    def __init__(self, statuses: dict[str, list[str]], gate: threading.Event | None = None) -> None:
+        self.statuses = {job_id: list(items) for job_id, items in statuses.items()}
+        self.calls: list[str] = []
+        self.gate = gate
+        self._lock = threading.Lock()
+
+    def get_job_status(self, job_id: str) -> JobStatus:
+        if self.gate is not None:
+            self.gate.wait(timeout=5)
+        with self._lock:
+            self.calls.append(job_id)
+            queue = self.statuses[job_id]
+            status = queue.pop(0) if len(queue) > 1 else queue[0]
+        return JobStatus(job_id=job_id, status=status, output={"job": job_id}, error="boom")
+
+
+@pytest.fixture
+def poller() -> Iterator[JobPoller]:
+    instance = JobPoller(max_concurrent_checks=4)
+    try:
+        yield instance
+    finally:
+        instance.close()
+
+
+def test_poller_resolves_many_jobs(poller: JobPoller) -> None:
+    job_ids = [f"job-{index}" for index in range(50)]
+    source = FakeSource(
+        {job_id: [RunpodStatus.IN_QUEUE, RunpodStatus.COMPLETED] for job_id in job_ids}
+    )
+
+    futures = [
+        poller.track(source, job_id, poll_interval_seconds=0.01, timeout_seconds=5.0)
+        for job_id in job_ids
+    ]
+
+    results = [future.result(timeout=5) for future in futures]
+    assert [result.output for result in results] == [{"job": job_id} for job_id in job_ids]
+    assert len(source.calls) == 100
+    assert poller.pending_jobs == 0
+
+
+def test_poller_coalesces_waiters_on_same_job(poller: JobPoller) -> None:
+    gate = threading.Event()
+    source = FakeSource({"job-1": [RunpodStatus.IN_PROGRESS, RunpodStatus.COMPLETED]}, gate)
+
+    first = poller.track(source, "job-1", poll_interval_seconds=0.01, timeout_seconds=5.0)
+    second = poller.track(source, "job-1", poll_interval_seconds=0.01, timeout_seconds=5.0)
+    gate.set()
+
+    assert first.result(timeout=5).status == RunpodStatus.COMPLETED
+    assert second.result(timeout=5).status == RunpodStatus.COMPLETED
+    assert source.calls == ["job-1", "job-1"]
+
+
+def test_poller_honors_per_job_deadline(poller: JobPoller) -> None:
+    source = FakeSource({"slow": [RunpodStatus.IN_PROGRESS], "fast": [RunpodStatus.COMPLETED]})
+
+    slow = poller.track(source, "slow", poll_interval_seconds=0.01, timeout_seconds=0.05)
+    fast = poller.track(source, "fast", poll_interval_seconds=0.01, timeout_seconds=5.0)
+
+    assert fast.result(timeout=5).status == RunpodStatus.COMPLETED
+    with pytest.raises(RunpodTimeoutError):
+        slow.result(timeout=5)
+
+
+def test_poller_reports_progress_and_failures(poller: JobPoller) -> None:
+    source = FakeSource({"job-1": [RunpodStatus.IN_PROGRESS, RunpodStatus.FAILED]})
+    seen: list[str] = []
+
+    future = poller.track(
+        source,
+        "job-1",
+        poll_interval_seconds=0.01,
+        timeout_seconds=5.0,
+        on_progress=lambda status: seen.append(status.status),
+    )
+
+    with pytest.raises(RunpodJobError):
+        future.result(timeout=5)
+    assert seen == [RunpodStatus.IN_PROGRESS, RunpodStatus.FAILED]
+
+
+def test_poller_survives_failing_progress_listener(poller: JobPoller) -> None:
+    source = FakeSource({"job-1": [RunpodStatus.IN_PROGRESS, RunpodStatus.COMPLETED]})
+
+    def broken(_status: JobStatus) -> None:
+        raise RuntimeError("listener bug")
+
+    failing = poller.track(
+        source, "job-1", poll_interval_seconds=0.01, timeout_seconds=5.0, on_progress=broken
+    )
+    coalesced = poller.track(source, "job-1", poll_interval_seconds=0.01, timeout_seconds=5.0)
+
+    assert failing.result(timeout=5).status == RunpodStatus.COMPLETED
+    assert coalesced.result(timeout=5).status == RunpodStatus.COMPLETED
+
+
+def test_poller_propagates_source_errors(poller: JobPoller) -> None:
+    class BrokenSource:
+        def get_job_status(self, job_id: str) -> JobStatus:
+            raise RunpodApiError("network down")
+
+    future = poller.track(BrokenSource(), "job-1", poll_interval_seconds=0.01, timeout_seconds=5.0)
+
+    with pytest.raises(RunpodApiError):
+        future.result(timeout=5)
+
+
+def test_poller_wait_can_be_cancelled(poller: JobPoller) -> None:
+    source = FakeSource({"job-1": [RunpodStatus.IN_QUEUE]})
+
+    with pytest.raises(RunpodCancelledError):
+        poller.wait(
+            source,
+            "job-1",
+            poll_interval_seconds=0.01,
+            timeout_seconds=5.0,
+            should_continue=lambda: False,
+        )
+
+    deadline = time.monotonic() + 5
+    while poller.pending_jobs and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert poller.pending_jobs == 0
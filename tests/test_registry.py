@@ -0,0 +1,29 @@
+from comfy_gpu_offload.api import ClientRegistry
+from comfy_gpu_offload.api.registry import build_pooled_session
+from comfy_gpu_offload.config import RunpodConfig
+
+
+def test_registry_reuses_client_per_config() -> None:
+    registry = ClientRegistry()
+    config = RunpodConfig(api_key="k", endpoint_id="e")
+
+    first = registry.get(config)
+    second = registry.get(RunpodConfig(api_key="k", endpoint_id="e"))
+    other = registry.get(RunpodConfig(api_key="k", endpoint_id="other"))
+
+    assert first is second
+    assert other is not first
+    assert len(registry) == 2
+    registry.close()
+    assert len(registry) == 0
+    assert registry.get(config) is not first
+
+
+def test_pooled_session_sizes_connection_pool() -> None:
+    session = build_pooled_session(48)
+
+    adapter = session.get_adapter("https://api.runpod.ai/v2/e/run")
+
+    assert adapter._pool_maxsize == 48  # type: ignore[attr-defined]
+    assert adapter.max_retries.total == 0  # type: ignore[attr-defined]
+    session.close()
@@ -0,0 +1,120 @@
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from comfy_gpu_offload.config import RunpodConfig
+from comfy_gpu_offload.io import CachedResult, ResultCache, result_cache_key
+from comfy_gpu_offload.io.result_cache import RESULT_CACHE_SUBDIR
+from comfy_gpu_offload.workflow import content_hash
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def key(index: int) -> str:
+    return content_hash({"index": index})
+
+
+def test_cache_key_is_canonical_and_endpoint_scoped() -> None:
+    config = RunpodConfig(api_key="k", endpoint_id="e")
+
+    a = result_cache_key(config, {"workflow": {"a": 1, "b": 2}, "params": {"seed": 1}})
+    b = result_cache_key(config, {"params": {"seed": 1}, "workflow": {"b": 2, "a": 1}})
+    other = result_cache_key(
+        RunpodConfig(api_key="k", endpoint_id="other"), {"workflow": {"a": 1, "b": 2}}
+    )
+
+    assert a == b
+    assert a != other
+
+
+def test_memory_tier_evicts_least_recently_used() -> None:
+    cache = ResultCache(max_memory_entries=2)
+    for index in range(2):
+        cache.put(key(index), CachedResult(job_id=f"job-{index}", output_json="{}"))
+
+    assert cache.get(key(0)) is not None
+    cache.put(key(2), CachedResult(job_id="job-2", output_json="{}"))
+
+    assert cache.get(key(1)) is None
+    assert cache.get(key(0)) is not None
+    assert len(cache) == 2
+
+
+def test_disk_tier_survives_new_instance_with_private_files(tmp_path: Path) -> None:
+    directory = tmp_path / "results"
+    ResultCache(directory=directory).put(key(1), CachedResult("job-1", '{"images": []}'))
+
+    reloaded = ResultCache(directory=directory).get(key(1))
+
+    assert reloaded == CachedResult("job-1", '{"images": []}')
+    path = directory / RESULT_CACHE_SUBDIR / f"{key(1)}.json"
+    assert oct(path.stat().st_mode & 0o777) == oct(0o600)
+    assert oct(path.parent.stat().st_mode & 0o777) == oct(0o700)
+
+
+def test_disk_tier_enforces_ttl_and_byte_budget(tmp_path: Path) -> None:
+    clock = FakeClock()
+    entry_size = len(json.dumps({"job_id": "job-0", "output_json": "x" * 100}))
+    cache = ResultCache(
+        directory=tmp_path,
+        max_memory_entries=1,
+        max_disk_bytes=entry_size * 2,
+        ttl_seconds=60.0,
+        clock=clock,
+    )
+    for index in range(3):
+        clock.now += 1
+        cache.put(key(index), CachedResult(f"job-{index}", "x" * 100))
+
+    assert sorted(path.name for path in (tmp_path / RESULT_CACHE_SUBDIR).glob("*.json")) == sorted(
+        f"{key(index)}.json" for index in (1, 2)
+    )
+
+    clock.now += 120
+    assert ResultCache(directory=tmp_path, ttl_seconds=60.0, clock=clock).get(key(2)) is None
+
+
+def test_disk_tier_leaves_the_configured_directory_alone(tmp_path: Path) -> None:
+    clock = FakeClock()
+    shared = tmp_path / "shared"
+    shared.mkdir()
+    shared.chmod(0o755)
+    foreign = [shared / "settings.json", shared / f"{key(9)}.json"]
+    for path in foreign:
+        path.write_text("{}")
+        os.utime(path, (0, 0))  # older than the TTL and first in LRU order
+    cache = ResultCache(directory=shared, ttl_seconds=60.0, max_disk_bytes=40, clock=clock)
+    cache.put(key(1), CachedResult("job-1", "{}"))
+    clock.now += 120
+
+    cache.put(key(2), CachedResult("job-2", "{}"))
+    cache.clear()
+
+    assert all(path.exists() for path in foreign)
+    assert oct(shared.stat().st_mode & 0o777) == oct(0o755)
+
+
+def test_disk_write_failures_keep_the_result_in_memory(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    not_a_directory = tmp_path / "file"
+    not_a_directory.write_text("")
+    cache = ResultCache(directory=not_a_directory)
+
+    cache.put(key(1), CachedResult("job-1", "{}"))
+
+    assert cache.get(key(1)) == CachedResult("job-1", "{}")
+    assert "Could not write result cache entry" in caplog.text
+
+
+def test_cache_rejects_non_digest_keys() -> None:
+    with pytest.raises(ValueError):
+        ResultCache().get("../escape")
@@ -0,0 +1,77 @@
+from datetime import UTC, datetime
+from email.utils import format_datetime
+
+import pytest
+
+from comfy_gpu_offload.api import CircuitBreaker, RetryPolicy
+from comfy_gpu_offload.api.retry import endpoint_name, parse_retry_after
+
+
+def test_retry_policy_backs_off_exponentially_with_cap() -> None:
+    policy = RetryPolicy(backoff_seconds=0.5, max_backoff_seconds=3.0, jitter_ratio=0.0)
+
+    assert [policy.delay(retry) for retry in range(1, 5)] == [0.5, 1.0, 2.0, 3.0]
+
+
+def test_retry_policy_prefers_retry_after() -> None:
+    policy = RetryPolicy(max_backoff_seconds=10.0)
+
+    assert policy.delay(1, retry_after=4.0) == 4.0
+    assert policy.delay(1, retry_after=120.0) == 10.0
+
+
+def test_parse_retry_after_accepts_seconds_and_http_dates() -> None:
+    now = datetime(2025, 1, 1, tzinfo=UTC)
+    later = format_datetime(datetime(2025, 1, 1, 0, 0, 5, tzinfo=UTC), usegmt=True)
+
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after(later, now=now.timestamp) == pytest.approx(5.0)
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+def test_circuit_breaker_opens_and_half_opens() -> None:
+    clock = [0.0]
+    breaker = CircuitBreaker(
+        failure_threshold=2, reset_timeout_seconds=10.0, clock=lambda: clock[0]
+    )
+
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow()
+
+    clock[0] = 10.0
+    assert breaker.allow()  # single probe
+    assert not breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+
+    clock[0] = 20.0
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_circuit_breaker_recovers_from_a_lost_probe() -> None:
+    clock = [0.0]
+    breaker = CircuitBreaker(
+        failure_threshold=1, reset_timeout_seconds=10.0, clock=lambda: clock[0]
+    )
+    breaker.record_failure()
+
+    clock[0] = 10.0
+    assert breaker.allow()
+    breaker.release_probe()
+    assert breaker.allow()  # released: another probe may go out at once
+
+    clock[0] = 19.0
+    assert not breaker.allow()
+    clock[0] = 20.0
+    assert breaker.allow()  # never reported back: treated as lost after the timeout
+
+
+def test_endpoint_name_groups_job_paths() -> None:
+    assert endpoint_name("/status/job-1") == "status"
+    assert endpoint_name("/run") == "run"
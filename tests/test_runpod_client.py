@@ -1,31 +1,39 @@
+import json
 from typing import Any, cast
 
 import pytest
 import requests
 
 from comfy_gpu_offload.api import (
+    AdaptivePollSchedule,
     RunpodApiError,
     RunpodCancelledError,
+    RunpodCircuitOpenError,
     RunpodClient,
     RunpodJobError,
     RunpodStatus,
     RunpodTimeoutError,
 )
 from comfy_gpu_offload.config import RunpodConfig
+from comfy_gpu_offload.workflow import encode_payload
 
 
 class FakeResponse:
-    def __init__(self, status_code: int, json_data: Any) -> None:
+    def __init__(
+        self, status_code: int, json_data: Any, headers: dict[str, str] | None = None
+    ) -> None:
         self.status_code = status_code
+        self.headers = headers or {}
         self._json_data = json_data
         self.text = "" if json_data is None else str(json_data)
+        self.content = b"" if json_data is None else json.dumps(json_data).encode("utf-8")
 
     def json(self) -> Any:
         return self._json_data
 
 
 class FakeSession:
-    def __init__(self, responses: list[FakeResponse]) -> None:
+    def __init__(self, responses: list[FakeResponse | Exception]) -> None:
         self.responses = list(responses)
         self.calls: list[dict[str, Any]] = []
 
@@ -50,12 +58,17 @@ class FakeSession:
         )
         if not self.responses:
             raise AssertionError("No more fake responses available")
-        return self.responses.pop(0)
+        item = self.responses.pop(0)
+        if isinstance(item, Exception):
+            raise item
+        return item
 
 
-def make_client(responses: list[FakeResponse]) -> tuple[RunpodClient, FakeSession]:
+def make_client(
+    responses: list[FakeResponse | Exception], **config_overrides: Any
+) -> tuple[RunpodClient, FakeSession]:
     session = FakeSession(responses)
-    cfg = RunpodConfig(api_key="k", endpoint_id="e")
+    cfg = RunpodConfig(api_key="k", endpoint_id="e", **config_overrides)
     return RunpodClient(cfg, session=cast(requests.Session, session)), session
 
 
@@ -68,6 +81,19 @@ def test_submit_job_returns_id_and_sets_auth_header() -> None:
 
     assert job_id == "job-123"
     assert session.calls[0]["headers"]["Authorization"].startswith("Bearer ")
+    assert session.calls[0]["kwargs"]["json"] == {"input": {"workflow": {"foo": "bar"}}}
+
+
+def test_submit_job_sends_pre_encoded_body_unchanged() -> None:
+    client, session = make_client(
+        [FakeResponse(200, {"id": "job-123", "status": RunpodStatus.IN_QUEUE})]
+    )
+    encoded = encode_payload({"workflow": {"foo": "bar"}})
+
+    client.submit_job(encoded)
+
+    assert session.calls[0]["kwargs"] == {"data": encoded.body}
+    assert session.calls[0]["headers"]["Content-Type"] == "application/json"
     assert session.calls[0]["verify"] is True
 
 
@@ -114,6 +140,44 @@ def test_poll_job_raises_on_failure_status() -> None:
         client.poll_job("job-123", poll_interval_seconds=0.0, timeout_seconds=1.0)
 
 
+@pytest.mark.parametrize(
+    "error",
+    [
+        {"error_code": "workflow_template_missing", "message": "unknown hash"},
+        '{"error_code": "workflow_template_missing", "message": "unknown hash"}',
+    ],
+)
+def test_failed_job_exposes_structured_error_code(error: Any) -> None:
+    client, _ = make_client(
+        [FakeResponse(200, {"id": "job-123", "status": RunpodStatus.FAILED, "error": error})]
+    )
+
+    with pytest.raises(RunpodJobError, match="unknown hash") as raised:
+        client.poll_job("job-123", poll_interval_seconds=0.0, timeout_seconds=1.0)
+
+    assert raised.value.error_code == "workflow_template_missing"
+
+
+def test_marker_text_in_plain_error_is_not_an_error_code() -> None:
+    client, _ = make_client(
+        [
+            FakeResponse(
+                200,
+                {
+                    "id": "job-123",
+                    "status": RunpodStatus.FAILED,
+                    "error": "workflow_template_missing: abc",
+                },
+            )
+        ]
+    )
+
+    status = client.get_job_status("job-123")
+
+    assert status.error == "workflow_template_missing: abc"
+    assert status.error_code is None
+
+
 def test_poll_job_times_out(monkeypatch: pytest.MonkeyPatch) -> None:
     client, _ = make_client(
         [
@@ -180,3 +244,132 @@ def test_invalid_json_raises_api_error() -> None:
 
     with pytest.raises(RunpodApiError):
         client.submit_job({})
+
+
+def test_poll_job_sleeps_according_to_schedule(monkeypatch: pytest.MonkeyPatch) -> None:
+    client, _ = make_client(
+        [
+            FakeResponse(200, {"id": "job-123", "status": RunpodStatus.IN_QUEUE}),
+            FakeResponse(200, {"id": "job-123", "status": RunpodStatus.IN_QUEUE}),
+            FakeResponse(200, {"id": "job-123", "status": RunpodStatus.COMPLETED}),
+        ]
+    )
+    sleeps: list[float] = []
+    monkeypatch.setattr("time.sleep", sleeps.append)
+
+    client.poll_job(
+        "job-123",
+        timeout_seconds=60.0,
+        schedule=AdaptivePollSchedule(initial_interval_seconds=0.25, jitter_ratio=0.0),
+    )
+
+    assert sleeps == [0.25, 0.5]
+
+
+def test_run_sync_returns_inline_result() -> None:
+    client, session = make_client(
+        [FakeResponse(200, {"id": "job-1", "status": RunpodStatus.COMPLETED, "output": {"x": 1}})]
+    )
+
+    status = client.run_sync({"workflow": {}}, wait_seconds=5.0)
+
+    assert status.output == {"x": 1}
+    assert session.calls[0]["url"].endswith("/runsync")
+    assert session.calls[0]["kwargs"]["params"] == {"wait": 5000}
+    assert session.calls[0]["timeout"] == pytest.approx(35.0)
+
+
+def test_run_sync_falls_back_to_polling(monkeypatch: pytest.MonkeyPatch) -> None:
+    client, session = make_client(
+        [
+            FakeResponse(200, {"id": "job-1", "status": RunpodStatus.IN_PROGRESS}),
+            FakeResponse(200, {"id": "job-1", "status": RunpodStatus.COMPLETED, "output": {}}),
+        ]
+    )
+    monkeypatch.setattr("time.sleep", lambda _seconds: None)
+
+    status = client.run_sync({"workflow": {}}, timeout_seconds=10.0)
+
+    assert status.status == RunpodStatus.COMPLETED
+    assert session.calls[1]["url"].endswith("/status/job-1")
+
+
+def test_run_sync_raises_on_failed_job() -> None:
+    client, _ = make_client(
+        [FakeResponse(200, {"id": "job-1", "status": RunpodStatus.FAILED, "error": "oom"})]
+    )
+
+    with pytest.raises(RunpodJobError):
+        client.run_sync({"workflow": {}})
+
+
+def test_get_job_status_retries_connection_errors(monkeypatch: pytest.MonkeyPatch) -> None:
+    client, session = make_client(
+        [
+            requests.ConnectionError("connection reset"),
+            FakeResponse(502, {"error": "bad gateway"}),
+            FakeResponse(200, {"id": "job-1", "status": RunpodStatus.IN_PROGRESS}),
+        ]
+    )
+    monkeypatch.setattr("time.sleep", lambda _seconds: None)
+
+    status = client.get_job_status("job-1")
+
+    assert status.status == RunpodStatus.IN_PROGRESS
+    assert len(session.calls) == 3
+
+
+def test_get_job_status_gives_up_after_max_retries(monkeypatch: pytest.MonkeyPatch) -> None:
+    client, session = make_client([FakeResponse(500, {})] * 3, max_retries=2)
+    monkeypatch.setattr("time.sleep", lambda _seconds: None)
+
+    with pytest.raises(RunpodApiError) as err:
+        client.get_job_status("job-1")
+
+    assert err.value.status_code == 500
+    assert len(session.calls) == 3
+
+
+def test_submit_job_honors_retry_after_on_429(monkeypatch: pytest.MonkeyPatch) -> None:
+    client, session = make_client(
+        [
+            FakeResponse(429, {"error": "slow down"}, headers={"Retry-After": "2"}),
+            FakeResponse(200, {"id": "job-1", "status": RunpodStatus.IN_QUEUE}),
+        ]
+    )
+    sleeps: list[float] = []
+    monkeypatch.setattr("time.sleep", sleeps.append)
+
+    assert client.submit_job({"workflow": {}}) == "job-1"
+    assert sleeps == [2.0]
+    assert len(session.calls) == 2
+
+
+def test_submit_job_does_not_retry_connection_errors() -> None:
+    client, session = make_client([requests.ConnectionError("reset")])
+
+    with pytest.raises(RunpodApiError):
+        client.submit_job({"workflow": {}})
+    assert len(session.calls) == 1
+
+
+def test_circuit_breaker_fails_fast_per_endpoint(monkeypatch: pytest.MonkeyPatch) -> None:
+    client, session = make_client(
+        [
+            FakeResponse(503, {}),
+            FakeResponse(503, {}),
+            FakeResponse(200, {"id": "job-1", "status": RunpodStatus.IN_QUEUE}),
+        ],
+        max_retries=0,
+        circuit_failure_threshold=2,
+    )
+    monkeypatch.setattr("time.sleep", lambda _seconds: None)
+
+    for _ in range(2):
+        with pytest.raises(RunpodApiError):
+            client.get_job_status("job-1")
+    with pytest.raises(RunpodCircuitOpenError):
+        client.get_job_status("job-1")
+
+    assert len(session.calls) == 2
+    assert client.submit_job({"workflow": {}}) == "job-1"
@@ -0,0 +1,73 @@
+import json
+import threading
+from typing import Any, cast
+
+import pytest
+
+from comfy_gpu_offload.api import JobStatus, RunpodClient, RunpodStatus
+from comfy_gpu_offload.nodes import NODE_CLASS_MAPPINGS, RunPodAwait, RunpodJobHandle, RunPodSubmit
+
+
+class GatedClient:
+    def __init__(self) -> None:
+        self.release = threading.Event()
+        self.submitted: list[Any] = []
+
+    def submit_job(self, payload: Any) -> str:
+        self.submitted.append(payload)
+        return "job-async"
+
+    def submit_job_sync(self, payload: Any) -> JobStatus:
+        raise AssertionError("submit node test uses /run")
+
+    def get_job_status(self, job_id: str) -> JobStatus:
+        self.release.wait(timeout=5)
+        return JobStatus(job_id=job_id, status=RunpodStatus.COMPLETED, output={"done": True})
+
+
+@pytest.fixture
+def env(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("RUNPOD_API_KEY", "k")
+    monkeypatch.setenv("RUNPOD_ENDPOINT_ID", "e")
+
+
+@pytest.mark.usefixtures("env")
+def test_submit_returns_before_job_finishes_and_await_resolves() -> None:
+    client = GatedClient()
+    node = RunPodSubmit()
+    node.client_factory = lambda _config: cast(RunpodClient, client)
+
+    (handle,) = node.submit(workflow_json='{"nodes": []}', submit_mode="run")
+
+    assert isinstance(handle, RunpodJobHandle)
+    assert not handle.done
+    client.release.set()
+    status, job_id, output_json = RunPodAwait().await_job(handle, timeout_seconds=5.0)
+
+    assert status == RunpodStatus.COMPLETED
+    assert job_id == "job-async"
+    assert json.loads(output_json) == {"done": True}
+    assert len(client.submitted) == 1
+
+
+@pytest.mark.usefixtures("env")
+def test_submit_surfaces_input_errors_immediately() -> None:
+    with pytest.raises(RuntimeError, match="workflow_json"):
+        RunPodSubmit().submit(workflow_json="not json")
+
+
+def test_await_times_out_and_rejects_foreign_values() -> None:
+    from concurrent.futures import Future
+
+    pending: Future[tuple[str, str, str]] = Future()
+
+    with pytest.raises(RuntimeError, match="not finished"):
+        RunPodAwait().await_job(RunpodJobHandle(pending), timeout_seconds=0.01)
+    with pytest.raises(RuntimeError, match="Submit"):
+        RunPodAwait().await_job(cast(RunpodJobHandle, "job-id"))
+
+
+def test_nodes_are_registered() -> None:
+    assert NODE_CLASS_MAPPINGS["RunPodSubmit"] is RunPodSubmit
+    assert NODE_CLASS_MAPPINGS["RunPodAwait"] is RunPodAwait
+    assert "use_runpod" not in RunPodSubmit.INPUT_TYPES()["required"]
@@ -0,0 +1,131 @@
+import json
+import threading
+import time
+from typing import Any, cast
+
+import pytest
+
+from comfy_gpu_offload.api import (
+    JobStatus,
+    RunpodClient,
+    RunpodStatus,
+    build_sweep_payloads,
+)
+from comfy_gpu_offload.nodes import NODE_CLASS_MAPPINGS, RunPodSweep
+from comfy_gpu_offload.workflow import EncodedPayload
+
+
+class SweepClient:
+    """Jobs complete on the status check after submission; tracks peak concurrency."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.params: dict[str, Any] = {}
+        self.tensors: dict[str, Any] = {}
+        self.active = 0
+        self.peak = 0
+
+    def submit_job(self, payload: Any) -> str:
+        with self.lock:
+            job_id = f"job-{len(self.params)}"
+            source = payload.payload if isinstance(payload, EncodedPayload) else payload
+            self.params[job_id] = source["params"]
+            self.tensors[job_id] = source.get("tensors")
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        return job_id
+
+    def submit_job_sync(self, payload: Any) -> JobStatus:
+        raise AssertionError("sweep tests use /run")
+
+    def get_job_status(self, job_id: str) -> JobStatus:
+        time.sleep(self.delay)
+        with self.lock:
+            self.active -= 1
+        return JobStatus(
+            job_id=job_id, status=RunpodStatus.COMPLETED, output={"params": self.params[job_id]}
+        )
+
+
+def test_build_sweep_payloads_layers_overrides() -> None:
+    payloads = build_sweep_payloads(
+        {"nodes": []}, [{"seed": 1}, {"seed": 2, "cfg": 5}], base_params={"cfg": 7, "steps": 20}
+    )
+
+    assert [payload["params"] for payload in payloads] == [
+        {"cfg": 7, "steps": 20, "seed": 1},
+        {"cfg": 5, "steps": 20, "seed": 2},
+    ]
+
+
+def test_sweep_node_returns_outputs_in_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("RUNPOD_API_KEY", "k")
+    monkeypatch.setenv("RUNPOD_ENDPOINT_ID", "e")
+    client = SweepClient()
+    node = RunPodSweep()
+    node.client_factory = lambda _config: cast(RunpodClient, client)
+
+    statuses, job_ids, outputs = node.sweep(
+        workflow_json='{"nodes": []}',
+        sweep_json='[{"seed": 1}, {"seed": 2}, {"seed": 3}]',
+        params_json='{"steps": 4}',
+        submit_mode="run",
+        max_parallel=3,
+        timeout_seconds=5.0,
+    )
+
+    assert json.loads(statuses) == [RunpodStatus.COMPLETED] * 3
+    assert len(set(json.loads(job_ids))) == 3
+    assert [output["params"] for output in json.loads(outputs)] == [
+        {"steps": 4, "seed": 1},
+        {"steps": 4, "seed": 2},
+        {"steps": 4, "seed": 3},
+    ]
+    assert NODE_CLASS_MAPPINGS["RunPodSweep"] is RunPodSweep
+
+
+def test_sweep_node_caps_parallelism_and_keeps_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("RUNPOD_API_KEY", "k")
+    monkeypatch.setenv("RUNPOD_ENDPOINT_ID", "e")
+    client = SweepClient(delay=0.02)
+    node = RunPodSweep()
+    node.client_factory = lambda _config: cast(RunpodClient, client)
+
+    _, _, outputs = node.sweep(
+        workflow_json='{"nodes": []}',
+        sweep_json=json.dumps([{"seed": seed} for seed in range(6)]),
+        submit_mode="run",
+        use_result_cache=False,
+        max_parallel=2,
+        timeout_seconds=5.0,
+    )
+
+    assert [output["params"]["seed"] for output in json.loads(outputs)] == list(range(6))
+    assert client.peak <= 2
+
+
+def test_sweep_node_sends_the_latent_with_every_entry(monkeypatch: pytest.MonkeyPatch) -> None:
+    np = pytest.importorskip("numpy")
+    monkeypatch.setenv("RUNPOD_API_KEY", "k")
+    monkeypatch.setenv("RUNPOD_ENDPOINT_ID", "e")
+    client = SweepClient()
+    node = RunPodSweep()
+    node.client_factory = lambda _config: cast(RunpodClient, client)
+
+    node.sweep(
+        workflow_json='{"nodes": []}',
+        sweep_json='[{"seed": 1}, {"seed": 2}, {"seed": 3}]',
+        submit_mode="run",
+        use_result_cache=False,
+        latent={"samples": np.ones((1, 4, 8, 8), dtype=np.float32)},
+    )
+
+    assert len(client.tensors) == 3
+    for tensors in client.tensors.values():
+        assert [(t["name"], t["shape"]) for t in tensors] == [("latent", [1, 4, 8, 8])]
+
+
+def test_sweep_node_requires_entries() -> None:
+    with pytest.raises(RuntimeError, match="sweep_json"):
+        RunPodSweep().sweep(workflow_json='{"nodes": []}', sweep_json="[]")
@@ -0,0 +1,90 @@
+import base64
+import json
+import zlib
+
+import pytest
+
+from comfy_gpu_offload.io import (
+    TensorPayloadError,
+    decode_latent,
+    decode_tensor,
+    encode_latent,
+    encode_tensor,
+    extract_output_tensors,
+)
+from comfy_gpu_offload.nodes import RunPodDecodeLatent
+
+np = pytest.importorskip("numpy")
+
+
+def test_tensor_round_trip_is_exact() -> None:
+    array = np.arange(24, dtype=np.float32).reshape(2, 3, 4) / 7
+
+    payload = encode_tensor("x", array)
+    decoded = decode_tensor(payload)
+
+    assert payload["dtype"] == "float32"
+    assert payload["shape"] == [2, 3, 4]
+    assert "encoding" not in payload
+    assert decoded.dtype == np.float32
+    assert decoded.flags.writeable
+    np.testing.assert_array_equal(decoded, array)
+
+
+def test_downcast_and_compression_shrink_a_latent() -> None:
+    samples = np.zeros((1, 4, 128, 128), dtype=np.float32)
+    samples[:, :, :64] = np.linspace(-1, 1, 128, dtype=np.float32)
+
+    payload = encode_latent({"samples": samples})
+    latent = decode_latent(payload)
+
+    assert payload["dtype"] == "float16"
+    assert payload["source_dtype"] == "float32"
+    assert payload["encoding"] == "zlib"
+    assert len(payload["data"]) < samples.nbytes // 4
+    assert latent["samples"].dtype == np.float32
+    np.testing.assert_allclose(latent["samples"], samples, atol=1e-3)
+    assert decode_tensor(payload, restore_dtype=False).dtype == np.float16
+
+
+def test_decode_tensor_rejects_mismatched_or_oversized_data() -> None:
+    payload = encode_tensor("x", np.ones((2, 2), dtype=np.uint8))
+
+    with pytest.raises(TensorPayloadError, match="need 8"):
+        decode_tensor({**payload, "shape": [2, 4]})
+    with pytest.raises(TensorPayloadError, match="dtype"):
+        decode_tensor({**payload, "dtype": "object"})
+    for shape in ([2, -2], [2.0, 2], [True, 4], "22", [[2], 2]):
+        with pytest.raises(TensorPayloadError, match="non-negative ints"):
+            decode_tensor({**payload, "shape": shape})
+    for data in (None, 123, ["AAAA"]):
+        with pytest.raises(TensorPayloadError, match="base64 string"):
+            decode_tensor({**payload, "data": data})
+    with pytest.raises(TensorPayloadError, match="the limit is"):
+        decode_tensor({**payload, "encoding": "zlib", "shape": [2**40, 2**40]})
+    bomb = zlib.compress(b"\0" * 1_000_000)
+    with pytest.raises(TensorPayloadError, match="bytes"):
+        decode_tensor({**payload, "encoding": "zlib", "data": base64.b64encode(bomb).decode()})
+    with pytest.raises(TensorPayloadError, match="samples"):
+        encode_latent({})
+    with pytest.raises(TensorPayloadError, match="unsupported"):
+        encode_tensor("c", np.zeros(2, dtype=np.complex64))
+
+
+def test_extract_output_tensors_by_name() -> None:
+    payload = encode_tensor("latent", np.zeros(3, dtype=np.float32))
+    output = json.dumps({"tensors": [payload, {"dtype": "float32"}]})
+
+    assert extract_output_tensors(output) == {"latent": payload}
+    assert extract_output_tensors({"images": []}) == {}
+
+
+def test_decode_latent_node() -> None:
+    samples = np.ones((1, 4, 2, 2), dtype=np.float32)
+    output_json = json.dumps({"tensors": [encode_latent({"samples": samples}, name="out")]})
+
+    (latent,) = RunPodDecodeLatent().decode(output_json, tensor_name="out")
+
+    np.testing.assert_array_equal(np.asarray(latent["samples"]), samples)
+    with pytest.raises(RuntimeError, match="no tensor named"):
+        RunPodDecodeLatent().decode(output_json)
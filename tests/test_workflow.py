@@ -52,6 +52,39 @@ def test_build_run_payload_rejects_bad_images() -> None:
         )
 
 
+def test_build_run_payload_accepts_image_urls() -> None:
+    image = {"name": "x.png", "url": "https://bucket.example/x.png?sig=1", "sha256": "ab"}
+    payload = build_run_payload(workflow={"nodes": []}, images=[cast(Any, image)])
+    assert payload["images"] == [image]
+
+    for bad in (
+        {"name": "x", "url": "http://insecure.example/x.png"},
+        {"name": "x", "url": "https://ok.example/x.png", "image": "dGVzdA=="},
+    ):
+        with pytest.raises(BuildPayloadError):
+            build_run_payload(workflow={"nodes": []}, images=[cast(Any, bad)])
+
+
+def test_build_run_payload_validates_tensors() -> None:
+    expected = {"name": "latent", "dtype": "float16", "shape": [1, 4], "data": "AAA="}
+    tensor = {**expected, "encoding": "raw"}
+    payload = build_run_payload(workflow={"nodes": []}, tensors=[cast(Any, tensor)])
+    assert payload["tensors"] == [expected]
+
+    for bad in (
+        {**tensor, "dtype": "complex64"},
+        {**tensor, "shape": [1, -4]},
+        {**tensor, "shape": "1x4"},
+        {**tensor, "encoding": "lz4"},
+        {**tensor, "data": None},
+        {**tensor, "source_dtype": "bfloat16"},
+    ):
+        with pytest.raises(BuildPayloadError):
+            build_run_payload(workflow={"nodes": []}, tensors=[cast(Any, bad)])
+    with pytest.raises(BuildPayloadError, match="duplicate"):
+        build_run_payload(workflow={"nodes": []}, tensors=[cast(Any, tensor)] * 2)
+
+
 def test_build_run_payload_rejects_bad_params() -> None:
     with pytest.raises(BuildPayloadError):
         build_run_payload(workflow={"nodes": []}, params=cast(Any, "nope"))
@@ -1,21 +1,47 @@
 import json
+from collections.abc import Iterator
 from typing import Any
 
 import pytest
 
-from comfy_gpu_offload.workflow import WorkflowLoadError, fetch_workflow_from_url
+from comfy_gpu_offload.workflow import (
+    WorkflowLoadError,
+    clear_workflow_url_cache,
+    fetch_workflow_from_url,
+)
 
 
 class FakeResp:
-    def __init__(self, status_code: int, content: bytes) -> None:
+    def __init__(
+        self, status_code: int, content: bytes, headers: dict[str, str] | None = None
+    ) -> None:
         self.status_code = status_code
         self.content = content
+        self.headers = headers or {}
+        self.chunks_read = 0
+        self.closed = False
+
+    def iter_content(self, chunk_size: int) -> Iterator[bytes]:
+        for start in range(0, len(self.content), chunk_size):
+            self.chunks_read += 1
+            yield self.content[start : start + chunk_size]
+
+    def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture(autouse=True)
+def empty_url_cache() -> Iterator[None]:
+    clear_workflow_url_cache()
+    yield
+    clear_workflow_url_cache()
 
 
 def test_fetch_workflow_from_url_happy_path(monkeypatch: pytest.MonkeyPatch) -> None:
-    def fake_get(url: str, timeout: float, verify: bool) -> FakeResp:
+    def fake_get(url: str, timeout: float, verify: bool, **kwargs: Any) -> FakeResp:
         assert url == "https://example.com/workflow"
         assert verify is True
+        assert kwargs["stream"] is True
         return FakeResp(200, json.dumps({"nodes": []}).encode("utf-8"))
 
     monkeypatch.setattr("requests.get", fake_get)
@@ -29,19 +55,80 @@ def test_fetch_workflow_from_url_http_requires_disable_verify(monkeypatch: pytes
 
 
 def test_fetch_workflow_from_url_too_large(monkeypatch: pytest.MonkeyPatch) -> None:
-    def fake_get(url: str, timeout: float, verify: bool) -> FakeResp:
-        return FakeResp(200, b"x" * 2_000_000)
+    responses: list[FakeResp] = []
+
+    def fake_get(url: str, timeout: float, verify: bool, **kwargs: Any) -> FakeResp:
+        responses.append(FakeResp(200, b"x" * 2_000_000))
+        return responses[-1]
 
     monkeypatch.setattr("requests.get", fake_get)
     with pytest.raises(WorkflowLoadError):
         fetch_workflow_from_url("https://example.com/workflow", max_bytes=1_000_000)
+    # Reading stops just past the cap rather than buffering the whole body.
+    assert responses[0].chunks_read < 2_000_000 // (64 * 1024)
+    assert responses[0].closed
+
+
+def test_fetch_workflow_rejects_declared_oversize_without_reading(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    resp = FakeResp(200, b"{}", headers={"Content-Length": "5000000"})
+    monkeypatch.setattr("requests.get", lambda *args, **kwargs: resp)
+
+    with pytest.raises(WorkflowLoadError, match="too large"):
+        fetch_workflow_from_url("https://example.com/workflow", max_bytes=1_000_000)
+    assert resp.chunks_read == 0
 
 
 def test_fetch_workflow_from_url_bad_status(monkeypatch: pytest.MonkeyPatch) -> None:
-    def fake_get(url: str, timeout: float, verify: bool) -> FakeResp:
+    def fake_get(url: str, timeout: float, verify: bool, **kwargs: Any) -> FakeResp:
         return FakeResp(500, b"error")
 
     monkeypatch.setattr("requests.get", fake_get)
     with pytest.raises(WorkflowLoadError):
         fetch_workflow_from_url("https://example.com/workflow")
 
+
+def test_fetch_workflow_revalidates_and_reuses_parsed_workflow_on_304(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    sent_headers: list[dict[str, str]] = []
+    responses = [
+        FakeResp(
+            200,
+            b'{"nodes": [1]}',
+            headers={"ETag": '"v1"', "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"},
+        ),
+        FakeResp(304, b""),
+    ]
+
+    def fake_get(url: str, timeout: float, verify: bool, **kwargs: Any) -> FakeResp:
+        sent_headers.append(kwargs["headers"])
+        return responses.pop(0)
+
+    monkeypatch.setattr("requests.get", fake_get)
+
+    first = fetch_workflow_from_url("https://example.com/workflow")
+    second = fetch_workflow_from_url("https://example.com/workflow")
+
+    assert second is first
+    assert sent_headers[0] == {}
+    assert sent_headers[1] == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Wed, 01 Jan 2025 00:00:00 GMT",
+    }
+
+
+def test_fetch_workflow_without_cache_sends_no_validators(monkeypatch: pytest.MonkeyPatch) -> None:
+    sent_headers: list[dict[str, str]] = []
+
+    def fake_get(url: str, timeout: float, verify: bool, **kwargs: Any) -> FakeResp:
+        sent_headers.append(kwargs["headers"])
+        return FakeResp(200, b'{"nodes": []}', headers={"ETag": '"v1"'})
+
+    monkeypatch.setattr("requests.get", fake_get)
+
+    fetch_workflow_from_url("https://example.com/workflow")
+    fetch_workflow_from_url("https://example.com/workflow", use_cache=False)
+
+    assert sent_headers == [{}, {}]
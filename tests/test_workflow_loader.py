@@ -3,7 +3,12 @@ from pathlib import Path
 
 import pytest
 
-from comfy_gpu_offload.workflow import WorkflowLoadError, ensure_payload_size, load_workflow_from_path
+from comfy_gpu_offload.workflow import (
+    WorkflowLoadError,
+    encode_payload,
+    ensure_payload_size,
+    load_workflow_from_path,
+)
 
 
 def test_load_workflow_from_path_success(tmp_path: Path) -> None:
@@ -42,3 +47,14 @@ def test_ensure_payload_size_checks_limit() -> None:
     with pytest.raises(WorkflowLoadError):
         ensure_payload_size(large, max_bytes=50)
 
+
+def test_encode_payload_wraps_input_once_and_reports_payload_size() -> None:
+    payload = {"workflow": {"nodes": []}, "params": {"seed": 1}}
+
+    encoded = encode_payload(payload, max_bytes=None)
+
+    assert json.loads(encoded.body) == {"input": payload}
+    assert encoded.size == len(json.dumps(payload, separators=(",", ":")))
+    assert encoded.size == ensure_payload_size(payload)
+    with pytest.raises(WorkflowLoadError):
+        encode_payload(payload, max_bytes=encoded.size - 1)
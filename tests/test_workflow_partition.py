@@ -0,0 +1,138 @@
+import copy
+from typing import Any
+
+import pytest
+
+from comfy_gpu_offload.workflow import (
+    PartitionError,
+    partition_workflow,
+    tag_nodes,
+    validate_workflow_schema,
+)
+
+
+def _node(node_id: int, node_type: str, inputs: list[str], outputs: list[str]) -> dict[str, Any]:
+    return {
+        "id": node_id,
+        "type": node_type,
+        "inputs": [{"name": t.lower(), "type": t, "link": None} for t in inputs],
+        "outputs": [{"name": t, "type": t, "links": []} for t in outputs],
+    }
+
+
+def _graph(nodes: list[dict[str, Any]], edges: list[tuple[int, int, int, int]]) -> dict[str, Any]:
+    by_id = {node["id"]: node for node in nodes}
+    links = []
+    for link_id, (origin, origin_slot, target, target_slot) in enumerate(edges, start=1):
+        link_type = by_id[origin]["outputs"][origin_slot]["type"]
+        by_id[origin]["outputs"][origin_slot]["links"].append(link_id)
+        by_id[target]["inputs"][target_slot]["link"] = link_id
+        links.append([link_id, origin, origin_slot, target, target_slot, link_type])
+    return {"last_node_id": max(by_id), "last_link_id": len(links), "nodes": nodes, "links": links}
+
+
+def _txt2img(vae_loader: bool = False) -> dict[str, Any]:
+    nodes = [
+        _node(1, "CheckpointLoaderSimple", [], ["MODEL", "CLIP", "VAE"]),
+        _node(2, "CLIPTextEncode", ["CLIP"], ["CONDITIONING"]),
+        _node(3, "CLIPTextEncode", ["CLIP"], ["CONDITIONING"]),
+        _node(4, "EmptyLatentImage", [], ["LATENT"]),
+        _node(5, "KSampler", ["MODEL", "CONDITIONING", "CONDITIONING", "LATENT"], ["LATENT"]),
+        _node(6, "VAEDecode", ["LATENT", "VAE"], ["IMAGE"]),
+        _node(7, "SaveImage", ["IMAGE"], []),
+    ]
+    edges = [(1, 0, 5, 0), (1, 1, 2, 0), (1, 1, 3, 0), (2, 0, 5, 1), (3, 0, 5, 2)]
+    edges += [(4, 0, 5, 3), (5, 0, 6, 0), (6, 0, 7, 0)]
+    if vae_loader:
+        nodes.append(_node(8, "VAELoader", [], ["VAE"]))
+        edges.append((8, 0, 6, 1))
+    else:
+        edges.append((1, 2, 6, 1))
+    return _graph(nodes, edges)
+
+
+def test_tag_nodes_by_type() -> None:
+    tags = tag_nodes(_txt2img())
+
+    assert tags[5] == tags[6] == "gpu"
+    assert tags[7] == "local"
+    assert tags[1] == tags[4] == "free"
+
+
+def test_partition_pulls_tied_loaders_remote_and_cuts_at_image() -> None:
+    workflow = _txt2img()
+    original = copy.deepcopy(workflow)
+
+    result = partition_workflow(workflow)
+
+    assert result.remote_node_ids == (1, 2, 3, 4, 5, 6)
+    assert result.local_node_ids == (7,)
+    (value,) = result.boundary
+    assert (value.origin_id, value.type, value.direction) == (6, "IMAGE", "to_local")
+    assert result.outputs == (value,) and result.inputs == ()
+    assert workflow == original
+
+
+def test_partition_prefers_latent_boundary_when_decode_can_stay_local() -> None:
+    result = partition_workflow(_txt2img(vae_loader=True), gpu_node_types={"KSampler"})
+
+    assert result.local_node_ids == (6, 7, 8)
+    (value,) = result.boundary
+    assert (value.origin_id, value.type, value.link_ids) == (5, "LATENT", (7,))
+    assert result.cut_cost == 1.0
+
+
+def test_partition_outputs_valid_glued_workflows() -> None:
+    result = partition_workflow(_txt2img(vae_loader=True), gpu_node_types={"KSampler"})
+
+    for part in (result.remote, result.local):
+        validate_workflow_schema(part)
+    glue_out = [n for n in result.remote["nodes"] if n["type"] == "RunPodBoundaryOutput"]
+    glue_in = [n for n in result.local["nodes"] if n["type"] == "RunPodBoundaryInput"]
+    assert glue_out[0]["widgets_values"] == glue_in[0]["widgets_values"] == ["boundary_5_0"]
+    assert glue_in[0]["outputs"][0]["links"] == [7]
+    sampler = next(n for n in result.remote["nodes"] if n["id"] == 5)
+    assert sampler["outputs"][0]["links"] == [glue_out[0]["inputs"][0]["link"]]
+    assert result.remote["last_link_id"] == max(link[0] for link in result.remote["links"])
+
+
+def test_partition_keeps_preprocessing_local_and_counts_shared_slots_once() -> None:
+    nodes = [
+        _node(1, "LoadImage", [], ["IMAGE"]),
+        _node(2, "ImageScale", ["IMAGE"], ["IMAGE"]),
+        _node(3, "VAELoader", [], ["VAE"]),
+        _node(4, "VAEEncode", ["IMAGE", "VAE"], ["LATENT"]),
+        _node(5, "ImageInvert", ["IMAGE"], ["IMAGE"]),
+        _node(6, "PreviewImage", ["IMAGE"], []),
+    ]
+    edges = [(1, 0, 2, 0), (2, 0, 4, 0), (3, 0, 4, 1), (2, 0, 5, 0), (5, 0, 6, 0)]
+
+    result = partition_workflow(_graph(nodes, edges))
+
+    assert result.remote_node_ids == (3, 4)
+    (value,) = result.inputs
+    assert (value.origin_id, value.type, value.direction) == (2, "IMAGE", "to_remote")
+    assert result.cut_cost == 48.0
+
+
+def test_partition_pulls_nodes_between_remote_nodes_remote() -> None:
+    nodes = [
+        _node(1, "EmptyLatentImage", [], ["LATENT"]),
+        _node(2, "KSampler", ["LATENT"], ["LATENT"]),
+        _node(3, "LatentUpscale", ["LATENT"], ["LATENT"]),
+        _node(4, "KSampler", ["LATENT"], ["LATENT"]),
+        _node(5, "SaveLatent", ["LATENT"], []),
+    ]
+    edges = [(1, 0, 2, 0), (2, 0, 3, 0), (3, 0, 4, 0), (4, 0, 5, 0)]
+
+    result = partition_workflow(_graph(nodes, edges), edge_costs={"LATENT": 1.0})
+
+    assert result.remote_node_ids == (1, 2, 3, 4)
+    assert [value.origin_id for value in result.boundary] == [4]
+
+
+def test_partition_errors() -> None:
+    with pytest.raises(PartitionError, match="no GPU-heavy"):
+        partition_workflow(_txt2img(), gpu_node_types=())
+    with pytest.raises(PartitionError, match="cannot cross"):
+        partition_workflow(_txt2img(), local_node_types={"CheckpointLoaderSimple"})
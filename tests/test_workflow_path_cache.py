@@ -0,0 +1,75 @@
+import json
+import os
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from comfy_gpu_offload.workflow import (
+    WorkflowLoadError,
+    clear_workflow_path_cache,
+    content_hash,
+    load_workflow_cached,
+    path_cache,
+)
+
+
+@pytest.fixture(autouse=True)
+def empty_cache() -> Iterator[None]:
+    clear_workflow_path_cache()
+    yield
+    clear_workflow_path_cache()
+
+
+@pytest.fixture
+def loads(monkeypatch: pytest.MonkeyPatch) -> list[Path]:
+    calls: list[Path] = []
+    original = path_cache.load_workflow_from_path
+
+    def counting(path: Path, **kwargs: Any) -> dict[str, Any]:
+        calls.append(path)
+        return original(path, **kwargs)
+
+    monkeypatch.setattr(path_cache, "load_workflow_from_path", counting)
+    return calls
+
+
+def test_unchanged_file_is_parsed_once(tmp_path: Path, loads: list[Path]) -> None:
+    path = tmp_path / "workflow.json"
+    path.write_text(json.dumps({"nodes": [], "links": []}), encoding="utf-8")
+
+    first = load_workflow_cached(path)
+    second = load_workflow_cached(path)
+
+    assert second is first
+    assert first.content_hash == content_hash({"nodes": [], "links": []})
+    assert loads == [path]
+
+
+def test_changed_file_is_reloaded(tmp_path: Path, loads: list[Path]) -> None:
+    path = tmp_path / "workflow.json"
+    path.write_text(json.dumps({"nodes": []}), encoding="utf-8")
+    first = load_workflow_cached(path)
+
+    path.write_text(json.dumps({"nodes": [], "extra": 1}), encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    second = load_workflow_cached(path)
+
+    assert second.workflow == {"nodes": [], "extra": 1}
+    assert second.content_hash != first.content_hash
+    assert len(loads) == 2
+    assert len(path_cache._cache) == 1
+
+
+def test_invalid_workflows_are_not_cached(tmp_path: Path, loads: list[Path]) -> None:
+    path = tmp_path / "workflow.json"
+    path.write_text(json.dumps({"nodes": "nope"}), encoding="utf-8")
+
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            load_workflow_cached(path)
+    assert len(loads) == 2
+    with pytest.raises(WorkflowLoadError):
+        load_workflow_cached(tmp_path / "missing.json")
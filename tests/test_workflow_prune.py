@@ -0,0 +1,88 @@
+import copy
+from typing import Any
+
+from comfy_gpu_offload.workflow import json_codec, prune_workflow
+
+
+def _node(node_id: int, node_type: str, **extra: Any) -> dict[str, Any]:
+    return {
+        "id": node_id,
+        "type": node_type,
+        "pos": [10, 20],
+        "size": [300, 100],
+        "flags": {},
+        "color": "#223",
+        "mode": 0,
+        "widgets_values": [],
+        **extra,
+    }
+
+
+def _workflow() -> dict[str, Any]:
+    return {
+        "last_node_id": 5,
+        "nodes": [
+            _node(1, "CheckpointLoaderSimple", outputs=[{"name": "MODEL", "links": [1, 4]}]),
+            _node(2, "KSampler", outputs=[{"name": "LATENT", "links": [2]}]),
+            _node(3, "SaveImage"),
+            _node(4, "Note"),
+            _node(5, "LoraLoader"),
+        ],
+        "links": [
+            [1, 1, 0, 2, 0, "MODEL"],
+            [2, 2, 0, 3, 0, "LATENT"],
+            [4, 1, 0, 5, 0, "MODEL"],
+        ],
+        "groups": [{"title": "Sampling", "bounding": [0, 0, 500, 500]}],
+        "extra": {"ds": {"scale": 1.0, "offset": [0, 0]}, "workspace": "keep"},
+    }
+
+
+def test_prune_keeps_only_nodes_reaching_outputs() -> None:
+    workflow = _workflow()
+    original = copy.deepcopy(workflow)
+
+    result = prune_workflow(workflow)
+
+    assert [node["id"] for node in result.workflow["nodes"]] == [1, 2, 3]
+    assert result.removed_node_ids == (4, 5)
+    assert result.workflow["links"] == [[1, 1, 0, 2, 0, "MODEL"], [2, 2, 0, 3, 0, "LATENT"]]
+    assert result.workflow["nodes"][0]["outputs"] == [{"name": "MODEL", "links": [1]}]
+    assert workflow == original
+
+
+def test_prune_strips_ui_metadata_and_reports_savings() -> None:
+    result = prune_workflow(_workflow())
+
+    for node in result.workflow["nodes"]:
+        assert not {"pos", "size", "flags", "color"} & node.keys()
+        assert node["mode"] == 0
+    assert "groups" not in result.workflow
+    assert result.workflow["extra"] == {"workspace": "keep"}
+    assert result.workflow["last_node_id"] == 5
+    assert result.bytes_after == len(json_codec.dumps(result.workflow))
+    assert result.bytes_saved > 0
+
+
+def test_prune_without_known_outputs_keeps_every_node() -> None:
+    workflow = _workflow()
+    workflow["nodes"][2]["mode"] = 2  # muted outputs are not roots
+
+    result = prune_workflow(workflow)
+
+    assert len(result.workflow["nodes"]) == 5
+    assert result.removed_node_ids == ()
+    assert len(result.workflow["links"]) == 3
+
+
+def test_prune_accepts_custom_output_types_and_dict_links() -> None:
+    workflow = {
+        "nodes": [{"id": "a", "type": "Loader"}, {"id": "b", "type": "RemoteSave"}],
+        "links": [{"id": 7, "origin_id": "a", "origin_slot": 0, "target_id": "b"}],
+    }
+
+    result = prune_workflow(workflow, output_node_types={"RemoteSave"})
+
+    assert [node["id"] for node in result.workflow["nodes"]] == ["a", "b"]
+    assert result.workflow["links"] == workflow["links"]
+    assert prune_workflow({"nodes": []}).workflow == {"nodes": []}
@@ -1,10 +1,39 @@
+from typing import Any
+
 import pytest
 
-from comfy_gpu_offload.workflow import validate_workflow_schema
+from comfy_gpu_offload.workflow import (
+    WorkflowSchemaError,
+    clear_validation_cache,
+    content_hash,
+    schema,
+    validate_workflow_schema,
+)
+
+
+def _graph() -> dict[str, Any]:
+    return {
+        "nodes": [
+            {"id": 1, "type": "Loader", "outputs": [{"name": "MODEL", "type": "MODEL"}]},
+            {
+                "id": 2,
+                "type": "Sampler",
+                "inputs": [{"name": "model", "type": "MODEL", "link": 10}],
+                "outputs": [{"name": "LATENT", "type": "LATENT"}],
+            },
+            {
+                "id": 3,
+                "type": "Decode",
+                "inputs": [{"name": "samples", "type": "LATENT,MASK", "link": 11}],
+            },
+        ],
+        "links": [[10, 1, 0, 2, 0, "MODEL"], [11, 2, 0, 3, 0, "LATENT"]],
+    }
 
 
 def test_validate_workflow_schema_happy_path() -> None:
     validate_workflow_schema({"nodes": []})
+    validate_workflow_schema(_graph())
 
 
 @pytest.mark.parametrize(
@@ -12,9 +41,86 @@ def test_validate_workflow_schema_happy_path() -> None:
     [
         {},
         {"nodes": "not-a-list"},
+        {"nodes": [{"type": "NoId"}]},
+        {"nodes": [{"id": 1}, {"id": 1}]},
+        {"nodes": [], "links": {}},
     ],
 )
 def test_validate_workflow_schema_rejects_invalid(workflow: dict) -> None:
     with pytest.raises(ValueError):
         validate_workflow_schema(workflow)
 
+
+@pytest.mark.parametrize(
+    "workflow",
+    [
+        {"nodes": [{"id": [1]}]},
+        {"nodes": [{"id": {"a": 1}}]},
+        {"nodes": [{"id": 1}, {"id": 2}], "links": [[{}, 1, 0, 2, 0]]},
+        {"nodes": [{"id": 1}, {"id": 2}], "links": [[10, [1], 0, 2, 0]]},
+        {"nodes": [{"id": 1, "inputs": [{"name": "x", "link": [10]}]}]},
+    ],
+)
+def test_rejects_non_scalar_ids(workflow: dict) -> None:
+    with pytest.raises(WorkflowSchemaError, match="non-scalar id"):
+        validate_workflow_schema(workflow)
+
+
+def test_rejects_dangling_links() -> None:
+    workflow = _graph()
+    workflow["links"][0][1] = 99
+    with pytest.raises(WorkflowSchemaError, match="missing node 99"):
+        validate_workflow_schema(workflow)
+
+    workflow = _graph()
+    workflow["nodes"][1]["inputs"][0]["link"] = 42
+    workflow["links"].pop(0)
+    with pytest.raises(WorkflowSchemaError, match="missing link 42"):
+        validate_workflow_schema(workflow)
+
+
+def test_rejects_out_of_range_slots_and_type_mismatches() -> None:
+    workflow = _graph()
+    workflow["links"][0][2] = 3
+    with pytest.raises(WorkflowSchemaError, match="output slot 3"):
+        validate_workflow_schema(workflow)
+
+    workflow = _graph()
+    workflow["nodes"][1]["inputs"][0]["type"] = "CLIP"
+    with pytest.raises(WorkflowSchemaError, match="MODEL output of node 1 to CLIP input"):
+        validate_workflow_schema(workflow)
+
+    workflow["nodes"][1]["inputs"][0]["type"] = "*"
+    validate_workflow_schema(workflow)
+
+
+def test_rejects_cycles() -> None:
+    workflow = _graph()
+    workflow["nodes"][0]["inputs"] = [{"name": "latent", "type": "LATENT", "link": 12}]
+    workflow["nodes"][2]["outputs"] = [{"name": "LATENT", "type": "LATENT"}]
+    workflow["links"].append([12, 3, 0, 1, 0, "LATENT"])
+
+    with pytest.raises(WorkflowSchemaError, match="cycle through nodes 1, 2, 3"):
+        validate_workflow_schema(workflow)
+
+
+def test_verdicts_are_cached_by_hash(monkeypatch: pytest.MonkeyPatch) -> None:
+    clear_validation_cache()
+    calls = []
+    original = schema._validate
+
+    def counting(workflow: Any) -> None:
+        calls.append(workflow)
+        original(workflow)
+
+    monkeypatch.setattr(schema, "_validate", counting)
+    good = _graph()
+    bad = {"nodes": [{"id": 1}], "links": [[1, 1, 0, 2, 0]]}
+
+    for _ in range(2):
+        validate_workflow_schema(good, workflow_hash=content_hash(good))
+        with pytest.raises(WorkflowSchemaError, match="missing node 2"):
+            validate_workflow_schema(bad, workflow_hash=content_hash(bad))
+
+    assert len(calls) == 2
+    clear_validation_cache()
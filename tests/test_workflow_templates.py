@@ -0,0 +1,127 @@
+import copy
+from typing import Any
+
+import pytest
+
+from comfy_gpu_offload.workflow import (
+    BuildPayloadError,
+    InMemoryTemplateStore,
+    TemplateError,
+    TemplateMissingError,
+    TemplateRegistry,
+    WorkflowTemplate,
+    apply_overrides,
+    build_run_payload,
+    compute_overrides,
+    content_hash,
+    json_codec,
+    resolve_template_input,
+)
+
+
+def _workflow(seed: int = 1, prompt: str = "a cat") -> dict[str, Any]:
+    return {
+        "nodes": [
+            {"id": 3, "type": "KSampler", "widgets_values": [seed, "fixed", 20, 7.0]},
+            {"id": 6, "type": "CLIPTextEncode", "widgets_values": [prompt]},
+            {"id": 9, "type": "SaveImage", "widgets_values": ["ComfyUI"]},
+        ],
+        "links": [],
+        "extra": {"note": "x" * 2000},
+    }
+
+
+def test_overrides_round_trip_through_template() -> None:
+    template = _workflow()
+    changed = _workflow(seed=42, prompt="a dog")
+
+    overrides = compute_overrides(template, changed)
+
+    assert overrides == {"3": {"0": 42}, "6": {"0": "a dog"}}
+    assert apply_overrides(template, overrides) == changed
+    assert template == _workflow()
+
+
+def test_overrides_replace_widgets_when_length_changes() -> None:
+    template = _workflow()
+    changed = copy.deepcopy(template)
+    changed["nodes"][2]["widgets_values"] = ["out", True]
+
+    overrides = compute_overrides(template, changed)
+
+    assert overrides == {"9": {"replace": ["out", True]}}
+    assert apply_overrides(template, overrides) == changed
+
+
+def test_structural_changes_do_not_fit_template() -> None:
+    changed = _workflow()
+    changed["nodes"].pop()
+    with pytest.raises(TemplateError):
+        compute_overrides(_workflow(), changed)
+    with pytest.raises(TemplateError, match="unknown nodes"):
+        apply_overrides(_workflow(), {"77": {"0": 1}})
+    with pytest.raises(TemplateError, match="no widget"):
+        apply_overrides(_workflow(), {"6": {"5": "x"}})
+
+
+def test_build_run_payload_sends_delta_against_template() -> None:
+    template = WorkflowTemplate.from_workflow(_workflow())
+
+    registering = build_run_payload(workflow=_workflow(), register_template=True)
+    delta = build_run_payload(workflow=_workflow(seed=7), template=template, params={"a": 1})
+
+    assert registering["workflow_hash"] == template.hash
+    assert registering["workflow"] == _workflow()
+    assert delta == {
+        "workflow_hash": template.hash,
+        "workflow_overrides": {"3": {"0": 7}},
+        "params": {"a": 1},
+    }
+    assert len(json_codec.dumps(delta)) * 10 < len(json_codec.dumps(registering))
+    with pytest.raises(BuildPayloadError):
+        build_run_payload(workflow={"nodes": []}, template=template)
+
+
+def test_worker_resolver_registers_then_rebuilds() -> None:
+    store = InMemoryTemplateStore()
+    template = WorkflowTemplate.from_workflow(_workflow())
+    registering = json_codec.loads(
+        json_codec.dumps(build_run_payload(workflow=_workflow(), register_template=True))
+    )
+
+    assert resolve_template_input(registering, store) == {"workflow": _workflow()}
+    assert len(store) == 1
+
+    delta = build_run_payload(workflow=_workflow(seed=5), template=template, params={"a": 1})
+    assert resolve_template_input(delta, store) == {
+        "workflow": _workflow(seed=5),
+        "params": {"a": 1},
+    }
+    assert resolve_template_input({"workflow": {"nodes": []}}, store) == {"workflow": {"nodes": []}}
+
+
+def test_worker_resolver_rejects_unknown_and_tampered_templates() -> None:
+    store = InMemoryTemplateStore()
+    with pytest.raises(TemplateMissingError, match="workflow_template_missing"):
+        resolve_template_input({"workflow_hash": "ab" * 32}, store)
+    with pytest.raises(TemplateError, match="does not match"):
+        resolve_template_input(
+            {"workflow": _workflow(seed=2), "workflow_hash": content_hash(_workflow())}, store
+        )
+
+
+def test_registry_tracks_templates_per_endpoint_and_structure() -> None:
+    registry = TemplateRegistry(max_entries=2)
+    template = WorkflowTemplate.from_workflow(_workflow())
+    registry.remember("endpoint-a", template)
+
+    assert registry.lookup("endpoint-a", _workflow(seed=99)) is template
+    assert registry.lookup("endpoint-b", _workflow()) is None
+
+    registry.forget("endpoint-a", template.hash)
+    assert registry.lookup("endpoint-a", _workflow()) is None
+
+    for name in ("x", "y", "z"):
+        registry.remember(name, template)
+    assert len(registry) == 2
+    assert registry.lookup("x", _workflow()) is None